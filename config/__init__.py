@@ -5,6 +5,8 @@ from config.patterns import (
     LENGTH_PATTERN,
     SKU_PATTERN,
     CONNECTOR_DETECT,
+    GREETING_DETECT,
+    FAREWELL_DETECT,
     GREETING_PATTERNS,
     FAREWELL_PATTERNS,
     INSTALL_PATTERNS,
@@ -19,6 +21,8 @@ __all__ = [
     "LENGTH_PATTERN",
     "SKU_PATTERN",
     "CONNECTOR_DETECT",
+    "GREETING_DETECT",
+    "FAREWELL_DETECT",
     "GREETING_PATTERNS",
     "FAREWELL_PATTERNS",
     "INSTALL_PATTERNS",
@@ -440,9 +440,18 @@ OUT_OF_SCOPE_PRODUCTS = {
 
 # Pre-compile frequently used patterns
 LENGTH_PATTERN = re.compile(NUM_WITH_UNIT, re.IGNORECASE)
+# Split a LENGTH_PATTERN match into number and unit (case-sensitive unit,
+# first alternative wins: "3 meters" -> 'm')
+LENGTH_NUMBER = re.compile(r'(\d+(?:\.\d+)?)')
+LENGTH_UNIT_DETECT = re.compile(LENGTH_UNIT)
 SKU_PATTERN = re.compile(PRODUCT_NUMBER_PATTERN)
 CONNECTOR_DETECT = re.compile(CONNECTOR_PATTERN, re.IGNORECASE)
 
+# Each pattern list as one alternation: a single search replaces has_pattern's
+# per-pattern loop. Match against lowercased text.
+GREETING_DETECT = re.compile('|'.join(GREETING_PATTERNS))
+FAREWELL_DETECT = re.compile('|'.join(FAREWELL_PATTERNS))
+
 
 # === Helper Functions ===
 
@@ -466,8 +475,8 @@ def extract_lengths(text: str) -> list[tuple[float, str]]:
     for match in matches:
         text_match = match.group(0)
         # Parse number and unit
-        num_match = re.search(r'(\d+(?:\.\d+)?)', text_match)
-        unit_match = re.search(LENGTH_UNIT, text_match)
+        num_match = LENGTH_NUMBER.search(text_match)
+        unit_match = LENGTH_UNIT_DETECT.search(text_match)
         
         if num_match and unit_match:
             value = float(num_match.group(1))
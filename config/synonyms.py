@@ -4,6 +4,9 @@ Synonym and abbreviation mappings for query understanding.
 These mappings help normalize user queries before processing.
 """
 
+import re
+from functools import lru_cache
+
 # Connector abbreviations and variations
 CONNECTOR_SYNONYMS = {
     "dp": "displayport",
@@ -103,6 +106,14 @@ SYNONYMS = {
 }
 
 
+# (abbreviation, word-bounded pattern, replacement), longest abbreviation
+# first so multi-word synonyms win. Built once at import.
+_SYNONYM_PATTERNS = tuple(
+    (abbr, re.compile(r'\b' + re.escape(abbr) + r'\b'), full)
+    for abbr, full in sorted(SYNONYMS.items(), key=lambda x: -len(x[0]))
+)
+
+
 def expand_synonyms(text: str) -> str:
     """
     Expand common abbreviations and synonyms in user queries.
@@ -117,14 +128,22 @@ def expand_synonyms(text: str) -> str:
         >>> expand_synonyms("I need a 6ft DP cable")
         "i need a 6ft displayport cable"
     """
-    text_lower = text.lower()
+    return _expand_lower(text.lower())
+
+
+@lru_cache(maxsize=1024)
+def _expand_lower(text_lower: str) -> str:
+    """Expand synonyms in already-lowercased text (memoized).
+
+    Intent classification and filter extraction both expand the same
+    message, so the second call is a cache hit.
+    """
     expanded = text_lower
     
-    # Sort by length (longest first) to handle multi-word synonyms
-    for abbr, full in sorted(SYNONYMS.items(), key=lambda x: -len(x[0])):
-        # Use word boundaries to avoid partial matches
-        import re
-        pattern = r'\b' + re.escape(abbr) + r'\b'
-        expanded = re.sub(pattern, full, expanded)
+    for abbr, pattern, full in _SYNONYM_PATTERNS:
+        # Substitutions apply in turn, each to the previous one's output;
+        # the substring check skips the regex for absent abbreviations
+        if abbr in expanded:
+            expanded = pattern.sub(full, expanded)
     
     return expanded
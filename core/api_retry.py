@@ -25,14 +25,19 @@ Usage:
     # Manual retry
     retry = RetryHandler(max_attempts=3)
     result = retry.execute(api_call, fallback=default_value)
+
+    # Coroutine functions (non-blocking backoff)
+    retry = AsyncRetryHandler(config=DEFAULT_OPENAI_RETRY)
+    result = await retry.execute(async_api_call, fallback=default_value)
 """
 
 import random
+import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Type, TypeVar, Union
 import traceback
 
 from core.structured_logging import get_logger, log_error
@@ -43,6 +48,17 @@ T = TypeVar('T')
 # Module logger
 _logger = get_logger("core.api_retry")
 
+# Backoff sleeps go through these names so tests can skip them without
+# patching time.sleep or asyncio.sleep for the whole process
+_sleep = time.sleep
+
+
+async def _async_sleep(seconds: float) -> None:
+    """Await asyncio.sleep; asyncio is imported here so sync-only callers don't pay for it."""
+    import asyncio
+
+    await asyncio.sleep(seconds)
+
 
 # =============================================================================
 # Error Classification
@@ -74,6 +90,22 @@ RETRYABLE_ERROR_TYPES = {
 }
 
 
+# Generic classification rules, checked in order after provider-specific rules.
+# Exception type names are matched first, then the error message.
+_TYPE_NAME_RULES = (
+    (re.compile(r'timeout|timedout'), RetryableErrorType.TIMEOUT),
+    (re.compile(r'connection|network|socket'), RetryableErrorType.CONNECTION_ERROR),
+)
+
+_MESSAGE_RULES = (
+    (re.compile(r'rate limit|too many requests'), RetryableErrorType.RATE_LIMIT),
+    (re.compile(r'timeout'), RetryableErrorType.TIMEOUT),
+    (re.compile(r'connection|network'), RetryableErrorType.CONNECTION_ERROR),
+    (re.compile(r'unauthorized|authentication'), RetryableErrorType.AUTH_ERROR),
+    (re.compile(r'quota|billing'), RetryableErrorType.QUOTA_EXCEEDED),
+)
+
+
 def classify_error(error: Exception) -> RetryableErrorType:
     """
     Classify an error to determine if it should be retried.
@@ -84,25 +116,25 @@ def classify_error(error: Exception) -> RetryableErrorType:
     Returns:
         RetryableErrorType indicating the error category
     """
-    error_type = type(error).__name__
+    error_type = type(error).__name__.lower()
     error_msg = str(error).lower()
 
     # Check for OpenAI-specific errors
-    if 'openai' in error_type.lower():
-        if 'ratelimit' in error_type.lower() or '429' in error_msg:
+    if 'openai' in error_type:
+        if 'ratelimit' in error_type or '429' in error_msg:
             return RetryableErrorType.RATE_LIMIT
-        if 'timeout' in error_type.lower():
+        if 'timeout' in error_type:
             return RetryableErrorType.TIMEOUT
-        if 'authentication' in error_type.lower() or '401' in error_msg:
+        if 'authentication' in error_type or '401' in error_msg:
             return RetryableErrorType.AUTH_ERROR
-        if 'apierror' in error_type.lower():
+        if 'apierror' in error_type:
             if '5' in error_msg[:3]:  # 5xx errors
                 return RetryableErrorType.SERVER_ERROR
             if '400' in error_msg:
                 return RetryableErrorType.BAD_REQUEST
 
     # Check for Pinecone-specific errors
-    if 'pinecone' in error_type.lower():
+    if 'pinecone' in error_type:
         if 'timeout' in error_msg:
             return RetryableErrorType.TIMEOUT
         if 'unauthorized' in error_msg or '401' in error_msg:
@@ -111,27 +143,14 @@ def classify_error(error: Exception) -> RetryableErrorType:
             return RetryableErrorType.RATE_LIMIT
 
     # Check for common network errors
-    if any(x in error_type.lower() for x in ['timeout', 'timedout']):
-        return RetryableErrorType.TIMEOUT
-
-    if any(x in error_type.lower() for x in ['connection', 'network', 'socket']):
-        return RetryableErrorType.CONNECTION_ERROR
+    for pattern, category in _TYPE_NAME_RULES:
+        if pattern.search(error_type):
+            return category
 
     # Check error message for common patterns
-    if 'rate limit' in error_msg or 'too many requests' in error_msg:
-        return RetryableErrorType.RATE_LIMIT
-
-    if 'timeout' in error_msg:
-        return RetryableErrorType.TIMEOUT
-
-    if 'connection' in error_msg or 'network' in error_msg:
-        return RetryableErrorType.CONNECTION_ERROR
-
-    if 'unauthorized' in error_msg or 'authentication' in error_msg:
-        return RetryableErrorType.AUTH_ERROR
-
-    if 'quota' in error_msg or 'billing' in error_msg:
-        return RetryableErrorType.QUOTA_EXCEEDED
+    for pattern, category in _MESSAGE_RULES:
+        if pattern.search(error_msg):
+            return category
 
     return RetryableErrorType.UNKNOWN
 
@@ -153,11 +172,21 @@ def is_retryable(error: Exception) -> bool:
 # Retry Configuration
 # =============================================================================
 
-@dataclass
+class JitterStrategy(Enum):
+    """How random jitter is applied to the backoff delay."""
+    BOUNDED = "bounded"            # delay +/- jitter_range fraction of delay
+    FULL = "full"                  # uniform(0, delay)
+    EQUAL = "equal"                # delay/2 + uniform(0, delay/2)
+    DECORRELATED = "decorrelated"  # uniform(base_delay, previous_delay * 3), capped
+
+
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """
     Configuration for retry behavior.
 
+    Frozen so configs can be shared between handlers and used as cache keys.
+
     Attributes:
         max_attempts: Maximum number of retry attempts (including initial)
         base_delay: Base delay in seconds before first retry
@@ -165,8 +194,10 @@ class RetryConfig:
         exponential_base: Base for exponential backoff (default: 2)
         jitter: Whether to add random jitter (default: True)
         jitter_range: Range of jitter as fraction of delay (0.0-1.0)
-        retry_on: List of exception types to retry on (None = use classifier)
+        jitter_strategy: How jitter is applied when enabled (default: BOUNDED)
+        retry_on: Exception types to retry on, stored as a tuple (None = use classifier)
         log_retries: Whether to log retry attempts
+        rng: Random source for jitter (None = module-level random)
     """
     max_attempts: int = 3
     base_delay: float = 1.0
@@ -174,8 +205,15 @@ class RetryConfig:
     exponential_base: float = 2.0
     jitter: bool = True
     jitter_range: float = 0.25
-    retry_on: Optional[List[Type[Exception]]] = None
+    jitter_strategy: JitterStrategy = JitterStrategy.BOUNDED
+    retry_on: Optional[Sequence[Type[Exception]]] = None
     log_retries: bool = True
+    rng: Optional[random.Random] = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        # Store retry_on as a tuple so the config stays hashable
+        if self.retry_on is not None:
+            object.__setattr__(self, 'retry_on', tuple(self.retry_on))
 
 
 # Default configurations for different API types
@@ -194,11 +232,28 @@ DEFAULT_PINECONE_RETRY = RetryConfig(
 )
 
 
+# Number of exponential backoff delays precomputed per handler
+_DELAY_TABLE_SIZE = 32
+
+
+@lru_cache(maxsize=16)
+def _compute_delay_table(
+    base_delay: float,
+    exponential_base: float,
+    max_delay: float,
+) -> tuple:
+    """Capped exponential delays for the first _DELAY_TABLE_SIZE attempts."""
+    return tuple(
+        min(base_delay * (exponential_base ** attempt), max_delay)
+        for attempt in range(_DELAY_TABLE_SIZE)
+    )
+
+
 # =============================================================================
 # Retry Result
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RetryResult:
     """
     Result of a retry operation.
@@ -253,29 +308,62 @@ class RetryHandler:
         self.session_id = session_id or "unknown"
         self.operation_name = operation_name
 
-    def calculate_delay(self, attempt: int) -> float:
+        # Capped exponential delays for the first attempts, so the common
+        # case in calculate_delay is a tuple lookup instead of a pow().
+        # Shared between handlers with the same backoff settings.
+        self._delay_table = _compute_delay_table(
+            self.config.base_delay,
+            self.config.exponential_base,
+            self.config.max_delay,
+        )
+
+    def calculate_delay(self, attempt: int, previous: Optional[float] = None) -> float:
         """
         Calculate delay before next retry using exponential backoff.
 
         Args:
             attempt: Current attempt number (0-indexed)
+            previous: Delay this call returned for the caller's previous
+                attempt (None on the first). Only decorrelated jitter uses
+                it; callers keep it per execution, so executions sharing a
+                handler don't feed into each other's backoff.
 
         Returns:
             Delay in seconds
         """
-        # Exponential backoff: base_delay * (exponential_base ^ attempt)
-        delay = self.config.base_delay * (self.config.exponential_base ** attempt)
+        # Exponential backoff: base_delay * (exponential_base ^ attempt), capped at max delay
+        if attempt < _DELAY_TABLE_SIZE:
+            delay = self._delay_table[attempt]
+        else:
+            delay = min(
+                self.config.base_delay * (self.config.exponential_base ** attempt),
+                self.config.max_delay,
+            )
+
+        if not self.config.jitter:
+            return delay
 
-        # Cap at max delay
-        delay = min(delay, self.config.max_delay)
+        rng = self.config.rng or random
+        strategy = self.config.jitter_strategy
 
-        # Add jitter if enabled
-        if self.config.jitter:
-            jitter_amount = delay * self.config.jitter_range
-            delay += random.uniform(-jitter_amount, jitter_amount)
-            delay = max(0.1, delay)  # Ensure positive delay
+        if strategy is JitterStrategy.FULL:
+            return rng.uniform(0, delay)
 
-        return delay
+        if strategy is JitterStrategy.EQUAL:
+            return delay / 2 + rng.uniform(0, delay / 2)
+
+        if strategy is JitterStrategy.DECORRELATED:
+            if previous is None:
+                previous = self.config.base_delay
+            return min(
+                self.config.max_delay,
+                rng.uniform(self.config.base_delay, previous * 3),
+            )
+
+        # Bounded jitter around the exponential delay
+        jitter_amount = delay * self.config.jitter_range
+        delay += rng.uniform(-jitter_amount, jitter_amount)
+        return max(0.1, delay)  # Ensure positive delay
 
     def should_retry(self, error: Exception, attempt: int) -> bool:
         """
@@ -294,7 +382,7 @@ class RetryHandler:
 
         # Check if specific exception types are configured
         if self.config.retry_on:
-            return any(isinstance(error, exc_type) for exc_type in self.config.retry_on)
+            return isinstance(error, self.config.retry_on)
 
         # Use error classifier
         return is_retryable(error)
@@ -343,6 +431,46 @@ class RetryHandler:
                 }
             )
 
+    def log_success(self, attempt: int, total_delay: float) -> None:
+        """Log a success that needed at least one retry."""
+        if attempt == 0 or not self.config.log_retries:
+            return
+
+        _logger.info(
+            f"{self.operation_name} succeeded after {attempt + 1} attempts",
+            extra={
+                "event": "api_retry_success",
+                "session_id": self.session_id,
+                "operation": self.operation_name,
+                "attempts": attempt + 1,
+                "total_delay": round(total_delay, 2),
+            }
+        )
+
+    def _failure_result(
+        self,
+        errors: List[Exception],
+        total_delay: float,
+        fallback: Optional[T],
+        raise_on_failure: bool,
+    ) -> Union[T, RetryResult]:
+        """Raise, return the fallback, or build a RetryResult once retries are exhausted."""
+        final_error = errors[-1] if errors else None
+
+        if raise_on_failure and final_error:
+            raise final_error
+
+        if fallback is not None:
+            return fallback
+
+        return RetryResult(
+            success=False,
+            attempts=len(errors),
+            total_delay=total_delay,
+            errors=errors,
+            final_error=final_error,
+        )
+
     def execute(
         self,
         func: Callable[[], T],
@@ -362,24 +490,13 @@ class RetryHandler:
         """
         errors = []
         total_delay = 0.0
+        # Previous backoff of this execution only (decorrelated jitter)
+        previous_delay = None
 
         for attempt in range(self.config.max_attempts):
             try:
                 result = func()
-
-                # Log success after retries
-                if attempt > 0 and self.config.log_retries:
-                    _logger.info(
-                        f"{self.operation_name} succeeded after {attempt + 1} attempts",
-                        extra={
-                            "event": "api_retry_success",
-                            "session_id": self.session_id,
-                            "operation": self.operation_name,
-                            "attempts": attempt + 1,
-                            "total_delay": round(total_delay, 2),
-                        }
-                    )
-
+                self.log_success(attempt, total_delay)
                 return result
 
             except Exception as e:
@@ -387,30 +504,78 @@ class RetryHandler:
                 will_retry = self.should_retry(e, attempt)
 
                 if will_retry:
-                    delay = self.calculate_delay(attempt)
+                    delay = self.calculate_delay(attempt, previous=previous_delay)
+                    previous_delay = delay
                     self.log_retry(attempt, e, delay, will_retry=True)
-                    time.sleep(delay)
+                    _sleep(delay)
                     total_delay += delay
                 else:
                     self.log_retry(attempt, e, 0, will_retry=False)
                     break
 
         # All retries exhausted
-        final_error = errors[-1] if errors else None
+        return self._failure_result(errors, total_delay, fallback, raise_on_failure)
 
-        if raise_on_failure and final_error:
-            raise final_error
 
-        if fallback is not None:
-            return fallback
+class AsyncRetryHandler(RetryHandler):
+    """
+    Retry handler for coroutine functions.
 
-        return RetryResult(
-            success=False,
-            attempts=len(errors),
-            total_delay=total_delay,
-            errors=errors,
-            final_error=final_error,
+    Backoff uses asyncio.sleep, so concurrent calls wait out their delays
+    without blocking the event loop.
+
+    Example:
+        handler = AsyncRetryHandler(config=DEFAULT_OPENAI_RETRY)
+        result = await handler.execute(
+            lambda: async_client.chat.completions.create(...),
+            fallback="Sorry, I couldn't process that request."
         )
+    """
+
+    async def execute(
+        self,
+        func: Callable[[], Awaitable[T]],
+        fallback: Optional[T] = None,
+        raise_on_failure: bool = False,
+    ) -> Union[T, RetryResult]:
+        """
+        Await a coroutine function with retry logic.
+
+        Args:
+            func: Zero-argument callable returning an awaitable
+            fallback: Value to return if all retries fail (if not raising)
+            raise_on_failure: Whether to raise the final exception
+
+        Returns:
+            The awaited result, or fallback/RetryResult on failure
+        """
+        errors = []
+        total_delay = 0.0
+        # Previous backoff of this execution only (decorrelated jitter)
+        previous_delay = None
+
+        for attempt in range(self.config.max_attempts):
+            try:
+                result = await func()
+                self.log_success(attempt, total_delay)
+                return result
+
+            except Exception as e:
+                errors.append(e)
+                will_retry = self.should_retry(e, attempt)
+
+                if will_retry:
+                    delay = self.calculate_delay(attempt, previous=previous_delay)
+                    previous_delay = delay
+                    self.log_retry(attempt, e, delay, will_retry=True)
+                    await _async_sleep(delay)
+                    total_delay += delay
+                else:
+                    self.log_retry(attempt, e, 0, will_retry=False)
+                    break
+
+        # All retries exhausted
+        return self._failure_result(errors, total_delay, fallback, raise_on_failure)
 
 
 # =============================================================================
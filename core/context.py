@@ -51,10 +51,13 @@ class Intent:
         return f"Intent({self.type.value}, confidence={self.confidence:.2f})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Product:
     """
     Product information.
+
+    Frozen and slotted: the catalog holds one per SKU and they are never
+    reassigned after loading, so no per-instance __dict__.
     
     Attributes:
         product_number: StarTech product SKU
@@ -590,11 +593,13 @@ class FilterConfig:
     sku_map: dict[str, str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchFilters:
     """
     Extracted search filters from user query.
 
+    Frozen: derive variants with dataclasses.replace() rather than mutating.
+
     Attributes:
         length: Length requirement (e.g., 6.0)
         length_unit: Unit of length (e.g., "ft", "m")
@@ -620,4 +625,9 @@ class SearchFilters:
     color: Optional[str] = None
     keywords: list[str] = field(default_factory=list)
     required_port_types: list[str] = field(default_factory=list)
-    min_monitors: Optional[int] = None
\ No newline at end of file
+    min_monitors: Optional[int] = None
+
+    @property
+    def features_set(self) -> frozenset[str]:
+        """Features as a frozenset for O(1) membership checks."""
+        return frozenset(self.features)
@@ -11,7 +11,8 @@ Pure Python, no external dependencies except config modules.
 """
 
 import re
-from typing import Optional
+from bisect import bisect_left
+from typing import Iterable, Optional
 from core.context import SearchFilters, LengthPreference
 from core.structured_logging import get_logger
 from config.patterns import (
@@ -62,6 +63,117 @@ LONGER_OK_PATTERNS = [
     r'\bor\s+more\b',
 ]
 
+# Patterns are matched against lowercased text, so none need re.IGNORECASE.
+
+# Pre-compile each preference class as one alternation: any match within a
+# class selects it, so one search per class replaces one search per pattern.
+SHORTER_OK_RE = re.compile('|'.join(SHORTER_OK_PATTERNS))
+FLEXIBLE_RE = re.compile('|'.join(FLEXIBLE_PATTERNS))
+LONGER_OK_RE = re.compile('|'.join(LONGER_OK_PATTERNS))
+
+# Explicit "X to Y" connector pair (keeps connectors for non-cable categories)
+EXPLICIT_PAIR_RE = re.compile(
+    r'\b(?:usb-?c?|hdmi|displayport|thunderbolt|vga|dvi)\s+to\s+(?:usb-?c?|hdmi|displayport|vga|dvi)\b'
+)
+
+# Word-based lengths ("six foot"). With several mentions, the word listed
+# first in NUMBER_WORDS wins (not the first in the text), as it did when
+# each word was searched in turn
+WORD_LENGTH_RE = re.compile(
+    rf'\b({"|".join(NUMBER_WORDS)})\s+(foot|feet|ft|meter(?:s)?|metre(?:s)?|m)\b'
+)
+NUMBER_WORD_RANK = {word: rank for rank, word in enumerate(NUMBER_WORDS)}
+
+PORT_COUNT_RE = re.compile(r'\b(\d+)\s*-?\s*ports?\b')
+WITH_PORTS_RE = re.compile(r'\bwith\s+(\d+)\s+ports?\b')
+MONITOR_COUNT_RE = re.compile(r'\b(\d+)\s*(?:monitors?|displays?)\b')
+SUPPORTS_MONITORS_RE = re.compile(r'\bsupports?\s+(\d+)\s*(?:monitors?|displays?)\b')
+
+# Keyword tokenization
+WORD_RE = re.compile(r'[a-z0-9]+')
+ALPHA_WORD_RE = re.compile(r'[a-z]+')
+CLAUSE_END_RE = re.compile(r'[,.]|$')
+# Length measurements like "6ft", "10m", "3meter"
+LENGTH_TOKEN_RE = re.compile(r'^\d+(?:ft|feet|foot|m|meter|meters|in|inch|inches|cm)$')
+
+
+def _followed_by(first: re.Pattern, then: re.Pattern, text: str) -> bool:
+    """
+    Check whether `then` occurs after `first` on the same line of text.
+
+    Equivalent to re.search(first.pattern + '.*' + then.pattern, text) but
+    linear: a backtracking '.*' rescans the rest of the line from every
+    `first` occurrence, which is quadratic on long repetitive input.
+
+    Args:
+        first: Compiled pattern for the leading mention
+        then: Compiled pattern that must follow it
+
+    Returns:
+        True if a `first` match is followed by a `then` match
+    """
+    pos = 0
+    while (match := first.search(text, pos)):
+        line_end = text.find('\n', match.end())
+        if line_end == -1:
+            line_end = len(text)
+        # Only the first `first` on a line matters: it leaves the most room
+        if then.search(text, match.end(), line_end):
+            return True
+        pos = line_end + 1
+    return False
+
+
+# Port type patterns - detect specific port mentions with "port(s)" context.
+# A (first, then) pair matches when `then` follows `first` on the same
+# line - the same as r'first.*then', without its quadratic backtracking.
+PORT_TYPE_PATTERNS = {
+    'USB-C': [
+        r'\busb[\s\-]?c\s*ports?\b',
+        r'\btype[\s\-]?c\s*ports?\b',
+        (r'\busb[\s\-]?c\b', r'\b(?:ports?|connections?)\b'),
+        (r'\b(?:ports?|connections?)\b', r'\busb[\s\-]?c\b'),
+        r'\bwith\s+(?:a\s+)?(?:bunch|lots?|many|multiple|several)\s+(?:of\s+)?usb[\s\-]?c\b',
+    ],
+    'USB-A': [
+        r'\busb[\s\-]?a\s*ports?\b',
+        r'\btype[\s\-]?a\s*ports?\b',
+        (r'\busb[\s\-]?a\b', r'\b(?:ports?|connections?)\b'),
+        (r'\b(?:ports?|connections?)\b', r'\busb[\s\-]?a\b'),
+        r'\bwith\s+(?:a\s+)?(?:bunch|lots?|many|multiple|several)\s+(?:of\s+)?usb[\s\-]?a\b',
+    ],
+    'USB': [
+        # Generic USB (when not USB-C or USB-A specific)
+        r'\busb\s+ports?\b(?!\s*[\-]?[cCaA])',
+        r'\b(?:bunch|lots?|many|multiple|several)\s+(?:of\s+)?usb\s+ports?\b',
+    ],
+    'HDMI': [
+        r'\bhdmi\s*ports?\b',
+        (r'\bhdmi\b', r'\b(?:ports?|outputs?|connections?)\b'),
+    ],
+    'DisplayPort': [
+        r'\b(?:displayport|display\s*port|dp)\s*ports?\b',
+        (r'\b(?:displayport|display\s*port)\b', r'\b(?:ports?|outputs?)\b'),
+    ],
+    'Thunderbolt': [
+        r'\bthunderbolt\s*ports?\b',
+        (r'\bthunderbolt\b', r'\b(?:ports?|connections?)\b'),
+    ],
+    'Ethernet': [
+        r'\bethernet\s*ports?\b',
+        r'\brj[\s\-]?45\s*ports?\b',
+    ],
+}
+
+# Compiled once: each entry is a pattern or a compiled (first, then) pair
+PORT_TYPE_RES = {
+    port_type: [
+        tuple(map(re.compile, pattern)) if isinstance(pattern, tuple) else re.compile(pattern)
+        for pattern in patterns
+    ]
+    for port_type, patterns in PORT_TYPE_PATTERNS.items()
+}
+
 
 class FilterExtractor:
     """
@@ -96,6 +208,10 @@ class FilterExtractor:
         'brown': 'Brown',
     }
 
+    # One pass over the query for any color word. Word boundaries keep
+    # "orange" from matching inside "storage".
+    COLOR_RE = re.compile(rf"\b({'|'.join(COLOR_KEYWORDS)})\b")
+
     def __init__(self):
         """Initialize the filter extractor."""
         # Feature keywords for technical specs
@@ -154,6 +270,13 @@ class FilterExtractor:
             'splitters': ['splitter', 'splitters'],  # Generic splitter fallback
             'networking': ['network', 'ethernet'],
         }
+
+        # Flattened (keyword, normalized category) pairs in priority order
+        self._category_lookup = tuple(
+            (keyword, self._normalize_category(category))
+            for category, keywords in self.category_keywords.items()
+            for keyword in keywords
+        )
     
     # Categories where connector extraction should be suppressed for ambiguous terms
     # "USB hub" → USB describes the hub type, not a cable connector pair
@@ -183,9 +306,14 @@ class FilterExtractor:
             >>> extractor.extract("USB hub")
             SearchFilters(category="Hubs", connector_from=None, connector_to=None)
         """
+        # Blank query: nothing to extract
+        if not query.strip():
+            return SearchFilters()
+
+        # Lowercase once; every sub-extractor works on lowercased text.
+        # expand_synonyms() already returns lowercased text.
         query_lower = query.lower()
-        query_expanded = expand_synonyms(query)
-        query_expanded_lower = query_expanded.lower()
+        query_expanded = expand_synonyms(query_lower)
 
         # Extract category FIRST - affects how we interpret connectors
         category = self._extract_category(query_lower)
@@ -198,7 +326,7 @@ class FilterExtractor:
         port_count = self._extract_port_count(query_lower)
         color = self._extract_color(query_lower)
         # Use expanded query for monitor extraction (handles typos like "moinitors")
-        min_monitors = self._extract_min_monitors(query_expanded_lower)
+        min_monitors = self._extract_min_monitors(query_expanded)
 
         # Special handling for multiport adapters (MUST come before NON_CABLE_CATEGORIES)
         # Multiport adapters have ONE input (e.g., USB-C) but MULTIPLE DIFFERENT output types
@@ -214,10 +342,7 @@ class FilterExtractor:
             # Only suppress if connectors are ambiguous (same from/to without explicit "to" pattern)
             if connector_from == connector_to and connector_from is not None:
                 # Check if there's an explicit "X to Y" pattern in the query
-                has_explicit_pair = bool(re.search(
-                    r'\b(?:usb-?c?|hdmi|displayport|thunderbolt|vga|dvi)\s+to\s+(?:usb-?c?|hdmi|displayport|vga|dvi)\b',
-                    query_lower
-                ))
+                has_explicit_pair = bool(EXPLICIT_PAIR_RE.search(query_lower))
                 if not has_explicit_pair:
                     # Ambiguous connector (e.g., "USB hub" → USB describes hub type)
                     connector_from = None
@@ -244,6 +369,21 @@ class FilterExtractor:
             required_port_types=required_port_types,
             min_monitors=min_monitors,
         )
+
+    def extract_many(self, queries: Iterable[str]) -> list[SearchFilters]:
+        """
+        Extract filters from several queries.
+
+        Useful for replay/evaluation workloads that run a batch of logged
+        queries through the extractor.
+
+        Args:
+            queries: User search queries
+
+        Returns:
+            SearchFilters for each query, in input order
+        """
+        return [self.extract(query) for query in queries]
     
     # === Length Extraction ===
     
@@ -269,14 +409,15 @@ class FilterExtractor:
             return value, self._normalize_unit(unit)
         
         # Try word-based numbers (e.g., "six foot")
-        for word, number in NUMBER_WORDS.items():
-            # Pattern: "six foot", "six feet", "six ft"
-            pattern = rf'\b{word}\s+(?:foot|feet|ft|meter(?:s)?|metre(?:s)?|m)\b'
-            match = re.search(pattern, text)
-            if match:
-                unit_text = match.group(0).split()[-1]
-                unit = self._normalize_unit(unit_text)
-                return float(number), unit
+        # Pattern: "six foot", "six feet", "six ft"
+        match = min(
+            WORD_LENGTH_RE.finditer(text),
+            key=lambda m: NUMBER_WORD_RANK[m.group(1)],
+            default=None,
+        )
+        if match:
+            word, unit_text = match.groups()
+            return float(NUMBER_WORDS[word]), self._normalize_unit(unit_text)
         
         return None, None
     
@@ -333,19 +474,16 @@ class FilterExtractor:
             "at least 6ft cable" → EXACT_OR_LONGER
         """
         # Check for "shorter is fine" patterns first (higher priority)
-        for pattern in SHORTER_OK_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return LengthPreference.EXACT_OR_SHORTER
+        if SHORTER_OK_RE.search(text):
+            return LengthPreference.EXACT_OR_SHORTER
 
         # Check for flexible/approximate patterns
-        for pattern in FLEXIBLE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return LengthPreference.CLOSEST
+        if FLEXIBLE_RE.search(text):
+            return LengthPreference.CLOSEST
 
         # Check for explicit "longer is fine" patterns (confirms default)
-        for pattern in LONGER_OK_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return LengthPreference.EXACT_OR_LONGER
+        if LONGER_OK_RE.search(text):
+            return LengthPreference.EXACT_OR_LONGER
 
         # Default: prefer next size up
         return LengthPreference.EXACT_OR_LONGER
@@ -361,7 +499,7 @@ class FilterExtractor:
         - Single connector patterns: "HDMI cable"
         
         Args:
-            text: Query text (expanded with synonyms)
+            text: Query text (expanded with synonyms, lowercased)
             
         Returns:
             Tuple of (connector_from, connector_to) or (None, None)
@@ -371,26 +509,26 @@ class FilterExtractor:
             "HDMI cable" → ("HDMI", "HDMI")
             "DisplayPort cable" → ("DisplayPort", "DisplayPort")
         """
-        text_lower = text.lower()
-        
-        # Priority 1: Connector-to-connector patterns (more specific)
-        for connector_pair, pattern in CONNECTOR_TO_PATTERNS.items():
-            if re.search(pattern, text_lower):
-                # Parse connector pair (e.g., "usb-c_to_hdmi" → "USB-C", "HDMI")
-                from_conn, to_conn = connector_pair.split('_to_')
-                from_conn = self._normalize_connector(from_conn)
-                to_conn = self._normalize_connector(to_conn)
-                return from_conn, to_conn
+        # Priority 1: Connector-to-connector patterns (more specific).
+        # Every pair pattern contains a literal "to", so skip them without it.
+        if 'to' in text:
+            for connector_pair, pattern in CONNECTOR_TO_PATTERNS.items():
+                if re.search(pattern, text):
+                    # Parse connector pair (e.g., "usb-c_to_hdmi" → "USB-C", "HDMI")
+                    from_conn, to_conn = connector_pair.split('_to_')
+                    from_conn = self._normalize_connector(from_conn)
+                    to_conn = self._normalize_connector(to_conn)
+                    return from_conn, to_conn
         
         # Priority 2: Single connector patterns
         for connector, pattern in SINGLE_CONNECTOR_PATTERNS.items():
-            if re.search(pattern, text_lower):
+            if re.search(pattern, text):
                 normalized = self._normalize_connector(connector)
                 return normalized, normalized
         
         # Priority 3: Bare connector mentions (no "cable" word)
         # e.g., "Show me USB-C" or "I need HDMI"
-        connector_matches = self._find_bare_connectors(text_lower)
+        connector_matches = self._find_bare_connectors(text)
         if connector_matches:
             normalized = self._normalize_connector(connector_matches[0])
             return normalized, normalized
@@ -527,11 +665,10 @@ class FilterExtractor:
             "HDMI adapter" → "Adapters"
             "Docking station" → "Docks"
         """
-        for category, keywords in self.category_keywords.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return self._normalize_category(category)
-        
+        for keyword, category in self._category_lookup:
+            if keyword in text:
+                return category
+
         return None
     
     def _normalize_category(self, category: str) -> str:
@@ -565,12 +702,12 @@ class FilterExtractor:
             "16 port gigabit switch" → 16
         """
         # Pattern 1: "X port" or "X-port" (e.g., "8 port", "8-port", "4 port")
-        match = re.search(r'\b(\d+)\s*-?\s*ports?\b', text)
+        match = PORT_COUNT_RE.search(text)
         if match:
             return int(match.group(1))
 
         # Pattern 2: "with X ports" (e.g., "switch with 8 ports")
-        match = re.search(r'\bwith\s+(\d+)\s+ports?\b', text)
+        match = WITH_PORTS_RE.search(text)
         if match:
             return int(match.group(1))
 
@@ -605,12 +742,12 @@ class FilterExtractor:
                 return count
 
         # Pattern 2: Numeric with "monitor" or "display" (e.g., "3 monitors", "2 displays")
-        match = re.search(r'\b(\d+)\s*(?:monitors?|displays?)\b', text)
+        match = MONITOR_COUNT_RE.search(text)
         if match:
             return int(match.group(1))
 
         # Pattern 3: "support/supports X monitors" (e.g., "supports 3 monitors")
-        match = re.search(r'\bsupports?\s+(\d+)\s*(?:monitors?|displays?)\b', text)
+        match = SUPPORTS_MONITORS_RE.search(text)
         if match:
             return int(match.group(1))
 
@@ -632,18 +769,18 @@ class FilterExtractor:
             "red HDMI cable" → "Red"
             "black USB-C cable" → "Black"
             "grey adapter" → "Gray"
+            "white and black cable" → "White"  (first color mentioned)
         """
-        for color_keyword, normalized_color in self.COLOR_KEYWORDS.items():
-            # Use word boundary to avoid matching "orange" in "storage"
-            if re.search(rf'\b{color_keyword}\b', text):
-                return normalized_color
+        match = self.COLOR_RE.search(text)
+        if match:
+            return self.COLOR_KEYWORDS[match.group(1)]
 
         return None
 
     # === Keyword Extraction ===
 
     # Stop words to exclude from keyword extraction
-    STOP_WORDS = {
+    STOP_WORDS = frozenset({
         # Common words
         'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
         'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
@@ -684,7 +821,7 @@ class FilterExtractor:
         'picture', 'image', 'signal',  # Symptoms, not product keywords
         # Comparative/quality words (too vague for product search)
         'quality', 'good', 'bad', 'great', 'nice', 'decent', 'proper',
-    }
+    })
 
     # Negation patterns - words following these should be excluded from keywords
     # "but not the long ones" → "long" should NOT be a required keyword
@@ -699,7 +836,7 @@ class FilterExtractor:
     ]
 
     # Words already captured by other extraction (don't duplicate)
-    ALREADY_EXTRACTED = {
+    ALREADY_EXTRACTED = frozenset({
         # Category words
         'cable', 'cables', 'adapter', 'adapters', 'dock', 'docking', 'station',
         'hub', 'hubs', 'switch', 'switches', 'mount', 'mounts', 'enclosure',
@@ -723,7 +860,10 @@ class FilterExtractor:
         # NOTE: 'fiber', 'optic', 'drive', 'ssd', etc. are NOT here - they must
         # remain as keywords for text matching. Category detection alone isn't
         # enough because not all products have proper category metadata.
-    }
+    })
+
+    # Every word _extract_keywords drops outright, so each token needs one lookup
+    SKIP_WORDS = STOP_WORDS | ALREADY_EXTRACTED
 
     def _extract_keywords(self, text: str) -> list[str]:
         """
@@ -746,27 +886,25 @@ class FilterExtractor:
             "6ft USB-C cable" → []  (all words already extracted)
             "USB-C cables, but not the long ones" → []  (negation excluded)
         """
-        text_lower = text.lower()
+        # Tokenize: split on non-alphanumeric characters
+        words = WORD_RE.findall(text)
 
-        # Find words that follow negation patterns - these should be excluded
+        # Find words that follow negation patterns - these should be excluded.
+        # A negated clause runs from the negation to the next comma/period
+        # (or end of text). Negations sharing a clause only need the earliest
+        # start, so each clause is scanned once however many negations it has.
+        # A single word has nothing after it to negate.
         negated_words = set()
-        for pattern in self.NEGATION_PATTERNS:
-            # Find the negation pattern and capture words after it
-            for match in re.finditer(pattern, text_lower):
-                # Get the text after the negation pattern
-                after_negation = text_lower[match.end():].strip()
-                # Extract the next few words (up to end of clause or punctuation)
-                clause_end = re.search(r'[,.]|$', after_negation)
-                if clause_end:
-                    negated_clause = after_negation[:clause_end.start()]
-                    # Add all words from the negated clause
-                    negated_words.update(re.findall(r'[a-z]+', negated_clause))
+        if len(words) > 1:
+            clause_ends = [m.start() for m in CLAUSE_END_RE.finditer(text)]
+            clause_starts = {}  # clause end -> earliest negated position
+            for pattern in self.NEGATION_PATTERNS:
+                for match in re.finditer(pattern, text):
+                    end = clause_ends[bisect_left(clause_ends, match.end())]
+                    clause_starts[end] = min(match.end(), clause_starts.get(end, end))
 
-        # Tokenize: split on non-alphanumeric characters
-        words = re.findall(r'[a-z0-9]+', text_lower)
-
-        # Length unit patterns to skip (e.g., "6ft", "10m", "3meter")
-        length_pattern = re.compile(r'^\d+(?:ft|feet|foot|m|meter|meters|in|inch|inches|cm)$')
+            for end, start in clause_starts.items():
+                negated_words.update(ALPHA_WORD_RE.findall(text, start, end))
 
         keywords = []
         for word in words:
@@ -774,12 +912,8 @@ class FilterExtractor:
             if len(word) < 3:
                 continue
 
-            # Skip stop words
-            if word in self.STOP_WORDS:
-                continue
-
-            # Skip words already extracted by other methods
-            if word in self.ALREADY_EXTRACTED:
+            # Skip stop words and words already extracted by other methods
+            if word in self.SKIP_WORDS:
                 continue
 
             # Skip pure numbers (lengths are handled separately)
@@ -787,7 +921,7 @@ class FilterExtractor:
                 continue
 
             # Skip length measurements like "6ft", "10m", "3meter"
-            if length_pattern.match(word):
+            if LENGTH_TOKEN_RE.match(word):
                 continue
 
             # Skip words that follow negation patterns
@@ -843,48 +977,13 @@ class FilterExtractor:
 
         port_types = []
 
-        # Port type patterns - detect specific port mentions with "port(s)" context
-        port_patterns = {
-            'USB-C': [
-                r'\busb[\s\-]?c\s*ports?\b',
-                r'\btype[\s\-]?c\s*ports?\b',
-                r'\busb[\s\-]?c\b.*\b(?:ports?|connections?)\b',
-                r'\b(?:ports?|connections?)\b.*\busb[\s\-]?c\b',
-                r'\bwith\s+(?:a\s+)?(?:bunch|lots?|many|multiple|several)\s+(?:of\s+)?usb[\s\-]?c\b',
-            ],
-            'USB-A': [
-                r'\busb[\s\-]?a\s*ports?\b',
-                r'\btype[\s\-]?a\s*ports?\b',
-                r'\busb[\s\-]?a\b.*\b(?:ports?|connections?)\b',
-                r'\b(?:ports?|connections?)\b.*\busb[\s\-]?a\b',
-                r'\bwith\s+(?:a\s+)?(?:bunch|lots?|many|multiple|several)\s+(?:of\s+)?usb[\s\-]?a\b',
-            ],
-            'USB': [
-                # Generic USB (when not USB-C or USB-A specific)
-                r'\busb\s+ports?\b(?!\s*[\-]?[cCaA])',
-                r'\b(?:bunch|lots?|many|multiple|several)\s+(?:of\s+)?usb\s+ports?\b',
-            ],
-            'HDMI': [
-                r'\bhdmi\s*ports?\b',
-                r'\bhdmi\b.*\b(?:ports?|outputs?|connections?)\b',
-            ],
-            'DisplayPort': [
-                r'\b(?:displayport|display\s*port|dp)\s*ports?\b',
-                r'\b(?:displayport|display\s*port)\b.*\b(?:ports?|outputs?)\b',
-            ],
-            'Thunderbolt': [
-                r'\bthunderbolt\s*ports?\b',
-                r'\bthunderbolt\b.*\b(?:ports?|connections?)\b',
-            ],
-            'Ethernet': [
-                r'\bethernet\s*ports?\b',
-                r'\brj[\s\-]?45\s*ports?\b',
-            ],
-        }
-
-        for port_type, patterns in port_patterns.items():
+        for port_type, patterns in PORT_TYPE_RES.items():
             for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
+                if isinstance(pattern, tuple):
+                    found = _followed_by(*pattern, text)
+                else:
+                    found = pattern.search(text)
+                if found:
                     if port_type not in port_types:
                         port_types.append(port_type)
                     break
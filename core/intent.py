@@ -6,15 +6,136 @@ Uses simple, reliable rules for 5 core intent types.
 """
 
 import re
+from functools import lru_cache
+from typing import Optional, Sequence
 from core.context import Intent, IntentType, ConversationContext
 from core.structured_logging import get_logger
-from config.patterns import GREETING_PATTERNS, FAREWELL_PATTERNS, has_pattern
+from config.patterns import GREETING_DETECT, FAREWELL_DETECT
 from config.synonyms import expand_synonyms
 
 # Module-level logger
 _logger = get_logger("core.intent")
 
 
+# Classification view of the context: one (connectors, category) pair per
+# product in context, or None when there is no product context
+ContextProducts = tuple[tuple[tuple[str, ...], str], ...]
+
+
+# Pre-compiled detection patterns. Pattern lists that are only ever checked
+# with any() are joined into one alternation: one search instead of N.
+
+# Product-related words that rule out a greeting ("Hi, I need cables")
+PRODUCT_WORD_RE = re.compile(
+    r'\b(?:cable|cables|adapter|adapters|dock|docks|hub|hubs|'
+    r'hdmi|displayport|usb|thunderbolt|tb3|tb4|ethernet|monitor|'
+    r'need|looking|find|show|want)\b'
+)
+
+# Explicit search request patterns
+SEARCH_REQUEST_RE = re.compile('|'.join([
+    r'\b(?:show|find|get|list|give)\s+me\b',
+    r'\blooking\s+for\b',
+    r'\bneed\s+(?:a|an|some)\b',
+    r'\bwant\s+(?:a|an|some)\b',
+]))
+
+# Connector-to-connector pattern (e.g., "USB-C to HDMI")
+CONNECTOR_PAIR_RE = re.compile(
+    r'\b(?:usb-?c|type-?c|displayport|hdmi|thunderbolt|vga|dvi)\s+'
+    r'to\s+'
+    r'(?:usb-?c|type-?c|displayport|hdmi|vga|dvi)\b'
+)
+
+# Product type with connector (e.g., "HDMI cable", "USB-C adapter")
+CONNECTOR_PRODUCT_RE = re.compile(
+    r'\b(?:hdmi|displayport|usb-?c?|thunderbolt|vga|dvi|ethernet)\s*'
+    r'(?:to\s+(?:hdmi|displayport|usb-?c?|vga|dvi))?\s*'
+    r'(?:cable|adapter|converter|cord)\b'
+)
+
+LENGTH_RE = re.compile(r'\b\d+(?:\.\d+)?\s*(?:ft|foot|feet|m|meter|meters)\b')
+
+# References to products in context
+FOLLOWUP_RE = re.compile('|'.join([
+    r'\b(?:these|them|those|it|this|that)\b',
+    r'\bwhich\s+(?:one|product|item)\b',
+    r'\bthe\s+(?:shortest|longest|cheapest|best|first|second|third)\b',
+    r'\btell\s+me\s+(?:more|about)\b',
+    r'\b(?:does|do|can|will|is)\s+(?:this|it|the)\b',
+    r'\b(?:difference|compare|between)\b',
+    r'\bproduct\s*[123]\b',
+    r'\b#[123]\b',
+]))
+
+# Explicit new search: search phrase + specific connector + product type
+EXPLICIT_SEARCH_PHRASE_RE = re.compile(r'\b(?:show|find|get|list)\s+(?:me\s+)?')
+EXPLICIT_CONNECTOR_RE = re.compile(
+    r'\b(?:hdmi|displayport|dp|usb[- ]?c|type[- ]?c|usb[- ]?a|vga|dvi|thunderbolt|tb3|tb4|ethernet)\b'
+)
+EXPLICIT_PRODUCT_TYPE_RE = re.compile(r'\b(?:cable|cables|adapter|adapters|dock|docks|hub|hubs)\b')
+
+# Connector types (order matters - check more specific first)
+CONNECTOR_PATTERNS = {
+    'displayport': re.compile(r'\b(?:displayport|dp)\b'),
+    'hdmi': re.compile(r'\bhdmi\b'),
+    'usb-c': re.compile(r'\b(?:usb[- ]?c|type[- ]?c)\b'),
+    'usb-a': re.compile(r'\b(?:usb[- ]?a|type[- ]?a)\b'),
+    'vga': re.compile(r'\bvga\b'),
+    'dvi': re.compile(r'\bdvi\b'),
+    'thunderbolt': re.compile(r'\b(?:thunderbolt|tb3|tb4)\b'),
+    'ethernet': re.compile(r'\b(?:ethernet|cat[56]e?|rj-?45)\b'),
+}
+ALT_MODE_USB_C_RE = re.compile(r'\busb[- ]?c\b|type[- ]?c\b')
+
+# Product category patterns - maps category names to detection patterns
+CATEGORY_PATTERNS = {
+    'cables': re.compile(r'\b(?:cable|cables|cord|cords)\b'),
+    'adapters': re.compile(r'\b(?:adapter|adapters|converter|converters)\b'),
+    'docks': re.compile(r'\b(?:dock|docks|docking)\b'),
+    'hubs': re.compile(r'\b(?:hub|hubs)\b'),
+    'kvm': re.compile(r'\b(?:kvm)\b'),
+    'switches': re.compile(r'\b(?:switch|switches)\b'),
+    'mounts': re.compile(r'\b(?:mount|mounts|stand|stands)\b'),
+    'enclosures': re.compile(r'\b(?:enclosure|enclosures)\b'),
+    'splitters': re.compile(r'\b(?:splitter|splitters)\b'),
+}
+
+REFINEMENT_RE = re.compile('|'.join([
+    # Length refinements with specific values
+    r'\b(?:need|want|prefer)\s+(?:a\s+|one\s+)?\d+\s*(?:ft|foot|feet|m|meter)\b',
+    r'\b\d+\s*(?:ft|foot|feet)\s*(?:version|option|one|instead|please)?\b',
+    # Relative length refinements (shorter/longer)
+    r'\b(?:shorter|longer)\s*(?:one|cable|version|option|please)?\b',
+    r'\b(?:do you have|got|have)\s+(?:a\s+)?(?:shorter|longer)\b',
+    r'\b(?:something|anything)\s+(?:shorter|longer)\b',
+    # "instead" pattern (e.g., "10ft instead", "a shorter one instead")
+    r'\b(?:instead|rather)\b',
+    # Feature refinements
+    r'\b(?:need|want)\s+(?:4k|8k|charging|power)\b',
+    # Color refinements
+    r'\b(?:in\s+)?(?:black|white|gray|grey)\s*(?:please|version)?\b',
+]))
+
+# Product domain keywords
+DOMAIN_TOKENS = frozenset({
+    "cable", "cables", "adapter", "adapters", "dock", "docking",
+    "hub", "hubs", "kvm", "switch", "enclosure",
+    "station", "stations",
+    "hdmi", "displayport", "usb", "thunderbolt", "tb3", "tb4", "vga", "dvi",
+    "mount", "mounts",
+    "splitter", "splitters",
+    "multiport",
+})
+WORD_RE = re.compile(r'[a-z]+')
+
+# SKU detection
+WHOLE_QUERY_SKU_RE = re.compile(r'^[A-Za-z0-9\-]{4,25}$')
+WORD_SKU_RE = re.compile(r'^[A-Z0-9\-]{5,20}$')
+DIGIT_RE = re.compile(r'\d')
+LETTER_RE = re.compile(r'[A-Z]')
+
+
 class IntentClassifier:
     """
     Classifies user intent - Simplified MVP.
@@ -33,9 +154,15 @@ class IntentClassifier:
         # Returns: Intent(type=GREETING, confidence=1.0, ...)
     """
 
+    # Cached (prompt, context signature) -> Intent entries per classifier
+    CACHE_SIZE = 2048
+
     def __init__(self):
         """Initialize the intent classifier."""
-        pass
+        # Classification only depends on the prompt and the context signature,
+        # so repeated messages ("hi", "thanks", "which one?") are a dict hit.
+        # Cached Intents are shared; callers treat them as read-only.
+        self._classify_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._classify)
 
     def classify(self, prompt: str, context: ConversationContext) -> Intent:
         """
@@ -48,19 +175,103 @@ class IntentClassifier:
         Returns:
             Intent object with type, confidence, and reasoning
         """
-        prompt_lower = prompt.lower()
-        prompt_expanded = expand_synonyms(prompt)
-        word_count = len(prompt.split())
+        products = self._context_signature(context)
 
         _logger.debug(
             "Classifying intent",
             extra={
                 "event": "intent_classify_start",
-                "word_count": word_count,
-                "has_product_context": context.has_multi_product_context() or context.has_single_product_context(),
+                "word_count": len(prompt.split()),
+                "has_product_context": products is not None,
+            }
+        )
+
+        return self._classify_cached(prompt, products)
+
+    def classify_batch(
+        self,
+        prompts: Sequence[str],
+        contexts: Sequence[ConversationContext]
+    ) -> list[Intent]:
+        """
+        Classify many messages, e.g. when replaying or evaluating logs.
+
+        Same results as calling classify() per message, but each distinct
+        context object is reduced to its signature once and only one debug
+        event is logged for the whole batch.
+
+        Args:
+            prompts: User messages
+            contexts: Conversation context for each message, in the same order
+
+        Returns:
+            Intent objects, in input order
+
+        Raises:
+            ValueError: If prompts and contexts differ in length
+        """
+        if len(prompts) != len(contexts):
+            raise ValueError(
+                f"Got {len(prompts)} prompts but {len(contexts)} contexts"
+            )
+
+        _logger.debug(
+            "Classifying intent batch",
+            extra={
+                "event": "intent_classify_batch_start",
+                "batch_size": len(prompts),
             }
         )
 
+        # Replays usually share a few contexts across many messages
+        signatures: dict[int, Optional[ContextProducts]] = {}
+        intents = []
+        for prompt, context in zip(prompts, contexts):
+            key = id(context)
+            if key not in signatures:
+                signatures[key] = self._context_signature(context)
+            intents.append(self._classify_cached(prompt, signatures[key]))
+        return intents
+
+    @staticmethod
+    def _context_signature(
+        context: ConversationContext
+    ) -> Optional[ContextProducts]:
+        """
+        Reduce the context to the parts classification reads.
+
+        Returns:
+            None without product context, otherwise one (connectors, category)
+            pair per product in context.current_products
+        """
+        if not (context.has_multi_product_context() or context.has_single_product_context()):
+            return None
+        return tuple(
+            (
+                tuple(product.metadata.get('connectors', [])),
+                product.metadata.get('category', ''),
+            )
+            for product in context.current_products or ()
+        )
+
+    def _classify(
+        self,
+        prompt: str,
+        products: Optional[ContextProducts]
+    ) -> Intent:
+        """
+        Classify a prompt against a context signature (uncached).
+
+        Args:
+            prompt: User's message
+            products: Context signature from _context_signature()
+
+        Returns:
+            Intent object with type, confidence, and reasoning
+        """
+        prompt_lower = prompt.lower()
+        word_count = len(prompt.split())
+
         # Priority 1: Greetings (short messages only)
         if self._is_greeting(prompt_lower, word_count):
             return Intent(
@@ -88,8 +299,11 @@ class IntentClassifier:
                 sku=sku_match
             )
 
+        # Only needed from here on; greetings, farewells and SKUs skip it
+        prompt_expanded = expand_synonyms(prompt)
+
         # Priority 4: Check if user has product context
-        has_context = context.has_multi_product_context() or context.has_single_product_context()
+        has_context = products is not None
 
         # If user has product context, determine if this is a followup or new search
         if has_context:
@@ -103,7 +317,7 @@ class IntentClassifier:
                 )
 
             # Check if query mentions a DIFFERENT connector type than context
-            if self._has_different_connector(prompt_lower, context):
+            if self._has_different_connector(prompt_lower, products):
                 return Intent(
                     type=IntentType.NEW_SEARCH,
                     confidence=0.9,
@@ -111,7 +325,7 @@ class IntentClassifier:
                 )
 
             # Check if query mentions a DIFFERENT product category than context
-            if self._has_different_category(prompt_lower, context):
+            if self._has_different_category(prompt_lower, products):
                 return Intent(
                     type=IntentType.NEW_SEARCH,
                     confidence=0.9,
@@ -174,16 +388,13 @@ class IntentClassifier:
             return False
         # Not a greeting if it contains product-related words
         # "Hi, I need cables" should be NEW_SEARCH, not GREETING
-        product_keywords = r'\b(?:cable|cables|adapter|adapters|dock|docks|hub|hubs|' \
-                          r'hdmi|displayport|usb|thunderbolt|tb3|tb4|ethernet|monitor|' \
-                          r'need|looking|find|show|want)\b'
-        if re.search(product_keywords, text):
+        if PRODUCT_WORD_RE.search(text):
             return False
-        return has_pattern(text, GREETING_PATTERNS)
+        return bool(GREETING_DETECT.search(text))
 
     def _is_farewell(self, text: str) -> bool:
         """Check if text is a farewell."""
-        return has_pattern(text, FAREWELL_PATTERNS)
+        return bool(FAREWELL_DETECT.search(text))
 
     def _is_new_search(self, text: str, text_expanded: str) -> bool:
         """
@@ -196,38 +407,19 @@ class IntentClassifier:
         - "show me", "find me" patterns
         """
         # Explicit search request patterns
-        search_patterns = [
-            r'\b(?:show|find|get|list|give)\s+me\b',
-            r'\blooking\s+for\b',
-            r'\bneed\s+(?:a|an|some)\b',
-            r'\bwant\s+(?:a|an|some)\b',
-        ]
-        if any(re.search(pat, text) for pat in search_patterns):
+        if SEARCH_REQUEST_RE.search(text):
             return True
 
         # Connector-to-connector pattern (e.g., "USB-C to HDMI")
-        if re.search(
-            r'\b(?:usb-?c|type-?c|displayport|hdmi|thunderbolt|vga|dvi)\s+'
-            r'to\s+'
-            r'(?:usb-?c|type-?c|displayport|hdmi|vga|dvi)\b',
-            text
-        ):
+        if CONNECTOR_PAIR_RE.search(text):
             return True
 
         # Product type with connector (e.g., "HDMI cable", "USB-C adapter")
-        if re.search(
-            r'\b(?:hdmi|displayport|usb-?c?|thunderbolt|vga|dvi|ethernet)\s*'
-            r'(?:to\s+(?:hdmi|displayport|usb-?c?|vga|dvi))?\s*'
-            r'(?:cable|adapter|converter|cord)\b',
-            text
-        ):
+        if CONNECTOR_PRODUCT_RE.search(text):
             return True
 
         # Length + product type (e.g., "6ft HDMI cable")
-        has_length = bool(re.search(
-            r'\b\d+(?:\.\d+)?\s*(?:ft|foot|feet|m|meter|meters)\b',
-            text
-        ))
+        has_length = bool(LENGTH_RE.search(text))
         if has_length and self._has_domain_tokens(text_expanded):
             return True
 
@@ -238,17 +430,7 @@ class IntentClassifier:
         Check if this is a follow-up question about products in context.
         """
         # References to products in context
-        followup_patterns = [
-            r'\b(?:these|them|those|it|this|that)\b',
-            r'\bwhich\s+(?:one|product|item)\b',
-            r'\bthe\s+(?:shortest|longest|cheapest|best|first|second|third)\b',
-            r'\btell\s+me\s+(?:more|about)\b',
-            r'\b(?:does|do|can|will|is)\s+(?:this|it|the)\b',
-            r'\b(?:difference|compare|between)\b',
-            r'\bproduct\s*[123]\b',
-            r'\b#[123]\b',
-        ]
-        if any(re.search(pat, text) for pat in followup_patterns):
+        if FOLLOWUP_RE.search(text):
             return True
 
         # Short queries with context are likely followups
@@ -265,51 +447,30 @@ class IntentClassifier:
         But "I need a 10ft cable instead" is a refinement (no connector specified).
         """
         # Must have an explicit search phrase
-        has_search_phrase = bool(re.search(
-            r'\b(?:show|find|get|list)\s+(?:me\s+)?',
-            text
-        ))
+        has_search_phrase = bool(EXPLICIT_SEARCH_PHRASE_RE.search(text))
 
         if not has_search_phrase:
             return False
 
         # Must mention a specific connector type (not just "cable")
-        has_connector = bool(re.search(
-            r'\b(?:hdmi|displayport|dp|usb[- ]?c|type[- ]?c|usb[- ]?a|vga|dvi|thunderbolt|tb3|tb4|ethernet)\b',
-            text
-        ))
+        has_connector = bool(EXPLICIT_CONNECTOR_RE.search(text))
 
         # Must mention a product type
-        has_product_type = bool(re.search(
-            r'\b(?:cable|cables|adapter|adapters|dock|docks|hub|hubs)\b',
-            text
-        ))
+        has_product_type = bool(EXPLICIT_PRODUCT_TYPE_RE.search(text))
 
         return has_connector and has_product_type
 
-    def _has_different_connector(self, text: str, context: ConversationContext) -> bool:
+    def _has_different_connector(self, text: str, products: ContextProducts) -> bool:
         """
         Check if query mentions a different connector type than what's in context.
 
         This prevents "DisplayPort cables under 6ft" from being treated as a
         refinement when context has USB-C to HDMI products.
         """
-        # Connector types to check (order matters - check more specific first)
-        connector_patterns = {
-            'displayport': r'\b(?:displayport|dp)\b',
-            'hdmi': r'\bhdmi\b',
-            'usb-c': r'\b(?:usb[- ]?c|type[- ]?c)\b',
-            'usb-a': r'\b(?:usb[- ]?a|type[- ]?a)\b',
-            'vga': r'\bvga\b',
-            'dvi': r'\bdvi\b',
-            'thunderbolt': r'\b(?:thunderbolt|tb3|tb4)\b',
-            'ethernet': r'\b(?:ethernet|cat[56]e?|rj-?45)\b',
-        }
-
         # Find connectors mentioned in query
         query_connectors = set()
-        for name, pattern in connector_patterns.items():
-            if re.search(pattern, text):
+        for name, pattern in CONNECTOR_PATTERNS.items():
+            if pattern.search(text):
                 query_connectors.add(name)
 
         if not query_connectors:
@@ -318,25 +479,23 @@ class IntentClassifier:
         # Get PRIMARY connectors from context products
         # Only look at the main connector type, not modes like "DisplayPort Alt Mode"
         context_connectors = set()
-        if context.current_products:
-            for product in context.current_products:
-                connectors = product.metadata.get('connectors', [])
-                for conn in connectors:
-                    conn_lower = conn.lower()
-                    # Extract primary connector - skip if it's just a mode descriptor
-                    # "1 x USB-C (24 pin) DisplayPort Alt Mode" → USB-C (not DisplayPort)
-                    # "1 x DisplayPort" → DisplayPort
-                    if 'alt mode' in conn_lower or 'alternate mode' in conn_lower:
-                        # This is a mode descriptor, extract the actual connector
-                        if re.search(r'\busb[- ]?c\b|type[- ]?c\b', conn_lower):
-                            context_connectors.add('usb-c')
-                        continue
-
-                    # Normal connector - check patterns
-                    for name, pattern in connector_patterns.items():
-                        if re.search(pattern, conn_lower):
-                            context_connectors.add(name)
-                            break  # Only add one connector type per connector string
+        for connectors, _ in products:
+            for conn in connectors:
+                conn_lower = conn.lower()
+                # Extract primary connector - skip if it's just a mode descriptor
+                # "1 x USB-C (24 pin) DisplayPort Alt Mode" → USB-C (not DisplayPort)
+                # "1 x DisplayPort" → DisplayPort
+                if 'alt mode' in conn_lower or 'alternate mode' in conn_lower:
+                    # This is a mode descriptor, extract the actual connector
+                    if ALT_MODE_USB_C_RE.search(conn_lower):
+                        context_connectors.add('usb-c')
+                    continue
+
+                # Normal connector - check patterns
+                for name, pattern in CONNECTOR_PATTERNS.items():
+                    if pattern.search(conn_lower):
+                        context_connectors.add(name)
+                        break  # Only add one connector type per connector string
 
         if not context_connectors:
             return False  # No connector info in context
@@ -345,29 +504,16 @@ class IntentClassifier:
         new_connectors = query_connectors - context_connectors
         return len(new_connectors) > 0
 
-    def _has_different_category(self, text: str, context: ConversationContext) -> bool:
+    def _has_different_category(self, text: str, products: ContextProducts) -> bool:
         """
         Check if query mentions a different product category than what's in context.
 
         This prevents "USB hub" from being treated as a followup when context has docks.
         """
-        # Product category patterns - maps category names to detection patterns
-        category_patterns = {
-            'cables': r'\b(?:cable|cables|cord|cords)\b',
-            'adapters': r'\b(?:adapter|adapters|converter|converters)\b',
-            'docks': r'\b(?:dock|docks|docking)\b',
-            'hubs': r'\b(?:hub|hubs)\b',
-            'kvm': r'\b(?:kvm)\b',
-            'switches': r'\b(?:switch|switches)\b',
-            'mounts': r'\b(?:mount|mounts|stand|stands)\b',
-            'enclosures': r'\b(?:enclosure|enclosures)\b',
-            'splitters': r'\b(?:splitter|splitters)\b',
-        }
-
         # Find categories mentioned in query
         query_categories = set()
-        for name, pattern in category_patterns.items():
-            if re.search(pattern, text):
+        for name, pattern in CATEGORY_PATTERNS.items():
+            if pattern.search(text):
                 query_categories.add(name)
 
         if not query_categories:
@@ -375,29 +521,28 @@ class IntentClassifier:
 
         # Get categories from context products
         context_categories = set()
-        if context.current_products:
-            for product in context.current_products:
-                cat = product.metadata.get('category', '').lower()
-                if cat:
-                    # Normalize category names
-                    if 'dock' in cat:
-                        context_categories.add('docks')
-                    elif 'hub' in cat:
-                        context_categories.add('hubs')
-                    elif 'cable' in cat:
-                        context_categories.add('cables')
-                    elif 'adapter' in cat:
-                        context_categories.add('adapters')
-                    elif 'kvm' in cat:
-                        context_categories.add('kvm')
-                    elif 'switch' in cat:
-                        context_categories.add('switches')
-                    elif 'mount' in cat:
-                        context_categories.add('mounts')
-                    elif 'enclosure' in cat:
-                        context_categories.add('enclosures')
-                    elif 'splitter' in cat:
-                        context_categories.add('splitters')
+        for _, category in products:
+            cat = category.lower()
+            if cat:
+                # Normalize category names
+                if 'dock' in cat:
+                    context_categories.add('docks')
+                elif 'hub' in cat:
+                    context_categories.add('hubs')
+                elif 'cable' in cat:
+                    context_categories.add('cables')
+                elif 'adapter' in cat:
+                    context_categories.add('adapters')
+                elif 'kvm' in cat:
+                    context_categories.add('kvm')
+                elif 'switch' in cat:
+                    context_categories.add('switches')
+                elif 'mount' in cat:
+                    context_categories.add('mounts')
+                elif 'enclosure' in cat:
+                    context_categories.add('enclosures')
+                elif 'splitter' in cat:
+                    context_categories.add('splitters')
 
         if not context_categories:
             return False  # No category info in context
@@ -410,37 +555,12 @@ class IntentClassifier:
         """
         Check if this is a constraint refinement (e.g., "I need 6ft", "shorter please").
         """
-        refinement_patterns = [
-            # Length refinements with specific values
-            r'\b(?:need|want|prefer)\s+(?:a\s+|one\s+)?\d+\s*(?:ft|foot|feet|m|meter)\b',
-            r'\b\d+\s*(?:ft|foot|feet)\s*(?:version|option|one|instead|please)?\b',
-            # Relative length refinements (shorter/longer)
-            r'\b(?:shorter|longer)\s*(?:one|cable|version|option|please)?\b',
-            r'\b(?:do you have|got|have)\s+(?:a\s+)?(?:shorter|longer)\b',
-            r'\b(?:something|anything)\s+(?:shorter|longer)\b',
-            # "instead" pattern (e.g., "10ft instead", "a shorter one instead")
-            r'\b(?:instead|rather)\b',
-            # Feature refinements
-            r'\b(?:need|want)\s+(?:4k|8k|charging|power)\b',
-            # Color refinements
-            r'\b(?:in\s+)?(?:black|white|gray|grey)\s*(?:please|version)?\b',
-        ]
-        return any(re.search(pat, text) for pat in refinement_patterns)
+        return bool(REFINEMENT_RE.search(text))
 
     def _has_domain_tokens(self, text: str) -> bool:
         """Check if text contains product domain keywords."""
-        domain_tokens = {
-            "cable", "cables", "adapter", "adapters", "dock", "docking",
-            "hub", "hubs", "kvm", "switch", "enclosure",
-            "station", "stations",
-            "hdmi", "displayport", "usb", "thunderbolt", "tb3", "tb4", "vga", "dvi",
-            "mount", "mounts",
-            "splitter", "splitters",
-            "multiport",
-        }
-
-        words = set(re.findall(r'[a-z]+', text.lower()))
-        return bool(words & domain_tokens)
+        words = set(WORD_RE.findall(text.lower()))
+        return not DOMAIN_TOKENS.isdisjoint(words)
 
     def _extract_sku(self, text: str) -> str | None:
         """
@@ -458,7 +578,7 @@ class IntentClassifier:
         text = text.strip()
 
         # If the entire query is a single SKU-like token (must have at least one digit)
-        if re.match(r'^[A-Za-z0-9\-]{4,25}$', text) and re.search(r'\d', text):
+        if WHOLE_QUERY_SKU_RE.match(text) and DIGIT_RE.search(text):
             return text.upper()
 
         # Look for SKU patterns in longer text
@@ -468,9 +588,9 @@ class IntentClassifier:
         for word in words:
             word_clean = word.strip('.,!?').upper()
             # Must be 5-20 chars, alphanumeric with optional hyphens
-            if re.match(r'^[A-Z0-9\-]{5,20}$', word_clean):
+            if WORD_SKU_RE.match(word_clean):
                 # Must have at least one letter AND one digit
-                if re.search(r'[A-Z]', word_clean) and re.search(r'\d', word_clean):
+                if LETTER_RE.search(word_clean) and DIGIT_RE.search(word_clean):
                     return word_clean
 
         return None
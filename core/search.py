@@ -10,6 +10,8 @@ Includes deduplication, result ranking, and product validation
 (filtering out couplers/gender changers from cable searches).
 """
 
+import re
+from types import MappingProxyType
 from typing import Optional
 from dataclasses import dataclass
 from core.context import SearchFilters, SearchResult, Product, DroppedFilter, LengthPreference
@@ -19,11 +21,20 @@ from core.structured_logging import get_logger
 # Module-level logger
 _logger = get_logger("core.search")
 
+# SKU normalization for deduplication (see SearchStrategy._get_base_sku)
+_VARIANT_SUFFIXES = ('-VAMZ',)
+_COLOR_VARIANT_RE = re.compile(r'M[BW]NL$')
 
-@dataclass
+# Features matched via Product.supports_resolution (see _calculate_relevance)
+_RESOLUTION_FEATURES = frozenset({'4K', '8K', '1080p', '1440p'})
+
+
+@dataclass(frozen=True, slots=True)
 class SearchConfig:
     """
     Configuration for search behavior.
+
+    Frozen: strategies may share one config, so it can't change under them.
     
     Attributes:
         tier1_min_results: Minimum results to accept Tier 1
@@ -81,6 +92,7 @@ class SearchStrategy:
             filters: Extracted search filters
             search_func: Function to call for actual search
                          Signature: search_func(filters_dict) -> list[Product]
+                         filters_dict is a read-only view; writes raise TypeError
             available_lengths: Optional list of available lengths in meters
                               for this product type (used for transparency)
 
@@ -105,9 +117,10 @@ class SearchStrategy:
             }
         )
 
-        # Try Tier 1: Strict search (all filters)
-        tier1_filters = self._build_tier1_filters(filters)
-        tier1_products = search_func(tier1_filters)
+        # Try Tier 1: Strict search (all filters). Same filters as the
+        # original; search_func gets a read-only view, so no copy is needed.
+        tier1_filters = original_filters
+        tier1_products = search_func(MappingProxyType(tier1_filters))
         # Filter out invalid products (couplers in cable searches)
         tier1_products = self._filter_invalid_products(tier1_products, filters)
 
@@ -121,7 +134,7 @@ class SearchStrategy:
         )
 
         if len(tier1_products) >= self.config.tier1_min_results:
-            products = self._deduplicate(tier1_products) if self.config.enable_deduplication else tier1_products
+            products = self._maybe_deduplicate(tier1_products)
             products = self._rank_and_limit(products, filters)
             return SearchResult(
                 products=products,
@@ -137,12 +150,12 @@ class SearchStrategy:
         dropped_filters = []
 
         if tier2_filters != tier1_filters:  # Only try if different from Tier 1
-            tier2_products = search_func(tier2_filters)
+            tier2_products = search_func(MappingProxyType(tier2_filters))
             # Filter out invalid products (couplers in cable searches)
             tier2_products = self._filter_invalid_products(tier2_products, filters)
 
             if len(tier2_products) >= self.config.tier2_min_results:
-                products = self._deduplicate(tier2_products) if self.config.enable_deduplication else tier2_products
+                products = self._maybe_deduplicate(tier2_products)
 
                 # Track what was dropped
                 dropped_filters = self._identify_dropped_filters(
@@ -169,13 +182,13 @@ class SearchStrategy:
         # is actually an adapter but user said "cable"
         tier2_5_filters = self._build_tier2_5_filters(filters)
         if tier2_5_filters != tier2_filters:
-            tier2_5_products = search_func(tier2_5_filters)
+            tier2_5_products = search_func(MappingProxyType(tier2_5_filters))
             # Pass actual category to avoid applying cable validation to adapters
             actual_cat = tier2_5_filters.get('category', '')
             tier2_5_products = self._filter_invalid_products(tier2_5_products, filters, actual_cat)
 
             if len(tier2_5_products) >= self.config.tier2_min_results:
-                products = self._deduplicate(tier2_5_products) if self.config.enable_deduplication else tier2_5_products
+                products = self._maybe_deduplicate(tier2_5_products)
 
                 dropped_filters = self._identify_dropped_filters(
                     filters, tier1_filters, tier2_5_filters, available_lengths
@@ -207,7 +220,7 @@ class SearchStrategy:
         # Skip tier 3 for dock/hub searches - go straight to tier 4 which keeps category
         if not is_dock_or_hub_search:
             tier3_filters = self._build_tier3_filters(filters)
-            tier3_products = search_func(tier3_filters)
+            tier3_products = search_func(MappingProxyType(tier3_filters))
             tier3_products = self._filter_invalid_products(tier3_products, filters)
 
             if len(tier3_products) >= self.config.tier2_min_results:
@@ -215,7 +228,7 @@ class SearchStrategy:
                     filters, tier1_filters, tier3_filters, available_lengths
                 )
 
-                products = self._deduplicate(tier3_products) if self.config.enable_deduplication else tier3_products
+                products = self._maybe_deduplicate(tier3_products)
                 products = self._rank_by_length_preference(products, filters)
                 # Filter out products with wildly different lengths
                 products = self._filter_unreasonable_lengths(products, filters)
@@ -233,14 +246,14 @@ class SearchStrategy:
         # Tier 4 (last resort): Category only, no connectors
         # Only use this if we truly have nothing
         tier4_filters = self._build_tier4_filters(filters)
-        tier4_products = search_func(tier4_filters)
+        tier4_products = search_func(MappingProxyType(tier4_filters))
         tier4_products = self._filter_invalid_products(tier4_products, filters)
 
         dropped_filters = self._identify_dropped_filters(
             filters, tier1_filters, tier4_filters, available_lengths
         )
 
-        products = self._deduplicate(tier4_products) if self.config.enable_deduplication else tier4_products
+        products = self._maybe_deduplicate(tier4_products)
         products = self._rank_by_length_preference(products, filters)
         # Filter out products with wildly different lengths
         products = self._filter_unreasonable_lengths(products, filters)
@@ -452,6 +465,21 @@ class SearchStrategy:
     
     # === Result Processing Methods ===
     
+    def _maybe_deduplicate(self, products: list[Product]) -> list[Product]:
+        """
+        Deduplicate products if enabled in the config.
+
+        Args:
+            products: List of products (may contain duplicates)
+
+        Returns:
+            Unique products, or the input list unchanged when deduplication
+            is disabled
+        """
+        if self.config.enable_deduplication:
+            return self._deduplicate(products)
+        return products
+
     def _deduplicate(self, products: list[Product]) -> list[Product]:
         """
         Remove duplicate products based on product_number.
@@ -503,16 +531,14 @@ class SearchStrategy:
         result = sku
 
         # Strip marketplace variant suffixes
-        variant_suffixes = ['-VAMZ']
-        for suffix in variant_suffixes:
+        for suffix in _VARIANT_SUFFIXES:
             if result.endswith(suffix):
                 result = result[:-len(suffix)]
 
         # Normalize color variants at end of SKU
         # Pattern: ...M[B/W]NL where B=black, W=white
         # Replace with ...MxNL to treat as same product
-        import re
-        result = re.sub(r'M[BW]NL$', 'MxNL', result)
+        result = _COLOR_VARIANT_RE.sub('MxNL', result)
 
         return result
 
@@ -757,24 +783,30 @@ class SearchStrategy:
         if filters.features:
             checks += 1
             product_features = set(product.metadata.get('features', []))
-            requested_features = set(filters.features)
+            requested_features = filters.features_set
 
             # Score based on how many requested features are present
             if requested_features:
                 # Use unified resolution methods for resolution features
                 # This ensures consistent 4K/8K/1440p/1080p detection
-                resolution_features = {'4K', '8K', '1080p', '1440p'}
                 matching_count = 0
+                # Lowercased product features, built on first case-insensitive check
+                product_features_lower = None
 
                 for feature in requested_features:
                     feature_upper = feature.upper() if feature else ''
-                    if feature_upper in resolution_features:
+                    if feature_upper in _RESOLUTION_FEATURES:
                         # Use unified Product method for resolution features
                         if product.supports_resolution(feature.lower()):
                             matching_count += 1
-                    elif feature in product_features or feature.lower() in [f.lower() for f in product_features]:
+                    elif feature in product_features:
                         # Standard feature matching for non-resolution features
                         matching_count += 1
+                    else:
+                        if product_features_lower is None:
+                            product_features_lower = {f.lower() for f in product_features}
+                        if feature.lower() in product_features_lower:
+                            matching_count += 1
 
                 score += matching_count / len(requested_features)
 
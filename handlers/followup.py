@@ -8,6 +8,7 @@ Handles follow-up questions about products in context:
 """
 
 import re
+from dataclasses import replace
 from handlers.base import BaseHandler, HandlerContext, HandlerResult
 from core.product_validator import get_best_cable
 from ui.responses import format_dock_specs
@@ -107,11 +108,13 @@ class FollowupHandler(BaseHandler):
         all_products = []
 
         for (source, target), _ in unique_pairs.items():
-            filters = ctx.filter_extractor.extract("")
-            filters.connector_from = source
-            filters.connector_to = target
-            filters.length = length
-            filters.length_unit = unit
+            filters = replace(
+                ctx.filter_extractor.extract(""),
+                connector_from=source,
+                connector_to=target,
+                length=length,
+                length_unit=unit,
+            )
 
             results = ctx.search_engine.search(filters)
 
@@ -194,9 +197,11 @@ class FollowupHandler(BaseHandler):
         # Search for products with the desired length
         all_matches = []
         for (source, target), _ in unique_pairs.items():
-            filters = ctx.filter_extractor.extract("")
-            filters.connector_from = source
-            filters.connector_to = target
+            filters = replace(
+                ctx.filter_extractor.extract(""),
+                connector_from=source,
+                connector_to=target,
+            )
 
             results = ctx.search_engine.search(filters)
 
@@ -111,10 +111,11 @@ class NewSearchHandler(BaseHandler):
 
         # Fallback 1: Drop length and features, keep connectors
         if filters.connector_from or filters.connector_to:
-            relaxed = FallbackFilters()
-            relaxed.connector_from = filters.connector_from
-            relaxed.connector_to = filters.connector_to
-            relaxed.product_category = filters.product_category
+            relaxed = FallbackFilters(
+                connector_from=filters.connector_from,
+                connector_to=filters.connector_to,
+                product_category=filters.product_category,
+            )
 
             ctx.add_debug(f"🔄 FALLBACK 1: Relaxed search without length/features")
             fallback_results = ctx.search_engine.search(relaxed)
@@ -132,9 +133,10 @@ class NewSearchHandler(BaseHandler):
         if not fallback_results or not fallback_results.products:
             for connector in [filters.connector_from, filters.connector_to]:
                 if connector:
-                    simple = FallbackFilters()
-                    simple.connector_from = connector
-                    simple.product_category = filters.product_category or 'Cables'
+                    simple = FallbackFilters(
+                        connector_from=connector,
+                        product_category=filters.product_category or 'Cables',
+                    )
 
                     ctx.add_debug(f"🔄 FALLBACK 2: Single connector search: {connector}")
                     fallback_results = ctx.search_engine.search(simple)
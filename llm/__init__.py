@@ -1,15 +1,26 @@
 """LLM-based query understanding for ST-Bot - Simplified MVP."""
 
-from llm.prompts import (
-    SystemPrompts,
-    ResponseTemplates,
-    get_system_prompts,
-    get_response_templates
-)
-
-__all__ = [
-    "SystemPrompts",
-    "ResponseTemplates",
-    "get_system_prompts",
-    "get_response_templates",
-]
+from importlib import import_module
+
+# Exports are resolved on first access (PEP 562), so importing another llm
+# submodule does not also load llm.prompts.
+_EXPORTS = {
+    "SystemPrompts": "llm.prompts",
+    "ResponseTemplates": "llm.prompts",
+    "get_system_prompts": "llm.prompts",
+    "get_response_templates": "llm.prompts",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
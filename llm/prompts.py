@@ -7,6 +7,14 @@ Contains all prompts used with Claude API and response formatting templates.
 from typing import Optional, List
 
 
+def _bullets(items: List[str]) -> str:
+    """Render items as a bulleted list, one per line."""
+    # One join instead of growing the response string per item. The
+    # format_* methods stay f-strings: string.Template.substitute() is
+    # regex-driven and over 10x slower for these one-field messages.
+    return "\n".join(f"• {item}" for item in items)
+
+
 class SystemPrompts:
     """
     System prompts and templates for LLM interactions.
@@ -23,6 +31,32 @@ class SystemPrompts:
         response = prompts.format_product_results(products)
     """
     
+    # Templates are built once at class load, not on every format_* call
+
+    # Context notes keyed by context type
+    CONTEXT_NOTES = {
+        "4k": "💡 Tip: For reliable 4K support, look for cables certified for 4K/60Hz or higher.",
+        "long_cable": "💡 Tip: For cables longer than 15ft, consider an active cable or signal booster.",
+        "thunderbolt": "💡 Tip: Thunderbolt cables support high-speed data (40Gbps) and video simultaneously.",
+        "power_delivery": "💡 Tip: Many USB-C cables support Power Delivery for charging.",
+    }
+
+    # User-facing error messages keyed by error type
+    ERROR_MESSAGES = {
+        "search_failed": (
+            "I encountered an issue while searching. "
+            "Please try again or rephrase your query."
+        ),
+        "invalid_input": (
+            "I didn't quite understand that. "
+            "Could you rephrase your question?"
+        ),
+        "system_error": (
+            "Something went wrong on my end. "
+            "Please try again in a moment."
+        ),
+    }
+
     def __init__(self):
         """Initialize system prompts."""
         pass
@@ -107,9 +141,7 @@ Do not recommend specific products - just explain concepts."""
         response = reason
         
         if alternatives:
-            response += "\n\nAlternatives:\n"
-            for alt in alternatives:
-                response += f"• {alt}\n"
+            response += "\n\nAlternatives:\n" + _bullets(alternatives)
         
         return response.strip()
     
@@ -167,9 +199,7 @@ Do not recommend specific products - just explain concepts."""
         )
         
         if suggestions:
-            response += "\n\nSuggestions:\n"
-            for suggestion in suggestions:
-                response += f"• {suggestion}\n"
+            response += "\n\nSuggestions:\n" + _bullets(suggestions)
         
         return response.strip()
     
@@ -234,14 +264,7 @@ Do not recommend specific products - just explain concepts."""
         Example:
             >>> note = prompts.format_context_note("4k", "60Hz recommended")
         """
-        templates = {
-            "4k": "💡 Tip: For reliable 4K support, look for cables certified for 4K/60Hz or higher.",
-            "long_cable": "💡 Tip: For cables longer than 15ft, consider an active cable or signal booster.",
-            "thunderbolt": "💡 Tip: Thunderbolt cables support high-speed data (40Gbps) and video simultaneously.",
-            "power_delivery": "💡 Tip: Many USB-C cables support Power Delivery for charging.",
-        }
-        
-        note = templates.get(context_type, "")
+        note = self.CONTEXT_NOTES.get(context_type, "")
         
         if details:
             note += f" {details}"
@@ -261,22 +284,7 @@ Do not recommend specific products - just explain concepts."""
         Example:
             >>> error = prompts.format_error_response("search_failed")
         """
-        templates = {
-            "search_failed": (
-                "I encountered an issue while searching. "
-                "Please try again or rephrase your query."
-            ),
-            "invalid_input": (
-                "I didn't quite understand that. "
-                "Could you rephrase your question?"
-            ),
-            "system_error": (
-                "Something went wrong on my end. "
-                "Please try again in a moment."
-            ),
-        }
-        
-        return templates.get(error_type, "An error occurred. Please try again.")
+        return self.ERROR_MESSAGES.get(error_type, "An error occurred. Please try again.")
 
 
 class ResponseTemplates:
@@ -288,7 +296,47 @@ class ResponseTemplates:
     - Comparison responses
     - Technical explanations
     """
-    
+
+    # Explanations keyed by connector type
+    CONNECTOR_EXPLANATIONS = {
+        "USB-C": (
+            "USB-C is a versatile connector that supports data transfer, "
+            "video output, and power delivery in a single cable."
+        ),
+        "HDMI": (
+            "HDMI is the standard for video and audio transmission, "
+            "commonly used for TVs, monitors, and projectors."
+        ),
+        "DisplayPort": (
+            "DisplayPort is designed for computer displays and supports "
+            "high resolutions and refresh rates."
+        ),
+        "Thunderbolt": (
+            "Thunderbolt combines data, video, and power in one connection "
+            "with speeds up to 40Gbps."
+        ),
+    }
+
+    # Explanations keyed by feature name
+    FEATURE_EXPLANATIONS = {
+        "4K": (
+            "4K (3840×2160) provides four times the resolution of 1080p "
+            "for sharper images and more detail."
+        ),
+        "8K": (
+            "8K (7680×4320) offers exceptional detail, ideal for "
+            "large displays and professional applications."
+        ),
+        "HDR": (
+            "HDR (High Dynamic Range) expands contrast and color range "
+            "for more realistic images."
+        ),
+        "Power Delivery": (
+            "Power Delivery enables USB-C cables to charge devices "
+            "at higher wattages (up to 100W)."
+        ),
+    }
+
     @staticmethod
     def format_connector_explanation(connector_type: str) -> str:
         """
@@ -303,26 +351,7 @@ class ResponseTemplates:
         Example:
             >>> explanation = ResponseTemplates.format_connector_explanation("USB-C")
         """
-        explanations = {
-            "USB-C": (
-                "USB-C is a versatile connector that supports data transfer, "
-                "video output, and power delivery in a single cable."
-            ),
-            "HDMI": (
-                "HDMI is the standard for video and audio transmission, "
-                "commonly used for TVs, monitors, and projectors."
-            ),
-            "DisplayPort": (
-                "DisplayPort is designed for computer displays and supports "
-                "high resolutions and refresh rates."
-            ),
-            "Thunderbolt": (
-                "Thunderbolt combines data, video, and power in one connection "
-                "with speeds up to 40Gbps."
-            ),
-        }
-        
-        return explanations.get(
+        return ResponseTemplates.CONNECTOR_EXPLANATIONS.get(
             connector_type,
             f"Information about {connector_type} connectors."
         )
@@ -341,26 +370,7 @@ class ResponseTemplates:
         Example:
             >>> explanation = ResponseTemplates.format_feature_explanation("4K")
         """
-        explanations = {
-            "4K": (
-                "4K (3840×2160) provides four times the resolution of 1080p "
-                "for sharper images and more detail."
-            ),
-            "8K": (
-                "8K (7680×4320) offers exceptional detail, ideal for "
-                "large displays and professional applications."
-            ),
-            "HDR": (
-                "HDR (High Dynamic Range) expands contrast and color range "
-                "for more realistic images."
-            ),
-            "Power Delivery": (
-                "Power Delivery enables USB-C cables to charge devices "
-                "at higher wattages (up to 100W)."
-            ),
-        }
-        
-        return explanations.get(
+        return ResponseTemplates.FEATURE_EXPLANATIONS.get(
             feature,
             f"Technical feature: {feature}"
         )
@@ -0,0 +1,50 @@
+"""
+Shared pytest configuration for ST-Bot tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """
+    Pay first-call costs (regex compiles, memo tables) before the first test.
+
+    Keeps that one-off cost out of whichever test happens to run first and
+    out of --durations reports. Only modules the collected tests already
+    imported are warmed, so running one test file imports nothing extra.
+    """
+    import sys
+
+    if "config.patterns" in sys.modules:
+        from config.patterns import extract_lengths, has_pattern, GREETING_PATTERNS
+        extract_lengths("1ft")
+        has_pattern("hi", GREETING_PATTERNS)
+    if "config.synonyms" in sys.modules:
+        from config.synonyms import expand_synonyms
+        expand_synonyms("warmup")
+    if "ui.responses" in sys.modules:
+        from ui.responses import get_response_formatter
+        get_response_formatter()
+    if "llm.response_builder" in sys.modules:
+        from llm.response_builder import ResponseBuilder
+        ResponseBuilder()
+
+
+@pytest.fixture(scope="session")
+def sample_products():
+    """
+    Two USB-C to DisplayPort cables, shared by the whole session (read-only).
+
+    Modules that need products with other metadata define their own
+    fixture. Product is imported here rather than at module top so runs
+    that never use it don't import the core package.
+    """
+    from types import MappingProxyType
+    from core.context import Product
+
+    display_cable_meta = MappingProxyType({"category": "cables", "subcategory": "display cables"})
+    return (
+        Product("CDP2DPMM6B", "USB-C to DisplayPort Cable - 6ft", display_cable_meta, 0.95),
+        Product("CDP2DPMM1MB", "USB-C to DisplayPort Cable - 3ft", display_cable_meta, 0.90),
+    )
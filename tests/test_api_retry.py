@@ -8,13 +8,22 @@ Verifies:
 - Retry handler execution
 - Decorator functionality
 - Graceful degradation
+
+Every test keeps its own counters and RetryConfig is frozen, so the module
+is safe to run in parallel: pytest -n auto tests/test_api_retry.py
 """
 
+import asyncio
+import dataclasses
+import random
+import statistics
 import pytest
-import time
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 from core.api_retry import (
+    AsyncRetryHandler,
+    JitterStrategy,
     RetryableErrorType,
     classify_error,
     is_retryable,
@@ -29,196 +38,293 @@ from core.api_retry import (
 )
 
 
-class TestErrorClassification:
-    """Tests for error classification."""
+# Shared retryable error. Raised via with_traceback(None) so repeated raises
+# don't keep extending the traceback stored on the instance.
+_TIMEOUT = TimeoutError("timeout")
 
-    def test_rate_limit_error(self):
-        """Rate limit errors should be classified correctly."""
-        error = Exception("RateLimitError: 429 Too Many Requests")
-        assert classify_error(error) == RetryableErrorType.RATE_LIMIT
-
-    def test_timeout_error(self):
-        """Timeout errors should be classified correctly."""
-        error = TimeoutError("Connection timed out")
-        assert classify_error(error) == RetryableErrorType.TIMEOUT
-
-    def test_connection_error(self):
-        """Connection errors should be classified correctly."""
-        error = ConnectionError("Failed to connect")
-        assert classify_error(error) == RetryableErrorType.CONNECTION_ERROR
-
-    def test_auth_error(self):
-        """Auth errors should be classified correctly."""
-        error = Exception("401 Unauthorized")
-        assert classify_error(error) == RetryableErrorType.AUTH_ERROR
-
-    def test_unknown_error(self):
-        """Unknown errors should be classified as unknown."""
-        error = Exception("Something weird happened")
-        assert classify_error(error) == RetryableErrorType.UNKNOWN
-
-    def test_is_retryable_rate_limit(self):
-        """Rate limit errors should be retryable."""
-        error = Exception("rate limit exceeded")
-        assert is_retryable(error) is True
-
-    def test_is_retryable_timeout(self):
-        """Timeout errors should be retryable."""
-        error = TimeoutError("timeout")
-        assert is_retryable(error) is True
-
-    def test_is_retryable_auth_error(self):
-        """Auth errors should not be retryable."""
-        error = Exception("authentication failed")
-        assert is_retryable(error) is False
-
-    def test_is_retryable_unknown(self):
-        """Unknown errors should not be retryable by default."""
-        error = Exception("mystery error")
-        assert is_retryable(error) is False
-
-
-class TestRetryConfig:
-    """Tests for retry configuration."""
-
-    def test_default_config(self):
-        """Default config should have reasonable values."""
-        config = RetryConfig()
-        assert config.max_attempts == 3
-        assert config.base_delay == 1.0
-        assert config.max_delay == 60.0
-        assert config.jitter is True
-
-    def test_custom_config(self):
-        """Custom config values should be respected."""
-        config = RetryConfig(
-            max_attempts=5,
-            base_delay=0.5,
-            max_delay=10.0,
-            jitter=False,
-        )
-        assert config.max_attempts == 5
-        assert config.base_delay == 0.5
-        assert config.max_delay == 10.0
-        assert config.jitter is False
 
-    def test_openai_default_config(self):
-        """OpenAI default config should be configured."""
-        assert DEFAULT_OPENAI_RETRY.max_attempts == 3
-        assert DEFAULT_OPENAI_RETRY.base_delay == 1.0
+def raise_timeout():
+    """Callable that always fails with a retryable error."""
+    raise _TIMEOUT.with_traceback(None)
+
+
+@pytest.fixture(autouse=True)
+def _fast_retries(request, monkeypatch):
+    """
+    Skip real backoff sleeps (sync and asyncio) in core.api_retry.
+
+    Only the module's own sleep hooks are replaced; time.sleep and
+    asyncio.sleep stay untouched. Tests that need actual wall-clock delays
+    can opt out with @pytest.mark.real_sleep.
+    """
+    if request.node.get_closest_marker("real_sleep") is None:
+        async def _no_sleep(seconds):
+            return None
+
+        monkeypatch.setattr("core.api_retry._sleep", lambda seconds: None)
+        monkeypatch.setattr("core.api_retry._async_sleep", _no_sleep)
+
 
-    def test_pinecone_default_config(self):
-        """Pinecone default config should be configured."""
-        assert DEFAULT_PINECONE_RETRY.max_attempts == 3
-        assert DEFAULT_PINECONE_RETRY.base_delay == 0.5
+@pytest.fixture(scope="module")
+def default_handler():
+    """Shared handler with the default configuration."""
+    return RetryHandler()
 
 
-class TestRetryHandler:
-    """Tests for RetryHandler."""
+@pytest.fixture
+def make_handler():
+    """Factory for handlers with a custom configuration."""
+    return lambda **kwargs: RetryHandler(config=RetryConfig(**kwargs))
 
-    def test_calculate_delay_exponential(self):
+
+@pytest.fixture
+def seeded_rng():
+    """Deterministic random source for jitter tests."""
+    return random.Random(1234)
+
+
+class TestClassification:
+    """Tests for error classification."""
+
+    @pytest.mark.parametrize("error,expected", [
+        (Exception("RateLimitError: 429 Too Many Requests"), RetryableErrorType.RATE_LIMIT),
+        (TimeoutError("Connection timed out"), RetryableErrorType.TIMEOUT),
+        (ConnectionError("Failed to connect"), RetryableErrorType.CONNECTION_ERROR),
+        (Exception("401 Unauthorized"), RetryableErrorType.AUTH_ERROR),
+        (Exception("Something weird happened"), RetryableErrorType.UNKNOWN),
+    ], ids=["rate_limit", "timeout", "connection", "auth", "unknown"])
+    def test_classify_error(self, error, expected):
+        """Errors should be classified into the correct category."""
+        assert classify_error(error) == expected
+
+    @pytest.mark.parametrize("error,expected", [
+        (Exception("Too Many Requests"), RetryableErrorType.RATE_LIMIT),
+        (Exception("Network unreachable"), RetryableErrorType.CONNECTION_ERROR),
+        (Exception("Billing hard limit reached"), RetryableErrorType.QUOTA_EXCEEDED),
+        (Exception("Quota exceeded"), RetryableErrorType.QUOTA_EXCEEDED),
+        (type("SocketError", (Exception,), {})("boom"), RetryableErrorType.CONNECTION_ERROR),
+        (type("ReadTimedOut", (Exception,), {})("boom"), RetryableErrorType.TIMEOUT),
+    ], ids=["too_many_requests", "network", "billing", "quota", "socket_type", "timedout_type"])
+    def test_classify_error_generic_rules(self, error, expected):
+        """Generic type-name and message rules should match case-insensitively."""
+        assert classify_error(error) == expected
+
+    @pytest.mark.parametrize("error,expected", [
+        (Exception("rate limit exceeded"), True),
+        (_TIMEOUT, True),
+        (Exception("authentication failed"), False),
+        (Exception("mystery error"), False),
+    ], ids=["rate_limit", "timeout", "auth", "unknown"])
+    def test_is_retryable(self, error, expected):
+        """Only transient errors should be retryable."""
+        assert is_retryable(error) is expected
+
+
+class TestHandler:
+    """Tests for RetryConfig, RetryHandler and RetryResult."""
+
+    @pytest.mark.parametrize("config,expected", [
+        (RetryConfig(), dict(max_attempts=3, base_delay=1.0, max_delay=60.0, jitter=True)),
+        (
+            RetryConfig(max_attempts=5, base_delay=0.5, max_delay=10.0, jitter=False),
+            dict(max_attempts=5, base_delay=0.5, max_delay=10.0, jitter=False),
+        ),
+        (DEFAULT_OPENAI_RETRY, dict(max_attempts=3, base_delay=1.0)),
+        (DEFAULT_PINECONE_RETRY, dict(max_attempts=3, base_delay=0.5)),
+    ], ids=["default", "custom", "openai", "pinecone"])
+    def test_config_values(self, config, expected):
+        """Config values should match the defaults or the given overrides."""
+        for name, value in expected.items():
+            assert getattr(config, name) == value
+
+    def test_config_frozen_and_hashable(self):
+        """Configs should be immutable and usable as cache keys."""
+        assert hash(RetryConfig()) == hash(RetryConfig())
+        assert hash(RetryConfig(retry_on=[ValueError])) == hash(RetryConfig(retry_on=(ValueError,)))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            DEFAULT_OPENAI_RETRY.max_attempts = 10
+
+    def test_calculate_delay_exponential(self, make_handler):
         """Delay should increase exponentially."""
-        config = RetryConfig(base_delay=1.0, exponential_base=2.0, jitter=False)
-        handler = RetryHandler(config=config)
+        handler = make_handler(base_delay=1.0, exponential_base=2.0, jitter=False)
 
         assert handler.calculate_delay(0) == 1.0   # 1 * 2^0 = 1
         assert handler.calculate_delay(1) == 2.0   # 1 * 2^1 = 2
         assert handler.calculate_delay(2) == 4.0   # 1 * 2^2 = 4
 
-    def test_calculate_delay_capped(self):
+    def test_calculate_delay_capped(self, make_handler):
         """Delay should be capped at max_delay."""
-        config = RetryConfig(base_delay=1.0, max_delay=5.0, exponential_base=2.0, jitter=False)
-        handler = RetryHandler(config=config)
+        handler = make_handler(base_delay=1.0, max_delay=5.0, exponential_base=2.0, jitter=False)
 
         # 1 * 2^10 = 1024, but should be capped at 5
         assert handler.calculate_delay(10) == 5.0
 
-    def test_calculate_delay_with_jitter(self):
-        """Delay with jitter should vary."""
-        config = RetryConfig(base_delay=1.0, jitter=True, jitter_range=0.5)
-        handler = RetryHandler(config=config)
+    def test_calculate_delay_capped_all_attempts(self, make_handler):
+        """Delay should be positive, non-decreasing and capped for every attempt."""
+        handler = make_handler(base_delay=1.0, max_delay=5.0, exponential_base=2.0, jitter=False)
+
+        delays = [handler.calculate_delay(attempt) for attempt in range(101)]
+
+        assert all(0 < delay <= 5.0 for delay in delays)
+        assert delays == sorted(delays)
+        # Cap is first reached at 1 * 2^3 = 8 > 5
+        assert delays.index(5.0) == 3
+
+    def test_calculate_delay_beyond_table(self, make_handler):
+        """Attempts past the precomputed table should still back off and cap."""
+        handler = make_handler(base_delay=1e-12, max_delay=5.0, exponential_base=2.0, jitter=False)
 
-        # Run multiple times - should get different values
-        delays = [handler.calculate_delay(0) for _ in range(10)]
+        assert handler.calculate_delay(40) == pytest.approx(1e-12 * 2 ** 40)
+        assert handler.calculate_delay(100) == 5.0
 
-        # Not all delays should be the same
-        assert len(set(delays)) > 1
+    def test_calculate_delay_with_jitter(self, make_handler, monkeypatch):
+        """Jitter should spread the delay across +/- jitter_range of the base."""
+        handler = make_handler(base_delay=1.0, jitter=True, jitter_range=0.5)
 
-        # All delays should be within reasonable range (0.5 to 1.5 for base 1.0)
+        # Drive random.uniform from the low end, midpoint, and high end of its range
+        draws = iter([0.0, 0.5, 1.0])
+        monkeypatch.setattr(
+            "core.api_retry.random.uniform",
+            lambda a, b: a + next(draws) * (b - a),
+        )
+
+        delays = [handler.calculate_delay(0) for _ in range(3)]
+
+        # 1.0 +/- (1.0 * 0.5)
+        assert delays == [0.5, 1.0, 1.5]
+
+    def test_calculate_delay_with_injected_rng(self, make_handler, seeded_rng):
+        """An injected RNG should make the jittered sequence reproducible."""
+        handler = make_handler(base_delay=1.0, jitter=True, jitter_range=0.25, rng=seeded_rng)
+
+        delays = [handler.calculate_delay(attempt) for attempt in range(3)]
+
+        # random.Random(1234) drawing uniform(-d/4, d/4) for d = 1, 2, 4
+        assert delays == pytest.approx([1.2332267678, 1.9407325992, 3.0149829401])
+
+    @pytest.mark.parametrize("strategy,low,high", [
+        (JitterStrategy.FULL, 0.0, 4.0),
+        (JitterStrategy.EQUAL, 2.0, 4.0),
+    ], ids=["full", "equal"])
+    def test_calculate_delay_jitter_strategy_bounds(self, make_handler, seeded_rng, strategy, low, high):
+        """Full and equal jitter should stay within their windows of the base delay."""
+        handler = make_handler(base_delay=1.0, jitter_strategy=strategy, rng=seeded_rng)
+
+        for _ in range(20):
+            assert low <= handler.calculate_delay(2) <= high
+
+    def test_calculate_delay_decorrelated(self, make_handler, seeded_rng):
+        """Decorrelated jitter should draw from [base, previous * 3] and respect the cap."""
+        handler = make_handler(
+            base_delay=1.0, max_delay=10.0,
+            jitter_strategy=JitterStrategy.DECORRELATED, rng=seeded_rng,
+        )
+
+        previous = None
+        for attempt in range(10):
+            delay = handler.calculate_delay(attempt, previous=previous)
+            assert 1.0 <= delay <= min(10.0, (previous or 1.0) * 3)
+            previous = delay
+
+    def test_decorrelated_jitter_spreads_more_than_equal(self, seeded_rng):
+        """Across many clients, decorrelated jitter should spread total backoff wider."""
+        def spread(strategy):
+            totals = []
+            for _ in range(50):
+                handler = RetryHandler(config=RetryConfig(
+                    base_delay=1.0, jitter_strategy=strategy, rng=seeded_rng,
+                ))
+                total, previous = 0.0, None
+                for attempt in range(3):
+                    previous = handler.calculate_delay(attempt, previous=previous)
+                    total += previous
+                totals.append(total)
+            return statistics.pstdev(totals) / statistics.mean(totals)
+
+        assert spread(JitterStrategy.DECORRELATED) > spread(JitterStrategy.EQUAL)
+
+    def test_full_jitter_spreads_thundering_herd(self, seeded_rng):
+        """1000 clients retrying at once should land roughly uniformly across the window."""
+        handler = RetryHandler(config=RetryConfig(
+            base_delay=1.0, jitter_strategy=JitterStrategy.FULL, rng=seeded_rng,
+        ))
+        window = 8.0  # 1 * 2^3
+
+        delays = [handler.calculate_delay(3) for _ in range(1000)]
+
+        bins = [0] * 10
         for delay in delays:
-            assert 0.1 <= delay <= 2.0
+            bins[min(int(delay / window * 10), 9)] += 1
 
-    def test_should_retry_within_attempts(self):
-        """Should retry if within attempt limit and error is retryable."""
-        handler = RetryHandler(config=RetryConfig(max_attempts=3))
+        assert statistics.pstdev(bins) / statistics.mean(bins) < 0.3
 
-        error = TimeoutError("timeout")
-        assert handler.should_retry(error, attempt=0) is True
-        assert handler.should_retry(error, attempt=1) is True
-        assert handler.should_retry(error, attempt=2) is False  # At limit
+    def test_should_retry_within_attempts(self, default_handler):
+        """Should retry if within attempt limit and error is retryable."""
+        error = _TIMEOUT
+        assert default_handler.should_retry(error, attempt=0) is True
+        assert default_handler.should_retry(error, attempt=1) is True
+        assert default_handler.should_retry(error, attempt=2) is False  # At limit
 
-    def test_should_not_retry_non_retryable(self):
+    def test_should_not_retry_non_retryable(self, default_handler):
         """Should not retry non-retryable errors."""
-        handler = RetryHandler(config=RetryConfig(max_attempts=3))
-
         error = Exception("authentication failed")
-        assert handler.should_retry(error, attempt=0) is False
+        assert default_handler.should_retry(error, attempt=0) is False
 
-    def test_should_retry_specific_exceptions(self):
+    def test_should_retry_specific_exceptions(self, make_handler):
         """Should retry only specified exception types."""
-        config = RetryConfig(max_attempts=3, retry_on=[ValueError])
-        handler = RetryHandler(config=config)
+        handler = make_handler(max_attempts=3, retry_on=[ValueError])
 
         assert handler.should_retry(ValueError("test"), attempt=0) is True
         assert handler.should_retry(TypeError("test"), attempt=0) is False
 
-    def test_execute_success_first_try(self):
+    def test_execute_success_first_try(self, default_handler):
         """Successful execution on first try."""
-        handler = RetryHandler()
         mock_func = Mock(return_value="success")
 
-        result = handler.execute(mock_func)
+        result = default_handler.execute(mock_func)
 
         assert result == "success"
         assert mock_func.call_count == 1
 
-    def test_execute_success_after_retry(self):
+    def test_execute_success_after_retry(self, make_handler):
         """Successful execution after retries."""
-        config = RetryConfig(base_delay=0.01, jitter=False)  # Fast retries for test
-        handler = RetryHandler(config=config)
+        handler = make_handler(jitter=False)
+
+        calls = SimpleNamespace(count=0)
 
         # Fail twice, then succeed
-        mock_func = Mock(side_effect=[
-            TimeoutError("timeout"),
-            TimeoutError("timeout"),
-            "success"
-        ])
+        def flaky():
+            calls.count += 1
+            if calls.count < 3:
+                raise _TIMEOUT.with_traceback(None)
+            return "success"
 
-        result = handler.execute(mock_func)
+        result = handler.execute(flaky)
 
         assert result == "success"
-        assert mock_func.call_count == 3
+        assert calls.count == 3
 
-    def test_execute_failure_with_fallback(self):
+    def test_execute_failure_with_fallback(self, make_handler):
         """Return fallback on failure."""
-        config = RetryConfig(max_attempts=2, base_delay=0.01, jitter=False)
-        handler = RetryHandler(config=config)
+        handler = make_handler(max_attempts=2, jitter=False)
 
-        mock_func = Mock(side_effect=TimeoutError("timeout"))
+        calls = SimpleNamespace(count=0)
 
-        result = handler.execute(mock_func, fallback="fallback_value")
+        def always_fails():
+            calls.count += 1
+            raise _TIMEOUT.with_traceback(None)
+
+        result = handler.execute(always_fails, fallback="fallback_value")
 
         assert result == "fallback_value"
-        assert mock_func.call_count == 2
+        assert calls.count == 2
 
-    def test_execute_failure_returns_result(self):
+    def test_execute_failure_returns_result(self, make_handler):
         """Return RetryResult on failure when no fallback."""
-        config = RetryConfig(max_attempts=2, base_delay=0.01, jitter=False)
-        handler = RetryHandler(config=config)
-
-        mock_func = Mock(side_effect=TimeoutError("timeout"))
+        handler = make_handler(max_attempts=2, jitter=False)
 
-        result = handler.execute(mock_func)
+        result = handler.execute(raise_timeout)
 
         assert isinstance(result, RetryResult)
         assert result.success is False
@@ -226,32 +332,51 @@ class TestRetryHandler:
         assert len(result.errors) == 2
         assert result.final_error is not None
 
-    def test_execute_raise_on_failure(self):
+    def test_execute_raise_on_failure(self, make_handler):
         """Raise exception on failure when requested."""
-        config = RetryConfig(max_attempts=2, base_delay=0.01, jitter=False)
-        handler = RetryHandler(config=config)
-
-        mock_func = Mock(side_effect=TimeoutError("timeout"))
+        handler = make_handler(max_attempts=2, jitter=False)
 
         with pytest.raises(TimeoutError):
-            handler.execute(mock_func, raise_on_failure=True)
+            handler.execute(raise_timeout, raise_on_failure=True)
 
-    def test_execute_stops_on_non_retryable(self):
+    def test_execute_stops_on_non_retryable(self, make_handler):
         """Stop retrying on non-retryable errors."""
-        config = RetryConfig(max_attempts=3, base_delay=0.01, jitter=False)
-        handler = RetryHandler(config=config)
+        handler = make_handler(max_attempts=3, jitter=False)
 
         # Auth error is not retryable
-        mock_func = Mock(side_effect=Exception("401 Unauthorized"))
+        def unauthorized():
+            raise Exception("401 Unauthorized")
 
-        result = handler.execute(mock_func)
+        result = handler.execute(unauthorized)
 
         assert isinstance(result, RetryResult)
         assert result.attempts == 1  # Should stop after first attempt
 
-
-class TestWithRetryDecorator:
-    """Tests for @with_retry decorator."""
+    @pytest.mark.parametrize("kwargs,expected", [
+        (
+            dict(success=True, value="data", attempts=1, total_delay=0.0),
+            dict(success=True, value="data", attempts=1, final_error=None, errors=[]),
+        ),
+        (
+            dict(success=False, attempts=3, total_delay=3.5,
+                 errors=[_TIMEOUT, _TIMEOUT, _TIMEOUT], final_error=_TIMEOUT),
+            dict(success=False, value=None, attempts=3, final_error=_TIMEOUT,
+                 errors=[_TIMEOUT, _TIMEOUT, _TIMEOUT]),
+        ),
+    ], ids=["success", "failure"])
+    def test_retry_result_fields(self, kwargs, expected):
+        """Result should expose the values it was constructed with."""
+        result = RetryResult(**kwargs)
+        for name, value in expected.items():
+            assert getattr(result, name) == value
+
+    def test_retry_result_uses_slots(self):
+        """RetryResult should not carry a per-instance __dict__."""
+        assert not hasattr(RetryResult(success=True), "__dict__")
+
+
+class TestDecorators:
+    """Tests for @with_retry and the convenience wrappers."""
 
     def test_decorator_success(self):
         """Decorator should pass through successful calls."""
@@ -263,40 +388,35 @@ class TestWithRetryDecorator:
 
     def test_decorator_retry_and_succeed(self):
         """Decorator should retry and eventually succeed."""
-        call_count = 0
+        calls = SimpleNamespace(count=0)
 
-        @with_retry(max_attempts=3, base_delay=0.01)
+        @with_retry(max_attempts=3)
         def eventually_succeeds():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise TimeoutError("timeout")
+            calls.count += 1
+            if calls.count < 3:
+                raise _TIMEOUT.with_traceback(None)
             return "success"
 
         assert eventually_succeeds() == "success"
-        assert call_count == 3
+        assert calls.count == 3
 
     def test_decorator_with_fallback(self):
         """Decorator should return fallback on failure."""
-        @with_retry(max_attempts=2, base_delay=0.01, fallback="default", raise_on_failure=False)
+        @with_retry(max_attempts=2, fallback="default", raise_on_failure=False)
         def always_fails():
-            raise TimeoutError("timeout")
+            raise _TIMEOUT.with_traceback(None)
 
         assert always_fails() == "default"
 
     def test_decorator_raises_on_failure(self):
         """Decorator should raise on failure when configured."""
-        @with_retry(max_attempts=2, base_delay=0.01, raise_on_failure=True)
+        @with_retry(max_attempts=2, raise_on_failure=True)
         def always_fails():
-            raise TimeoutError("timeout")
+            raise _TIMEOUT.with_traceback(None)
 
         with pytest.raises(TimeoutError):
             always_fails()
 
-
-class TestRetryApiCall:
-    """Tests for retry_api_call convenience function."""
-
     def test_retry_api_call_success(self):
         """Should return result on success."""
         result = retry_api_call(
@@ -308,17 +428,13 @@ class TestRetryApiCall:
     def test_retry_api_call_with_fallback(self):
         """Should return fallback on failure."""
         result = retry_api_call(
-            func=lambda: (_ for _ in ()).throw(TimeoutError("timeout")),
-            config=RetryConfig(max_attempts=2, base_delay=0.01, jitter=False),
+            func=raise_timeout,
+            config=RetryConfig(max_attempts=2, jitter=False),
             fallback="fallback",
             operation_name="test_call",
         )
         assert result == "fallback"
 
-
-class TestGracefulDegradation:
-    """Tests for with_graceful_degradation."""
-
     def test_primary_success(self):
         """Should return primary result when it succeeds."""
         result = with_graceful_degradation(
@@ -330,17 +446,17 @@ class TestGracefulDegradation:
 
     def test_fallback_on_failure(self):
         """Should call fallback when primary fails."""
-        call_count = {"primary": 0, "fallback": 0}
+        calls = SimpleNamespace(primary=0, fallback=0)
 
         def failing_primary():
-            call_count["primary"] += 1
-            raise TimeoutError("timeout")
+            calls.primary += 1
+            raise _TIMEOUT.with_traceback(None)
 
         def fallback():
-            call_count["fallback"] += 1
+            calls.fallback += 1
             return "fallback_result"
 
-        config = RetryConfig(max_attempts=2, base_delay=0.01, jitter=False)
+        config = RetryConfig(max_attempts=2, jitter=False)
 
         result = with_graceful_degradation(
             func=failing_primary,
@@ -350,36 +466,76 @@ class TestGracefulDegradation:
         )
 
         assert result == "fallback_result"
-        assert call_count["primary"] == 2  # Retried twice
-        assert call_count["fallback"] == 1
+        assert calls.primary == 2  # Retried twice
+        assert calls.fallback == 1
 
+    def test_async_primary_success(self):
+        """Async handler should return the awaited result on success."""
+        async def primary():
+            return "primary"
 
-class TestRetryResult:
-    """Tests for RetryResult dataclass."""
+        result = asyncio.run(AsyncRetryHandler().execute(primary))
 
-    def test_retry_result_success(self):
-        """Successful result should have correct values."""
-        result = RetryResult(
-            success=True,
-            value="data",
-            attempts=1,
-            total_delay=0.0,
-        )
-        assert result.success is True
-        assert result.value == "data"
-        assert result.final_error is None
-
-    def test_retry_result_failure(self):
-        """Failed result should have correct values."""
-        error = TimeoutError("timeout")
-        result = RetryResult(
-            success=False,
-            attempts=3,
-            total_delay=3.5,
-            errors=[error, error, error],
-            final_error=error,
-        )
-        assert result.success is False
-        assert result.attempts == 3
-        assert result.final_error is error
-        assert len(result.errors) == 3
+        assert result == "primary"
+
+    def test_async_execute_success_after_retry(self):
+        """Async handler should retry and eventually succeed."""
+        calls = SimpleNamespace(count=0)
+        handler = AsyncRetryHandler(config=RetryConfig(jitter=False))
+
+        async def eventually_succeeds():
+            calls.count += 1
+            if calls.count < 3:
+                raise _TIMEOUT.with_traceback(None)
+            return "success"
+
+        result = asyncio.run(handler.execute(eventually_succeeds))
+
+        assert result == "success"
+        assert calls.count == 3
+
+    def test_async_decorrelated_backoff_is_per_execution(self, monkeypatch):
+        """Interleaved executions on one handler should each follow their own backoff."""
+        # Always draw the top of the window, so each delay is previous * 3
+        handler = AsyncRetryHandler(config=RetryConfig(
+            max_attempts=4, base_delay=1.0, max_delay=100.0,
+            jitter_strategy=JitterStrategy.DECORRELATED,
+            rng=SimpleNamespace(uniform=lambda low, high: high),
+        ))
+        delays = {}
+
+        async def yielding_sleep(seconds):
+            delays.setdefault(asyncio.current_task().get_name(), []).append(seconds)
+            await asyncio.sleep(0)  # let the other execution run
+
+        monkeypatch.setattr("core.api_retry._async_sleep", yielding_sleep)
+
+        def eventually_succeeds():
+            calls = SimpleNamespace(count=0)
+
+            async def func():
+                calls.count += 1
+                if calls.count < 4:
+                    raise _TIMEOUT.with_traceback(None)
+                return "success"
+            return func
+
+        async def run_both():
+            return await asyncio.gather(
+                asyncio.create_task(handler.execute(eventually_succeeds()), name="a"),
+                asyncio.create_task(handler.execute(eventually_succeeds()), name="b"),
+            )
+
+        assert asyncio.run(run_both()) == ["success", "success"]
+        assert delays == {"a": [3.0, 9.0, 27.0], "b": [3.0, 9.0, 27.0]}
+
+    def test_async_fallback_on_failure(self):
+        """Async handler should return the fallback once retries are exhausted."""
+        handler = AsyncRetryHandler(config=RetryConfig(max_attempts=2, jitter=False))
+
+        async def always_fails():
+            raise _TIMEOUT.with_traceback(None)
+
+        result = asyncio.run(handler.execute(always_fails, fallback="fallback_result"))
+
+        assert result == "fallback_result"
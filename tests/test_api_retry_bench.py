@@ -0,0 +1,24 @@
+"""
+Benchmarks for the API retry infrastructure.
+
+Requires pytest-benchmark; the module is skipped when it isn't installed.
+
+Run with: pytest tests/test_api_retry_bench.py -m bench
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from core.api_retry import RetryConfig, RetryHandler
+
+pytestmark = pytest.mark.bench
+
+
+def test_bench_calculate_delay(benchmark):
+    """calculate_delay should stay a cheap lookup on the hot path."""
+    handler = RetryHandler(config=RetryConfig(jitter=False))
+
+    delays = benchmark(lambda: [handler.calculate_delay(i & 7) for i in range(1000)])
+
+    assert delays[:3] == [1.0, 2.0, 4.0]
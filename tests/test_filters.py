@@ -2,450 +2,343 @@
 Tests for filter extraction module.
 
 Run with: pytest tests/test_filters.py -v
+
+Tests are independent and the extractor is stateless, so the file can be
+spread across cores: pytest tests/test_filters.py -n auto --dist=worksteal
 """
 
+import functools
+
 import pytest
 from core.filters import FilterExtractor
 from core.context import SearchFilters
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extractor():
-    """Create a filter extractor instance."""
-    return FilterExtractor()
+    """Shared filter extractor (extract() keeps no per-call state)."""
+    ext = FilterExtractor()
+    # Run every extraction path once so the re module's pattern cache is warm
+    # before the first real test in this module (or xdist worker)
+    ext.extract("warmup 6ft HDMI to USB-C cable 4K")
+    return ext
+
+
+@pytest.fixture(scope="module")
+def extract(extractor):
+    """
+    Memoized extractor.extract.
+
+    Many queries repeat across test classes; tests only read the returned
+    SearchFilters, so sharing one result per query string is safe.
+    """
+    return functools.lru_cache(maxsize=None)(extractor.extract)
+
+
+# Expected (length, length_unit, connector_from, connector_to, features,
+# product_category) per query; compared against filters_tuple(result).
+COMBINED_QUERIES = {
+    "6ft USB-C to HDMI cable": (6.0, "ft", "USB-C", "HDMI", frozenset(), "Cables"),
+    "I need a 10ft HDMI cable that supports 4K": (
+        10.0, "ft", "HDMI", "HDMI", frozenset({"4K"}), "Cables"),
+    "6 foot USB-C to DisplayPort cable with 4K support": (
+        6.0, "ft", "USB-C", "DisplayPort", frozenset({"4K"}), "Cables"),
+    "USB-C to HDMI adapter with 4K and HDCP": (
+        None, None, "USB-C", "HDMI", frozenset({"4K", "HDCP"}), "Adapters"),
+    # Docks suppress the ambiguous connector
+    "Thunderbolt 4 docking station": (
+        None, None, None, None, frozenset({"Thunderbolt"}), "Docks"),
+}
+
+REAL_WORLD_QUERIES = {
+    "I need a 6 foot HDMI cable for my TV": (
+        6.0, "ft", "HDMI", "HDMI", frozenset(), "Cables"),
+    "Show me USB-C to HDMI adapters": (
+        None, None, "USB-C", "HDMI", frozenset(), "Adapters"),
+    "Can you find me a DisplayPort cable that supports 4K?": (
+        None, None, "DisplayPort", "DisplayPort", frozenset({"4K"}), "Cables"),
+    "2m Thunderbolt 4 cable with 100W power delivery": (
+        2.0, "m", "Thunderbolt", "Thunderbolt",
+        frozenset({"Thunderbolt", "Power Delivery"}), "Cables"),
+    "HDMI 2.1 vs HDMI 2.0 cables": (
+        None, None, "HDMI", "HDMI", frozenset(), "Cables"),
+}
+
+
+@pytest.fixture(scope="module")
+def batch_results(extractor):
+    """Extract every table-driven query in one batch."""
+    queries = [*COMBINED_QUERIES, *REAL_WORLD_QUERIES]
+    return dict(zip(queries, extractor.extract_many(queries)))
+
+
+def filters_tuple(result):
+    """The fields checked by the combined/real-world query tables."""
+    return (
+        result.length,
+        result.length_unit,
+        result.connector_from,
+        result.connector_to,
+        result.features_set,
+        result.product_category,
+    )
 
 
 class TestLengthExtraction:
     """Test length requirement extraction."""
-    
-    def test_feet_numeric(self, extractor):
-        result = extractor.extract("6ft cable")
-        assert result.length == 6.0
-        assert result.length_unit == "ft"
-    
-    def test_feet_word(self, extractor):
-        result = extractor.extract("6 feet cable")
-        assert result.length == 6.0
-        assert result.length_unit == "ft"
-    
-    def test_foot_singular(self, extractor):
-        result = extractor.extract("1 foot cable")
-        assert result.length == 1.0
-        assert result.length_unit == "ft"
-    
-    def test_meters(self, extractor):
-        result = extractor.extract("2 meter cable")
-        assert result.length == 2.0
-        assert result.length_unit == "m"
-    
-    def test_meters_plural(self, extractor):
-        result = extractor.extract("3 meters")
-        assert result.length == 3.0
-        assert result.length_unit == "m"
-    
-    def test_word_based_length(self, extractor):
-        result = extractor.extract("I need a six foot cable")
-        assert result.length == 6.0
-        assert result.length_unit == "ft"
-    
-    def test_decimal_length(self, extractor):
-        result = extractor.extract("1.5 meter cable")
-        assert result.length == 1.5
-        assert result.length_unit == "m"
-    
-    def test_no_length(self, extractor):
-        result = extractor.extract("HDMI cable")
-        assert result.length is None
-        assert result.length_unit is None
+
+    @pytest.mark.parametrize("query,length,unit", [
+        ("6ft cable", 6.0, "ft"),
+        ("6 feet cable", 6.0, "ft"),
+        ("1 foot cable", 1.0, "ft"),
+        ("2 meter cable", 2.0, "m"),
+        ("3 meters", 3.0, "m"),
+        ("I need a six foot cable", 6.0, "ft"),
+        ("ten feet or six feet", 6.0, "ft"),
+        ("1.5 meter cable", 1.5, "m"),
+        ("HDMI cable", None, None),
+    ], ids=["feet_numeric", "feet_word", "foot_singular", "meters", "meters_plural",
+            "word_based", "word_based_table_order", "decimal", "no_length"])
+    def test_length(self, extract, query, length, unit):
+        result = extract(query)
+        assert result.length == length
+        assert result.length_unit == unit
 
 
 class TestConnectorExtraction:
     """Test connector type extraction."""
-    
-    # === Connector-to-Connector Patterns ===
-    
-    def test_usb_c_to_hdmi(self, extractor):
-        result = extractor.extract("USB-C to HDMI cable")
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "HDMI"
-    
-    def test_usbc_to_hdmi(self, extractor):
-        result = extractor.extract("USBC to HDMI")
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "HDMI"
-    
-    def test_usb_c_to_displayport(self, extractor):
-        result = extractor.extract("USB-C to DisplayPort")
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "DisplayPort"
-    
-    def test_hdmi_to_vga(self, extractor):
-        result = extractor.extract("HDMI to VGA adapter")
-        assert result.connector_from == "HDMI"
-        assert result.connector_to == "VGA"
-    
-    def test_dp_to_hdmi(self, extractor):
-        result = extractor.extract("DisplayPort to HDMI cable")
-        assert result.connector_from == "DisplayPort"
-        assert result.connector_to == "HDMI"
-    
-    # === Single Connector Patterns ===
-    
-    def test_hdmi_cable(self, extractor):
-        result = extractor.extract("HDMI cable")
-        assert result.connector_from == "HDMI"
-        assert result.connector_to == "HDMI"
-    
-    def test_displayport_cable(self, extractor):
-        result = extractor.extract("DisplayPort cable")
-        assert result.connector_from == "DisplayPort"
-        assert result.connector_to == "DisplayPort"
-    
-    def test_usb_c_cable(self, extractor):
-        result = extractor.extract("USB-C cable")
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "USB-C"
-    
-    def test_vga_cable(self, extractor):
-        result = extractor.extract("VGA cable")
-        assert result.connector_from == "VGA"
-        assert result.connector_to == "VGA"
-    
-    # === Bare Connector Mentions ===
-    
-    def test_bare_hdmi(self, extractor):
-        result = extractor.extract("Show me HDMI")
-        assert result.connector_from == "HDMI"
-        assert result.connector_to == "HDMI"
-    
-    def test_bare_usb_c(self, extractor):
-        result = extractor.extract("I need USB-C")
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "USB-C"
-    
-    # === Synonym Expansion ===
-    
-    def test_dp_abbreviation(self, extractor):
-        result = extractor.extract("DP cable")
-        # expand_synonyms should convert DP → DisplayPort
-        assert result.connector_from == "DisplayPort"
-        assert result.connector_to == "DisplayPort"
+
+    @pytest.mark.parametrize("query,connector_from,connector_to", [
+        # Connector-to-connector patterns
+        ("USB-C to HDMI cable", "USB-C", "HDMI"),
+        ("USBC to HDMI", "USB-C", "HDMI"),
+        ("USB-C to DisplayPort", "USB-C", "DisplayPort"),
+        ("HDMI to VGA adapter", "HDMI", "VGA"),
+        ("DisplayPort to HDMI cable", "DisplayPort", "HDMI"),
+        # Single connector patterns
+        ("HDMI cable", "HDMI", "HDMI"),
+        ("DisplayPort cable", "DisplayPort", "DisplayPort"),
+        ("USB-C cable", "USB-C", "USB-C"),
+        ("VGA cable", "VGA", "VGA"),
+        # Bare connector mentions
+        ("Show me HDMI", "HDMI", "HDMI"),
+        ("I need USB-C", "USB-C", "USB-C"),
+        # Synonym expansion: expand_synonyms should convert DP → DisplayPort
+        ("DP cable", "DisplayPort", "DisplayPort"),
+    ], ids=["usb_c_to_hdmi", "usbc_to_hdmi", "usb_c_to_displayport", "hdmi_to_vga",
+            "dp_to_hdmi", "hdmi_cable", "displayport_cable", "usb_c_cable", "vga_cable",
+            "bare_hdmi", "bare_usb_c", "dp_abbreviation"])
+    def test_connectors(self, extract, query, connector_from, connector_to):
+        result = extract(query)
+        assert result.connector_from == connector_from
+        assert result.connector_to == connector_to
 
 
 class TestFeatureExtraction:
     """Test technical feature extraction."""
-    
-    def test_4k_support(self, extractor):
-        result = extractor.extract("HDMI cable with 4K support")
-        assert "4K" in result.features
-    
-    def test_4k_lowercase(self, extractor):
-        result = extractor.extract("4k hdmi cable")
-        assert "4K" in result.features
-    
-    def test_1080p(self, extractor):
-        result = extractor.extract("1080p HDMI cable")
-        assert "1080p" in result.features
-    
-    def test_thunderbolt(self, extractor):
-        result = extractor.extract("Thunderbolt 4 cable")
-        assert "Thunderbolt" in result.features
-    
-    def test_power_delivery(self, extractor):
-        result = extractor.extract("USB-C cable with power delivery")
-        assert "Power Delivery" in result.features
-    
-    def test_multiple_features(self, extractor):
-        result = extractor.extract("4K HDMI cable with HDCP support")
-        assert "4K" in result.features
-        assert "HDCP" in result.features
-    
-    def test_no_features(self, extractor):
-        result = extractor.extract("HDMI cable")
+
+    @pytest.mark.parametrize("query,feature", [
+        ("HDMI cable with 4K support", "4K"),
+        ("4k hdmi cable", "4K"),
+        ("1080p HDMI cable", "1080p"),
+        ("Thunderbolt 4 cable", "Thunderbolt"),
+        ("USB-C cable with power delivery", "Power Delivery"),
+    ], ids=["4k_support", "4k_lowercase", "1080p", "thunderbolt", "power_delivery"])
+    def test_feature(self, extract, query, feature):
+        result = extract(query)
+        assert feature in result.features_set
+
+    def test_multiple_features(self, extract):
+        result = extract("4K HDMI cable with HDCP support")
+        assert {"4K", "HDCP"} <= result.features_set
+
+    def test_no_features(self, extract):
+        result = extract("HDMI cable")
         assert result.features == []
 
 
 class TestCategoryExtraction:
     """Test product category extraction."""
-    
-    def test_cable_category(self, extractor):
-        result = extractor.extract("HDMI cable")
-        assert result.product_category == "Cables"
-    
-    def test_adapter_category(self, extractor):
-        result = extractor.extract("USB-C adapter")
-        assert result.product_category == "Adapters"
-    
-    def test_dock_category(self, extractor):
-        result = extractor.extract("USB-C dock")
-        assert result.product_category == "Docks"
-    
-    def test_docking_station(self, extractor):
-        result = extractor.extract("docking station")
-        assert result.product_category == "Docks"
-    
-    def test_hub_category(self, extractor):
-        result = extractor.extract("USB hub")
-        assert result.product_category == "Hubs"
-    
-    def test_switch_category(self, extractor):
-        result = extractor.extract("HDMI switch")
-        assert result.product_category == "Switches"
-
-    def test_kvm_category(self, extractor):
-        result = extractor.extract("KVM switch for 2 computers")
-        assert result.product_category == "Kvm Switches"
-
-    def test_ethernet_switch_category(self, extractor):
-        """Network switch should map to Ethernet Switches, not generic Switches."""
-        result = extractor.extract("network switch with 8 ports")
-        assert result.product_category == "Ethernet Switches"
 
-    def test_gigabit_switch_category(self, extractor):
-        result = extractor.extract("gigabit switch")
-        assert result.product_category == "Ethernet Switches"
-
-    def test_poe_switch_category(self, extractor):
-        result = extractor.extract("PoE switch")
-        assert result.product_category == "Ethernet Switches"
-
-    def test_mount_category(self, extractor):
-        result = extractor.extract("monitor mount")
-        assert result.product_category == "Display Mounts"
-
-    def test_wall_mount_category(self, extractor):
-        result = extractor.extract("wall mount for TV")
-        assert result.product_category == "Display Mounts"
-
-    def test_desk_mount_category(self, extractor):
-        result = extractor.extract("desk mount for monitor")
-        assert result.product_category == "Display Mounts"
-
-    def test_tv_mount_category(self, extractor):
-        result = extractor.extract("I need a TV mount")
-        assert result.product_category == "Display Mounts"
-
-    def test_no_category(self, extractor):
-        result = extractor.extract("Show me HDMI")
-        assert result.product_category is None
+    @pytest.mark.parametrize("query,category", [
+        ("HDMI cable", "Cables"),
+        ("USB-C adapter", "Adapters"),
+        ("USB-C dock", "Docks"),
+        ("docking station", "Docks"),
+        ("USB hub", "Hubs"),
+        ("4 port USB hub", "Hubs"),
+        ("HDMI switch", "Switches"),
+        ("KVM switch for 2 computers", "Kvm Switches"),
+        # Network switch should map to Ethernet Switches, not generic Switches
+        ("network switch with 8 ports", "Ethernet Switches"),
+        ("I need a network switch with 8 ports", "Ethernet Switches"),
+        ("gigabit switch", "Ethernet Switches"),
+        ("PoE switch", "Ethernet Switches"),
+        ("monitor mount", "Display Mounts"),
+        ("wall mount for TV", "Display Mounts"),
+        ("desk mount for monitor", "Display Mounts"),
+        ("I need a TV mount", "Display Mounts"),
+        ("Show me HDMI", None),
+    ], ids=["cable", "adapter", "dock", "docking_station", "hub", "port_hub", "switch",
+            "kvm", "ethernet_switch", "ethernet_switch_sentence", "gigabit_switch",
+            "poe_switch", "mount", "wall_mount", "desk_mount", "tv_mount", "no_category"])
+    def test_category(self, extract, query, category):
+        result = extract(query)
+        assert result.product_category == category
 
 
 class TestPortCountExtraction:
     """Test port count extraction for hubs and switches."""
 
-    def test_8_port_switch(self, extractor):
-        result = extractor.extract("I need a network switch with 8 ports")
-        assert result.port_count == 8
-        assert result.product_category == "Ethernet Switches"
-
-    def test_4_port_hub(self, extractor):
-        result = extractor.extract("4 port USB hub")
-        assert result.port_count == 4
-        assert result.product_category == "Hubs"
-
-    def test_hyphenated_port(self, extractor):
-        result = extractor.extract("8-port gigabit switch")
-        assert result.port_count == 8
-
-    def test_16_port_switch(self, extractor):
-        result = extractor.extract("switch with 16 ports")
-        assert result.port_count == 16
-
-    def test_no_port_count(self, extractor):
-        result = extractor.extract("network switch")
-        assert result.port_count is None
+    @pytest.mark.parametrize("query,port_count", [
+        ("I need a network switch with 8 ports", 8),
+        ("4 port USB hub", 4),
+        ("8-port gigabit switch", 8),
+        ("switch with 16 ports", 16),
+        ("network switch", None),
+    ], ids=["8_port_switch", "4_port_hub", "hyphenated", "16_port_switch", "no_port_count"])
+    def test_port_count(self, extract, query, port_count):
+        result = extract(query)
+        assert result.port_count == port_count
 
 
 class TestCombinedQueries:
     """Test extraction from complex queries with multiple filters."""
-    
-    def test_length_and_connectors(self, extractor):
-        result = extractor.extract("6ft USB-C to HDMI cable")
-        assert result.length == 6.0
-        assert result.length_unit == "ft"
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "HDMI"
-        assert result.product_category == "Cables"
-    
-    def test_length_connectors_features(self, extractor):
-        result = extractor.extract("I need a 10ft HDMI cable that supports 4K")
-        assert result.length == 10.0
-        assert result.length_unit == "ft"
-        assert result.connector_from == "HDMI"
-        assert result.connector_to == "HDMI"
-        assert "4K" in result.features
-        assert result.product_category == "Cables"
-    
-    def test_full_query(self, extractor):
-        result = extractor.extract("6 foot USB-C to DisplayPort cable with 4K support")
-        assert result.length == 6.0
-        assert result.length_unit == "ft"
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "DisplayPort"
-        assert "4K" in result.features
-        assert result.product_category == "Cables"
-    
-    def test_adapter_with_features(self, extractor):
-        result = extractor.extract("USB-C to HDMI adapter with 4K and HDCP")
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "HDMI"
-        assert "4K" in result.features
-        assert "HDCP" in result.features
-        assert result.product_category == "Adapters"
-    
-    def test_thunderbolt_dock(self, extractor):
-        result = extractor.extract("Thunderbolt 4 docking station")
-        assert "Thunderbolt" in result.features
-        assert result.product_category == "Docks"
+
+    @pytest.mark.parametrize("query,expected", COMBINED_QUERIES.items(), ids=COMBINED_QUERIES.keys())
+    def test_combined(self, batch_results, query, expected):
+        assert filters_tuple(batch_results[query]) == expected
+
+    def test_extract_many_matches_extract(self, extractor):
+        queries = ["6ft HDMI cable", "", "USB hub"]
+        assert extractor.extract_many(queries) == [extractor.extract(q) for q in queries]
 
 
 class TestEdgeCases:
     """Test edge cases and unusual inputs."""
     
-    def test_empty_string(self, extractor):
-        result = extractor.extract("")
+    def test_empty_string(self, extract):
+        result = extract("")
         assert result.length is None
         assert result.connector_from is None
         assert result.connector_to is None
         assert result.features == []
         assert result.product_category is None
     
-    def test_only_length(self, extractor):
-        result = extractor.extract("6ft")
+    def test_only_length(self, extract):
+        result = extract("6ft")
         assert result.length == 6.0
         assert result.length_unit == "ft"
         assert result.connector_from is None
     
-    def test_only_connector(self, extractor):
-        result = extractor.extract("HDMI")
+    def test_only_connector(self, extract):
+        result = extract("HDMI")
         assert result.connector_from == "HDMI"
         assert result.length is None
     
-    def test_multiple_lengths_takes_first(self, extractor):
-        result = extractor.extract("6ft or 10ft cable")
+    def test_multiple_lengths_takes_first(self, extract):
+        result = extract("6ft or 10ft cable")
         assert result.length == 6.0  # Should take first match
     
-    def test_mixed_case(self, extractor):
-        result = extractor.extract("6FT USB-c TO hdmi CABLE")
+    def test_mixed_case(self, extract):
+        result = extract("6FT USB-c TO hdmi CABLE")
         assert result.length == 6.0
         assert result.connector_from == "USB-C"
         assert result.connector_to == "HDMI"
     
-    def test_extra_whitespace(self, extractor):
-        result = extractor.extract("   6ft    USB-C   to   HDMI   ")
+    def test_extra_whitespace(self, extract):
+        result = extract("   6ft    USB-C   to   HDMI   ")
         assert result.length == 6.0
         assert result.connector_from == "USB-C"
         assert result.connector_to == "HDMI"
 
+    @pytest.mark.parametrize("query", [
+        "usb-c " * 3000 + "dock",
+        "dock " + "usb c port " * 2000,
+        "usb-c cables, " + "but not the " * 2000,
+        "8 " * 5000 + "p",
+    ], ids=["port-type-no-match", "port-type-match", "negations", "digits"])
+    def test_long_repetitive_query(self, extractor, query):
+        # Guards against backtracking blowups; these ran in seconds when the
+        # port-type and negation scans were quadratic
+        result = extractor.extract(query)
+        assert result.port_count is None
+        assert result.keywords == []
+
 
 class TestRealWorldQueries:
     """Test with real-world user queries."""
-    
-    def test_natural_language_1(self, extractor):
-        result = extractor.extract("I need a 6 foot HDMI cable for my TV")
-        assert result.length == 6.0
-        assert result.connector_from == "HDMI"
-        assert result.product_category == "Cables"
-    
-    def test_natural_language_2(self, extractor):
-        result = extractor.extract("Show me USB-C to HDMI adapters")
-        assert result.connector_from == "USB-C"
-        assert result.connector_to == "HDMI"
-        assert result.product_category == "Adapters"
-    
-    def test_natural_language_3(self, extractor):
-        result = extractor.extract("Can you find me a DisplayPort cable that supports 4K?")
-        assert result.connector_from == "DisplayPort"
-        assert "4K" in result.features
-        assert result.product_category == "Cables"
-    
-    def test_technical_query(self, extractor):
-        result = extractor.extract("2m Thunderbolt 4 cable with 100W power delivery")
-        assert result.length == 2.0
-        assert result.length_unit == "m"
-        assert "Thunderbolt" in result.features
-        assert "Power Delivery" in result.features
-        assert result.product_category == "Cables"
-    
-    def test_comparison_query(self, extractor):
-        result = extractor.extract("HDMI 2.1 vs HDMI 2.0 cables")
-        assert result.connector_from == "HDMI"
-        assert result.product_category == "Cables"
+
+    @pytest.mark.parametrize("query,expected", REAL_WORLD_QUERIES.items(), ids=REAL_WORLD_QUERIES.keys())
+    def test_real_world(self, batch_results, query, expected):
+        assert filters_tuple(batch_results[query]) == expected
 
 
 class TestUnitNormalization:
     """Test unit normalization."""
-    
-    def test_feet_variations(self, extractor):
-        queries = ["6 ft", "6 feet", "6 foot", "6ft"]
-        for query in queries:
-            result = extractor.extract(query)
-            assert result.length_unit == "ft", f"Failed for: {query}"
-    
-    def test_meter_variations(self, extractor):
-        queries = ["2 m", "2 meter", "2 meters", "2m"]
-        for query in queries:
-            result = extractor.extract(query)
-            assert result.length_unit == "m", f"Failed for: {query}"
+
+    @pytest.mark.parametrize("query", ["6 ft", "6 feet", "6 foot", "6ft"])
+    def test_feet_variations(self, extract, query):
+        assert extract(query).length_unit == "ft"
+
+    @pytest.mark.parametrize("query", ["2 m", "2 meter", "2 meters", "2m"])
+    def test_meter_variations(self, extract, query):
+        assert extract(query).length_unit == "m"
 
 
 class TestConnectorNormalization:
     """Test connector name normalization."""
 
-    def test_usb_c_variations(self, extractor):
-        queries = ["USB-C cable", "USBC cable", "USB C cable"]
-        for query in queries:
-            result = extractor.extract(query)
-            assert result.connector_from == "USB-C", f"Failed for: {query}"
+    @pytest.mark.parametrize("query", ["USB-C cable", "USBC cable", "USB C cable"])
+    def test_usb_c_variations(self, extract, query):
+        assert extract(query).connector_from == "USB-C"
 
-    def test_displayport_variations(self, extractor):
-        queries = ["DisplayPort cable", "Display Port cable", "DP cable"]
-        for query in queries:
-            result = extractor.extract(query)
-            assert result.connector_from == "DisplayPort", f"Failed for: {query}"
+    @pytest.mark.parametrize("query", ["DisplayPort cable", "Display Port cable", "DP cable"])
+    def test_displayport_variations(self, extract, query):
+        assert extract(query).connector_from == "DisplayPort"
 
 
 class TestNonCableCategories:
     """Test connector suppression for non-cable categories (hubs, docks, etc.)."""
 
-    def test_usb_hub_no_connectors(self, extractor):
+    def test_usb_hub_no_connectors(self, extract):
         """USB hub should NOT extract USB as connector (USB describes hub type)."""
-        result = extractor.extract("USB hub")
+        result = extract("USB hub")
         assert result.product_category == "Hubs"
         assert result.connector_from is None
         assert result.connector_to is None
 
-    def test_usb_c_hub_no_connectors(self, extractor):
+    def test_usb_c_hub_no_connectors(self, extract):
         """USB-C hub should NOT extract USB-C as connector."""
-        result = extractor.extract("USB-C hub")
+        result = extract("USB-C hub")
         assert result.product_category == "Hubs"
         assert result.connector_from is None
         assert result.connector_to is None
 
-    def test_usb_dock_no_connectors(self, extractor):
+    def test_usb_dock_no_connectors(self, extract):
         """USB dock should NOT extract USB as connector."""
-        result = extractor.extract("USB-C dock")
+        result = extract("USB-C dock")
         assert result.product_category == "Docks"
         assert result.connector_from is None
         assert result.connector_to is None
 
-    def test_dock_with_explicit_pair_keeps_connectors(self, extractor):
+    def test_dock_with_explicit_pair_keeps_connectors(self, extract):
         """USB-C to HDMI dock SHOULD keep connectors (explicit pair)."""
-        result = extractor.extract("USB-C to HDMI dock")
+        result = extract("USB-C to HDMI dock")
         assert result.product_category == "Docks"
         assert result.connector_from == "USB-C"
         assert result.connector_to == "HDMI"
 
-    def test_hdmi_cable_keeps_connectors(self, extractor):
+    def test_hdmi_cable_keeps_connectors(self, extract):
         """HDMI cable SHOULD keep connectors (cable category)."""
-        result = extractor.extract("HDMI cable")
+        result = extract("HDMI cable")
         assert result.product_category == "Cables"
         assert result.connector_from == "HDMI"
         assert result.connector_to == "HDMI"
 
-    def test_kvm_switch_no_connectors(self, extractor):
+    def test_kvm_switch_no_connectors(self, extract):
         """HDMI KVM switch should NOT extract HDMI as connector."""
-        result = extractor.extract("HDMI KVM switch")
+        result = extract("HDMI KVM switch")
         assert result.product_category is not None
         # KVM switch category - connector should be suppressed for ambiguous term
         assert result.connector_from is None or result.product_category.lower() in ['kvm switches', 'switches']
@@ -454,190 +347,88 @@ class TestNonCableCategories:
 class TestColorExtraction:
     """Tests for color extraction from queries."""
 
-    def test_red_cable(self, extractor):
-        """Should extract red color."""
-        result = extractor.extract("red HDMI cable")
-        assert result.color == "Red"
-
-    def test_black_cable(self, extractor):
-        """Should extract black color."""
-        result = extractor.extract("black USB-C cable")
-        assert result.color == "Black"
-
-    def test_white_cable(self, extractor):
-        """Should extract white color."""
-        result = extractor.extract("white ethernet cable")
-        assert result.color == "White"
-
-    def test_grey_british_spelling(self, extractor):
-        """Should normalize grey to Gray."""
-        result = extractor.extract("grey DisplayPort cable")
-        assert result.color == "Gray"
-
-    def test_gray_american_spelling(self, extractor):
-        """Should extract gray color."""
-        result = extractor.extract("gray USB hub")
-        assert result.color == "Gray"
-
-    def test_no_color(self, extractor):
-        """Should return None when no color specified."""
-        result = extractor.extract("6ft HDMI cable")
-        assert result.color is None
-
-    def test_color_with_other_filters(self, extractor):
+    @pytest.mark.parametrize("query,color", [
+        ("red HDMI cable", "Red"),
+        ("black USB-C cable", "Black"),
+        ("white ethernet cable", "White"),
+        # grey should normalize to Gray
+        ("grey DisplayPort cable", "Gray"),
+        ("gray USB hub", "Gray"),
+        ("6ft HDMI cable", None),
+        ("RED HDMI cable", "Red"),
+        # Should not match 'orange' inside 'storage'
+        ("storage device cable", None),
+        # First color mentioned wins
+        ("white and black cable", "White"),
+    ], ids=["red", "black", "white", "grey_british", "gray_american", "no_color",
+            "case_insensitive", "orange_not_in_storage", "first_mentioned"])
+    def test_color(self, extract, query, color):
+        result = extract(query)
+        assert result.color == color
+
+    def test_color_with_other_filters(self, extract):
         """Should extract color alongside other filters."""
-        result = extractor.extract("6ft red USB-C to HDMI cable")
+        result = extract("6ft red USB-C to HDMI cable")
         assert result.color == "Red"
         assert result.length == 6.0
         assert result.connector_from == "USB-C"
         assert result.connector_to == "HDMI"
 
-    def test_color_case_insensitive(self, extractor):
-        """Should handle uppercase/mixed case colors."""
-        result = extractor.extract("RED HDMI cable")
-        assert result.color == "Red"
-
-    def test_orange_not_in_storage(self, extractor):
-        """Should not match 'orange' inside 'storage'."""
-        result = extractor.extract("storage device cable")
-        assert result.color is None
-
 
 class TestKeywordExtraction:
     """Tests for keyword extraction for text matching."""
 
-    def test_fiber_optic_cable(self, extractor):
-        """Fiber optic should be extracted as keywords AND category."""
-        result = extractor.extract("fiber optic cable")
-        # Category is detected from category_keywords
-        assert result.product_category == "Fiber Cables"
-        # Keywords MUST also be extracted for text matching
-        # (category detection alone isn't reliable for all products)
-        assert "fiber" in result.keywords
-        assert "optic" in result.keywords
-
-    def test_monitor_mount(self, extractor):
-        """Should extract 'monitor' as keyword (mount is already category)."""
-        result = extractor.extract("monitor mount")
-        assert "monitor" in result.keywords
-        # 'mount' should be captured by category, not keywords
-        assert "mount" not in result.keywords
-
-    def test_hard_drive_enclosure(self, extractor):
-        """Drive enclosure should be captured by category AND keywords."""
-        result = extractor.extract("hard drive enclosure")
-        # Category is detected from category_keywords
-        assert result.product_category == "Storage Enclosures"
-        # Keywords MUST also be extracted for text matching
-        assert "hard" in result.keywords
-        assert "drive" in result.keywords
-        # 'enclosure' is in ALREADY_EXTRACTED (generic category word)
-        assert "enclosure" not in result.keywords
-
-    def test_desk_mount(self, extractor):
-        """Should extract 'desk' as keyword."""
-        result = extractor.extract("desk mount for monitor")
-        assert "desk" in result.keywords
-
-    def test_wall_mount(self, extractor):
-        """Should extract 'wall' as keyword."""
-        result = extractor.extract("wall mount for TV")
-        assert "wall" in result.keywords
-
-    def test_no_keywords_for_standard_cable(self, extractor):
+    # (query, keywords that must be extracted, words that must not be)
+    @pytest.mark.parametrize("query,included,excluded", [
+        # Keywords MUST be extracted alongside the category for text
+        # matching (category detection alone isn't reliable for all products)
+        ("fiber optic cable", {"fiber", "optic"}, set()),
+        ("fiber patch cable", {"patch", "fiber"}, set()),
+        # 'mount' / 'enclosure' are captured by category (ALREADY_EXTRACTED)
+        ("monitor mount", {"monitor"}, {"mount"}),
+        ("hard drive enclosure", {"hard", "drive"}, {"enclosure"}),
+        ("desk mount for monitor", {"desk"}, set()),
+        ("wall mount for TV", {"wall"}, set()),
+        # Stop words
+        ("I need a cable for the monitor", set(), {"need", "for", "the"}),
+        # Words under 3 characters ('on' is also a stop word)
+        ("TV mount on wall", set(), {"tv", "on"}),
+        ("power cord", {"power"}, set()),
+        ("cat6 ethernet cable", {"cat6"}, set()),
+        ("SATA data cable", {"sata", "data"}, set()),
+        ("dual monitor arm", {"dual", "arm"}, set()),
+    ], ids=["fiber_optic", "fiber_patch", "monitor_mount", "hard_drive_enclosure",
+            "desk_mount", "wall_mount", "stop_words", "short_words", "power_cord",
+            "cat6_ethernet", "sata_cable", "dual_monitor_arm"])
+    def test_keywords(self, extract, query, included, excluded):
+        keywords = set(extract(query).keywords)
+        assert included <= keywords
+        assert not keywords & excluded
+
+    def test_no_keywords_for_standard_cable(self, extract):
         """Standard cable query should have no extra keywords."""
-        result = extractor.extract("6ft USB-C to HDMI cable")
+        result = extract("6ft USB-C to HDMI cable")
         # All significant words are already captured by other extractors
         assert len(result.keywords) == 0
 
-    def test_stop_words_excluded(self, extractor):
-        """Stop words should not be extracted as keywords."""
-        result = extractor.extract("I need a cable for the monitor")
-        assert "need" not in result.keywords
-        assert "for" not in result.keywords
-        assert "the" not in result.keywords
-
-    def test_short_words_excluded(self, extractor):
-        """Words less than 3 characters should be excluded."""
-        result = extractor.extract("TV mount on wall")
-        assert "tv" not in result.keywords  # Too short
-        assert "on" not in result.keywords  # Stop word and short
-
-    def test_power_cord_keywords(self, extractor):
-        """Power cord query should extract 'power' and 'cord'."""
-        result = extractor.extract("power cord")
-        assert "power" in result.keywords
-        # Note: 'cord' is in ALREADY_EXTRACTED as it maps to cables
-        # So only 'power' should be extracted
-
-    def test_cat6_ethernet_keywords(self, extractor):
-        """Cat6 ethernet query should extract 'cat6'."""
-        result = extractor.extract("cat6 ethernet cable")
-        assert "cat6" in result.keywords
-
-    def test_sata_cable_keywords(self, extractor):
-        """SATA cable query should extract 'sata'."""
-        result = extractor.extract("SATA data cable")
-        assert "sata" in result.keywords
-        assert "data" in result.keywords
-
-    def test_patch_cable_keywords(self, extractor):
-        """Patch cable query should extract 'patch' and 'fiber' as keywords."""
-        result = extractor.extract("fiber patch cable")
-        assert "patch" in result.keywords
-        # 'fiber' must remain as keyword for text matching
-        assert result.product_category == "Fiber Cables"
-        assert "fiber" in result.keywords
-
-    def test_dual_monitor_arm(self, extractor):
-        """Dual monitor arm should extract relevant keywords."""
-        result = extractor.extract("dual monitor arm")
-        assert "dual" in result.keywords
-        assert "arm" in result.keywords
-
 
 class TestFiberAndStorageCategories:
     """Tests for fiber cable and storage enclosure category extraction."""
 
-    def test_fiber_optic_category(self, extractor):
-        """'fiber optic cable' should match Fiber Cables category."""
-        result = extractor.extract("fiber optic cable")
-        assert result.product_category == "Fiber Cables"
-
-    def test_fiber_patch_category(self, extractor):
-        """'fiber patch cable' should match Fiber Cables category."""
-        result = extractor.extract("fiber patch cable")
-        assert result.product_category == "Fiber Cables"
-
-    def test_optical_fiber_category(self, extractor):
-        """'optical fiber' should match Fiber Cables category."""
-        result = extractor.extract("optical fiber cable")
-        assert result.product_category == "Fiber Cables"
-
-    def test_drive_enclosure_category(self, extractor):
-        """'drive enclosure' should match Storage Enclosures category."""
-        result = extractor.extract("drive enclosure")
-        assert result.product_category == "Storage Enclosures"
-
-    def test_hard_drive_enclosure_category(self, extractor):
-        """'hard drive enclosure' should match Storage Enclosures category."""
-        result = extractor.extract("hard drive enclosure")
-        assert result.product_category == "Storage Enclosures"
-
-    def test_ssd_enclosure_category(self, extractor):
-        """'ssd enclosure' should match Storage Enclosures category."""
-        result = extractor.extract("ssd enclosure")
-        assert result.product_category == "Storage Enclosures"
-
-    def test_nvme_enclosure_category(self, extractor):
-        """'nvme enclosure' should match Storage Enclosures category."""
-        result = extractor.extract("nvme enclosure")
-        assert result.product_category == "Storage Enclosures"
-
-    def test_m2_enclosure_category(self, extractor):
-        """'m.2 enclosure' should match Storage Enclosures category."""
-        result = extractor.extract("m.2 enclosure")
-        assert result.product_category == "Storage Enclosures"
+    @pytest.mark.parametrize("query,category", [
+        ("fiber optic cable", "Fiber Cables"),
+        ("fiber patch cable", "Fiber Cables"),
+        ("optical fiber cable", "Fiber Cables"),
+        ("drive enclosure", "Storage Enclosures"),
+        ("hard drive enclosure", "Storage Enclosures"),
+        ("ssd enclosure", "Storage Enclosures"),
+        ("nvme enclosure", "Storage Enclosures"),
+        ("m.2 enclosure", "Storage Enclosures"),
+    ], ids=["fiber_optic", "fiber_patch", "optical_fiber", "drive_enclosure",
+            "hard_drive_enclosure", "ssd_enclosure", "nvme_enclosure", "m2_enclosure"])
+    def test_category(self, extract, query, category):
+        result = extract(query)
+        assert result.product_category == category
 
 
 # Run tests with: pytest tests/test_filters.py -v
\ No newline at end of file
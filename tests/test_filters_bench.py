@@ -0,0 +1,35 @@
+"""
+Benchmarks for filter extraction.
+
+Requires pytest-benchmark; the module is skipped when it isn't installed.
+
+Run with: pytest tests/test_filters_bench.py -m bench
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from core.filters import FilterExtractor
+
+pytestmark = pytest.mark.bench
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """Shared filter extractor."""
+    return FilterExtractor()
+
+
+@pytest.mark.parametrize("query", [
+    "HDMI cable",
+    "6ft USB-C to HDMI cable",
+    "6 foot USB-C to DisplayPort cable with 4K support",
+    "I need a network switch with 8 ports",
+    "docking station with USB-C ports for dual monitors",
+    "USB-C cables, but not the long ones",
+], ids=["single_connector", "length_and_pair", "full_query", "port_count",
+        "dock_port_types", "negation"])
+def test_bench_extract(benchmark, extractor, query):
+    result = benchmark(extractor.extract, query)
+    assert result is not None
@@ -14,17 +14,20 @@ from core.intent import IntentClassifier
 from core.context import ConversationContext, IntentType, Product
 
 
-@pytest.fixture
+# classify() only reads the classifier and context, so one instance of each
+# is shared across the module.
+
+@pytest.fixture(scope="module")
 def classifier():
     return IntentClassifier()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def context():
     return ConversationContext()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def context_with_products():
     """Context with products to test followup detection."""
     ctx = ConversationContext()
@@ -44,20 +47,11 @@ def context_with_products():
 class TestGreeting:
     """Test greeting intent detection."""
 
-    def test_hello(self, classifier, context):
-        intent = classifier.classify("Hello", context)
-        assert intent.type == IntentType.GREETING
-
-    def test_hi(self, classifier, context):
-        intent = classifier.classify("Hi", context)
-        assert intent.type == IntentType.GREETING
-
-    def test_hey(self, classifier, context):
-        intent = classifier.classify("Hey", context)
-        assert intent.type == IntentType.GREETING
-
-    def test_hello_there(self, classifier, context):
-        intent = classifier.classify("Hello there", context)
+    @pytest.mark.parametrize("message", [
+        "Hello", "Hi", "Hey", "Hello there",
+    ], ids=["hello", "hi", "hey", "hello_there"])
+    def test_greeting(self, classifier, context, message):
+        intent = classifier.classify(message, context)
         assert intent.type == IntentType.GREETING
 
     def test_long_greeting_not_detected(self, classifier, context):
@@ -71,16 +65,11 @@ class TestGreeting:
 class TestFarewell:
     """Test farewell intent detection."""
 
-    def test_goodbye(self, classifier, context):
-        intent = classifier.classify("Goodbye", context)
-        assert intent.type == IntentType.FAREWELL
-
-    def test_bye(self, classifier, context):
-        intent = classifier.classify("Bye", context)
-        assert intent.type == IntentType.FAREWELL
-
-    def test_thanks(self, classifier, context):
-        intent = classifier.classify("Thanks, bye!", context)
+    @pytest.mark.parametrize("message", [
+        "Goodbye", "Bye", "Thanks, bye!",
+    ], ids=["goodbye", "bye", "thanks"])
+    def test_farewell(self, classifier, context, message):
+        intent = classifier.classify(message, context)
         assert intent.type == IntentType.FAREWELL
 
 
@@ -89,32 +78,18 @@ class TestFarewell:
 class TestNewSearch:
     """Test new product search intent detection."""
 
-    def test_show_me_cables(self, classifier, context):
-        intent = classifier.classify("Show me HDMI cables", context)
-        assert intent.type == IntentType.NEW_SEARCH
-
-    def test_connector_to_connector(self, classifier, context):
-        intent = classifier.classify("USB-C to HDMI adapter", context)
-        assert intent.type == IntentType.NEW_SEARCH
-
-    def test_product_type_with_connector(self, classifier, context):
-        intent = classifier.classify("I need an HDMI cable", context)
-        assert intent.type == IntentType.NEW_SEARCH
-
-    def test_length_with_domain(self, classifier, context):
-        intent = classifier.classify("6ft DisplayPort cable", context)
-        assert intent.type == IntentType.NEW_SEARCH
-
-    def test_looking_for(self, classifier, context):
-        intent = classifier.classify("I'm looking for a USB-C dock", context)
-        assert intent.type == IntentType.NEW_SEARCH
-
-    def test_dock_search(self, classifier, context):
-        intent = classifier.classify("I need a docking station", context)
-        assert intent.type == IntentType.NEW_SEARCH
-
-    def test_kvm_search(self, classifier, context):
-        intent = classifier.classify("Show me KVM switches", context)
+    @pytest.mark.parametrize("message", [
+        "Show me HDMI cables",
+        "USB-C to HDMI adapter",
+        "I need an HDMI cable",
+        "6ft DisplayPort cable",
+        "I'm looking for a USB-C dock",
+        "I need a docking station",
+        "Show me KVM switches",
+    ], ids=["show_me_cables", "connector_to_connector", "product_type_with_connector",
+            "length_with_domain", "looking_for", "dock_search", "kvm_search"])
+    def test_new_search(self, classifier, context, message):
+        intent = classifier.classify(message, context)
         assert intent.type == IntentType.NEW_SEARCH
 
 
@@ -123,33 +98,19 @@ class TestNewSearch:
 class TestFollowup:
     """Test followup intent detection (when products are in context)."""
 
-    def test_does_it_support(self, classifier, context_with_products):
-        intent = classifier.classify("Does it support 4K?", context_with_products)
-        assert intent.type == IntentType.FOLLOWUP
-
-    def test_which_one(self, classifier, context_with_products):
-        intent = classifier.classify("Which one is best?", context_with_products)
-        assert intent.type == IntentType.FOLLOWUP
-
-    def test_tell_me_more(self, classifier, context_with_products):
-        intent = classifier.classify("Tell me more about it", context_with_products)
-        assert intent.type == IntentType.FOLLOWUP
-
-    def test_difference(self, classifier, context_with_products):
-        intent = classifier.classify("What's the difference?", context_with_products)
-        assert intent.type == IntentType.FOLLOWUP
-
-    def test_shorter_please(self, classifier, context_with_products):
-        intent = classifier.classify("shorter please", context_with_products)
-        assert intent.type == IntentType.FOLLOWUP
-
-    def test_short_query_with_context(self, classifier, context_with_products):
+    @pytest.mark.parametrize("message", [
+        "Does it support 4K?",
+        "Which one is best?",
+        "Tell me more about it",
+        "What's the difference?",
+        "shorter please",
         # Short queries with context are treated as followups
-        intent = classifier.classify("4K support?", context_with_products)
-        assert intent.type == IntentType.FOLLOWUP
-
-    def test_product_reference(self, classifier, context_with_products):
-        intent = classifier.classify("Tell me about product 1", context_with_products)
+        "4K support?",
+        "Tell me about product 1",
+    ], ids=["does_it_support", "which_one", "tell_me_more", "difference",
+            "shorter_please", "short_query_with_context", "product_reference"])
+    def test_followup(self, classifier, context_with_products, message):
+        intent = classifier.classify(message, context_with_products)
         assert intent.type == IntentType.FOLLOWUP
 
     def test_new_search_overrides_context(self, classifier, context_with_products):
@@ -163,11 +124,66 @@ class TestFollowup:
 class TestAmbiguous:
     """Test ambiguous intent detection."""
 
-    def test_vague_query_no_context(self, classifier, context):
+    @pytest.mark.parametrize("message", [
         # Vague query without product context or domain tokens
-        intent = classifier.classify("I'm not sure what I need", context)
+        "I'm not sure what I need",
+        "banana apple orange",
+    ], ids=["vague_query_no_context", "random_text"])
+    def test_ambiguous(self, classifier, context, message):
+        intent = classifier.classify(message, context)
         assert intent.type == IntentType.AMBIGUOUS
 
-    def test_random_text(self, classifier, context):
-        intent = classifier.classify("banana apple orange", context)
-        assert intent.type == IntentType.AMBIGUOUS
+
+# === CACHE TESTS ===
+
+class TestClassificationCache:
+    """Test memoization of classify() results."""
+
+    def test_repeat_returns_cached_intent(self, classifier, context):
+        first = classifier.classify("Hello", context)
+        second = classifier.classify("Hello", context)
+        assert second is first
+
+    def test_context_is_part_of_key(self, classifier, context, context_with_products):
+        without_products = classifier.classify("which one?", context)
+        with_products = classifier.classify("which one?", context_with_products)
+        assert without_products.type == IntentType.AMBIGUOUS
+        assert with_products.type == IntentType.FOLLOWUP
+
+    def test_changed_products_miss_cache(self, classifier):
+        ctx = ConversationContext()
+        ctx.set_multi_products([
+            Product(product_number="DK30A2DHU", content="USB-C dock",
+                    metadata={"category": "docks", "connectors": ["USB-C"]})
+        ])
+        # Different category than the dock in context -> new search
+        assert classifier.classify("USB hub", ctx).type == IntentType.NEW_SEARCH
+
+        ctx.set_multi_products([
+            Product(product_number="HB30C4AB", content="USB-C hub",
+                    metadata={"category": "hubs", "connectors": ["USB-C"]})
+        ])
+        assert classifier.classify("USB hub", ctx).type != IntentType.NEW_SEARCH
+
+
+class TestClassifyBatch:
+    """Test classify_batch() against per-message classify()."""
+
+    def test_matches_classify(self, classifier, context, context_with_products):
+        prompts = ["Hello", "which one?", "USB-C to HDMI cable", "thanks, bye", "which one?"]
+        contexts = [context, context_with_products, context, context, context]
+
+        intents = classifier.classify_batch(prompts, contexts)
+
+        assert [i.type for i in intents] == [
+            classifier.classify(p, c).type for p, c in zip(prompts, contexts)
+        ]
+        assert intents[1].type == IntentType.FOLLOWUP
+        assert intents[4].type == IntentType.AMBIGUOUS
+
+    def test_empty_batch(self, classifier):
+        assert classifier.classify_batch([], []) == []
+
+    def test_length_mismatch(self, classifier, context):
+        with pytest.raises(ValueError):
+            classifier.classify_batch(["Hello", "Hi"], [context])
@@ -5,8 +5,6 @@ Run with: pytest tests/test_logging.py -v
 """
 
 import pytest
-import tempfile
-from pathlib import Path
 from ui.logging import (
     ConversationLogger,
     ConversationLog,
@@ -15,19 +13,19 @@ from ui.logging import (
 
 
 @pytest.fixture
-def temp_log_file():
-    """Create a temporary log file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        temp_path = f.name
-    yield temp_path
-    # Cleanup
-    Path(temp_path).unlink(missing_ok=True)
+def temp_log_file(tmp_path):
+    """Path for a log file in the test's tmp dir (removed by pytest)."""
+    # A real file on purpose: the session index and tallies key off on-disk
+    # byte offsets and file size, and the whole module runs in well under 1s
+    return str(tmp_path / "log.csv")
 
 
 @pytest.fixture
 def logger(temp_log_file):
     """Create ConversationLogger with temp file."""
-    return ConversationLogger(temp_log_file)
+    logger = ConversationLogger(temp_log_file)
+    yield logger
+    logger.close()
 
 
 class TestConversationLog:
@@ -72,6 +70,19 @@ class TestConversationLog:
         assert log_dict['products_shown'] == 5
         assert log_dict['feedback'] == "positive"
 
+    def test_uses_slots(self):
+        """Test that log entries carry no per-instance __dict__."""
+        from datetime import datetime
+
+        log = ConversationLog(
+            session_id="test_123",
+            timestamp=datetime.now(),
+            user_message="Hello",
+            bot_response="Hi there!"
+        )
+
+        assert not hasattr(log, "__dict__")
+
 
 class TestConversationLogger:
     """Test ConversationLogger class."""
@@ -143,6 +154,29 @@ class TestLogging:
         assert conversations[0]['feedback'] == "positive"
 
 
+class TestBulkLogging:
+    """Test logging several conversations at once."""
+
+    def test_log_conversations_bulk(self, logger):
+        """Test bulk logging writes every record in order."""
+        logs = logger.log_conversations_bulk([
+            ("session_1", "msg1", "resp1"),
+            ("session_1", "msg2", "resp2", "NEW_SEARCH", 3, "positive", {"k": "v"}),
+        ])
+
+        assert [log.user_message for log in logs] == ["msg1", "msg2"]
+        assert logs[1].products_shown == 3
+        rows = logger.get_conversations()
+        assert [row['user_message'] for row in rows] == ["msg1", "msg2"]
+        assert rows[1]['intent_type'] == "NEW_SEARCH"
+        assert logs[0].timestamp == logs[1].timestamp
+
+    def test_log_conversations_bulk_empty(self, logger):
+        """Test bulk logging nothing leaves the log empty."""
+        assert logger.log_conversations_bulk([]) == []
+        assert logger.get_conversation_count() == 0
+
+
 class TestRetrieving:
     """Test retrieving conversations."""
     
@@ -174,8 +208,9 @@ class TestRetrieving:
     
     def test_get_conversations_with_limit(self, logger):
         """Test getting conversations with limit."""
-        for i in range(10):
-            logger.log_conversation(f"session_{i}", f"msg_{i}", f"resp_{i}")
+        logger.log_conversations_bulk(
+            (f"session_{i}", f"msg_{i}", f"resp_{i}") for i in range(10)
+        )
         
         recent = logger.get_conversations(limit=3)
         
@@ -191,6 +226,89 @@ class TestRetrieving:
         
         assert len(session_convs) == 2
 
+    def test_concurrent_writers(self, logger, temp_log_file):
+        """Test that threads sharing one logger write whole rows, all indexed."""
+        import csv
+        import threading
+
+        threads_count, per_thread = 8, 200
+        barrier = threading.Barrier(threads_count)
+
+        def worker(n):
+            barrier.wait()
+            for i in range(per_thread):
+                logger.log_conversation(f"s{n}", f"msg {i}", "resp, with \"quotes\"\nand lines")
+
+        logger.get_conversation_count()  # build the index so writes update it
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.close()
+
+        with open(temp_log_file, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == threads_count * per_thread
+        assert all(row['bot_response'] == 'resp, with "quotes"\nand lines' for row in rows)
+        assert logger.get_conversation_count() == threads_count * per_thread
+        assert len(logger.get_conversations(session_id="s3")) == per_thread
+
+
+class TestSessionIndex:
+    """Test session lookups served from the row offset index."""
+
+    def test_index_matches_full_scan(self, logger):
+        """Indexed lookups return the same rows as filtering every row."""
+        logger.log_conversations_bulk(
+            (f"session_{i % 3}", f"msg_{i}", f"line one\nline two, \"quoted\" é {i}")
+            for i in range(12)
+        )
+
+        for session in ("session_0", "session_1", "session_2"):
+            expected = [c for c in logger.get_conversations() if c['session_id'] == session]
+            assert logger.get_conversations(session_id=session) == expected
+            assert logger.get_conversations(session_id=session, limit=2) == expected[-2:]
+
+    def test_index_updated_on_write(self, logger):
+        """Rows logged after the index is built are found."""
+        logger.log_conversation("session_1", "msg1", "resp1")
+        assert len(logger.get_conversations(session_id="session_1")) == 1
+
+        logger.log_conversation("session_1", "msg2", "resp2")
+        logger.log_conversation("session_2", "msg3", "resp3")
+
+        rows = logger.get_conversations(session_id="session_1")
+        assert [r['user_message'] for r in rows] == ["msg1", "msg2"]
+        assert len(logger.get_conversations(session_id="session_2")) == 1
+
+    def test_index_rebuilt_after_external_write(self, logger, temp_log_file):
+        """Rows appended by another logger on the same file are found."""
+        logger.log_conversation("session_1", "msg1", "resp1")
+        logger.get_conversations(session_id="session_1")
+
+        other = ConversationLogger(temp_log_file)
+        other.log_conversation("session_1", "msg2", "resp2")
+        other.close()
+
+        assert len(logger.get_conversations(session_id="session_1")) == 2
+
+    def test_index_reset_by_clear_logs(self, logger):
+        """Clearing the log drops indexed rows."""
+        logger.log_conversation("session_1", "msg1", "resp1")
+        logger.get_conversations(session_id="session_1")
+
+        logger.clear_logs()
+        logger.log_conversation("session_2", "msg2", "resp2")
+
+        assert logger.get_conversations(session_id="session_1") == []
+        assert len(logger.get_conversations(session_id="session_2")) == 1
+
+    def test_unknown_session(self, logger):
+        """Unknown sessions return no rows."""
+        logger.log_conversation("session_1", "msg1", "resp1")
+        assert logger.get_conversations(session_id="missing") == []
+
 
 class TestStatistics:
     """Test statistics methods."""
@@ -217,6 +335,36 @@ class TestStatistics:
         assert stats['negative'] == 1
         assert stats['total'] == 3
     
+    def test_stats_seeded_from_existing_log(self, logger, temp_log_file):
+        """A new logger on an existing log starts from its counts."""
+        logger.log_conversation("s1", "msg1", "resp1", feedback="positive")
+        logger.log_feedback("s1", "negative", "Not what I needed")
+        logger.close()
+
+        reopened = ConversationLogger(temp_log_file)
+        reopened.log_conversation("s2", "msg2", "resp2", feedback="positive")
+
+        assert reopened.get_conversation_count() == 3
+        assert reopened.get_feedback_stats() == {'positive': 2, 'negative': 1, 'total': 3}
+        reopened.close()
+
+    def test_stats_track_writes_and_external_appends(self, logger, temp_log_file):
+        """Counts follow this logger's writes and other writers' appends."""
+        logger.log_conversation("s1", "msg1", "resp1")
+        assert logger.get_conversation_count() == 1
+
+        logger.log_conversation("s1", "msg2", "resp2", feedback="negative")
+        other = ConversationLogger(temp_log_file)
+        other.log_conversation("s2", "msg3", "resp3", feedback="positive")
+        other.close()
+
+        assert logger.get_conversation_count() == 3
+        assert logger.get_feedback_stats() == {'positive': 1, 'negative': 1, 'total': 2}
+
+        logger.clear_logs()
+        assert logger.get_conversation_count() == 0
+        assert logger.get_feedback_stats() == {'positive': 0, 'negative': 0, 'total': 0}
+    
     def test_get_sessions(self, logger):
         """Test getting list of sessions."""
         logger.log_conversation("session_1", "msg1", "resp1")
@@ -263,6 +411,24 @@ class TestUtilities:
         logger.clear_logs()
         
         assert logger.get_conversation_count() == 0
+
+    def test_log_after_clear_logs(self, logger):
+        """Test that logging after a clear writes to the fresh file."""
+        logger.log_conversation("s1", "msg1", "resp1")
+        logger.clear_logs()
+        logger.log_conversation("s2", "msg2", "resp2")
+
+        conversations = logger.get_conversations()
+        assert [c['session_id'] for c in conversations] == ["s2"]
+
+    def test_log_after_close(self, logger):
+        """Test that closing the logger does not stop later writes."""
+        logger.log_conversation("s1", "msg1", "resp1")
+        logger.close()
+        logger.close()
+        logger.log_conversation("s2", "msg2", "resp2")
+
+        assert logger.get_conversation_count() == 2
     
     def test_export_to_dict(self, logger):
         """Test exporting to dictionary."""
@@ -292,8 +458,10 @@ class TestSingletonAccess:
         
         assert logger1 is logger2
     
-    def test_singleton_reset(self, temp_log_file):
+    def test_singleton_reset(self, temp_log_file, tmp_path, monkeypatch):
         """Test resetting singleton."""
+        # The reset logger uses the default relative log path
+        monkeypatch.chdir(tmp_path)
         logger1 = get_conversation_logger(log_file=temp_log_file, reset=True)
         logger1.log_conversation("s1", "msg1", "resp1")
         
@@ -302,5 +470,28 @@ class TestSingletonAccess:
         # Should be a new instance
         assert logger2 is not logger1
 
+    def test_singleton_concurrent_first_use(self, temp_log_file, monkeypatch):
+        """Test that threads racing on first use share one instance."""
+        import threading
+        import ui.logging
+
+        monkeypatch.setattr(ui.logging, "_conversation_logger", None)
+        barrier = threading.Barrier(8)
+        loggers = []
+
+        def worker():
+            barrier.wait()
+            loggers.append(get_conversation_logger(log_file=temp_log_file))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loggers) == 8
+        assert all(logger is loggers[0] for logger in loggers)
+        loggers[0].close()
+
 
 # Run tests with: pytest tests/test_logging.py -v
\ No newline at end of file
@@ -13,16 +13,16 @@ from llm.prompts import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def prompts():
-    """Create SystemPrompts instance."""
-    return SystemPrompts()
+    """Shared SystemPrompts singleton (stateless, safe to reuse)."""
+    return get_system_prompts()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def templates():
-    """Create ResponseTemplates instance."""
-    return ResponseTemplates()
+    """Shared ResponseTemplates singleton (stateless, safe to reuse)."""
+    return get_response_templates()
 
 
 class TestSystemPrompts:
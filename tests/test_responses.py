@@ -4,47 +4,126 @@ Tests for response formatting module.
 Run with: pytest tests/test_responses.py -v
 """
 
+import re
 import pytest
+from types import MappingProxyType
 from ui.responses import (
     ResponseFormatter,
     get_response_formatter
 )
+from llm.response_builder import ResponseBuilder
 from core.context import Product
 
 
-@pytest.fixture
+# Formatters and builders only read their inputs, so one instance of each
+# (and the products below) is shared across the session. Treat them as
+# read-only in tests; product metadata is a read-only mapping to enforce it.
+# A test that needs to edit one should copy it:
+# dataclasses.replace(product, metadata=dict(product.metadata)).
+
+_HDMI_CABLE_META = MappingProxyType({
+    'name': '6ft HDMI Cable',
+    'length': 6.0,
+    'length_unit': 'ft',
+    'features': ('4K', 'HDCP'),
+    'connectors': ('HDMI', 'HDMI')
+})
+
+_USB_C_HDMI_CABLE_META = MappingProxyType({
+    'name': 'USB-C to HDMI Cable',
+    'length': 3.0,
+    'length_unit': 'ft',
+    'features': ('4K',),
+    'connectors': ('USB-C', 'HDMI')
+})
+
+_PCIE_CARD_META = MappingProxyType({
+    'category': 'computer_card',
+    'sub_category': 'Desktop and Server Network Cards',
+    'BUSTYPE': 'PCI Express x1',
+    'CARDPROFILE': 'Low Profile',
+    'NUMBERPORTS': 4,
+    'INTERFACEA': '1 x PCI Express x1',
+    'INTERFACEB': '4 x RJ-45 (Gigabit Ethernet)',
+    'features': ('Gigabit Ethernet',)
+})
+
+_MULTIPORT_ADAPTER_META = MappingProxyType({
+    'category': 'multiport_adapter',
+    'sub_category': 'USB-C Multiport Adapters',
+    'EXTERNALPORTS': '1 x HDMI, 1 x RJ-45, 2 x USB 3.2 Type-A, 1 x MicroSD, 1 x SD / MMC Slot',
+    'POWERDELIVERY': 'Yes',
+    'DOCK4KSUPPORT': 'Yes',
+    'features': ('4K', 'Power Delivery')
+})
+
+_SAMPLE_PRODUCTS = (
+    Product(
+        product_number="CABLE001",
+        content="6ft HDMI Cable with 4K support",
+        metadata=_HDMI_CABLE_META
+    ),
+    Product(
+        product_number="CABLE002",
+        content="USB-C to HDMI Cable",
+        metadata=_USB_C_HDMI_CABLE_META
+    ),
+)
+
+_PCIE_CARD = Product(
+    product_number="ST1000SPEX2",
+    content="4-Port Gigabit Ethernet Network Card",
+    metadata=_PCIE_CARD_META
+)
+
+_MULTIPORT_ADAPTER = Product(
+    product_number="DKT30CHPD3",
+    content="USB-C Multiport Adapter with HDMI, USB 3.0, and Gigabit Ethernet with 100W Power Delivery",
+    metadata=_MULTIPORT_ADAPTER_META
+)
+
+# Tokens expected in formatted responses, matched in one scan per response;
+# comparing the set found shows exactly which tokens are missing
+PRODUCT_RESPONSE_TOKENS = ("HDMI cable", "CABLE001", "CABLE002")
+BLOCKED_REQUEST_TOKENS = ("Not supported", "Option 1", "Option 2")
+NO_RESULTS_TOKENS = ("test query", "Suggestion 1", "Suggestion 2")
+PRODUCT_RESPONSE_RE = re.compile("|".join(map(re.escape, PRODUCT_RESPONSE_TOKENS)))
+BLOCKED_REQUEST_RE = re.compile("|".join(map(re.escape, BLOCKED_REQUEST_TOKENS)))
+NO_RESULTS_RE = re.compile("|".join(map(re.escape, NO_RESULTS_TOKENS)))
+
+
+def _assert_str_longer_than(value, length):
+    """Assert value is a str longer than length, in one assertion."""
+    assert isinstance(value, str) and len(value) > length, (
+        f"expected str longer than {length}, got {type(value).__name__}"
+        f" of length {len(value) if isinstance(value, str) else 'N/A'}"
+    )
+
+
+@pytest.fixture(scope="session")
 def formatter():
-    """Create ResponseFormatter instance."""
+    """Shared ResponseFormatter instance."""
     return ResponseFormatter()
 
 
-@pytest.fixture
-def sample_products():
-    """Create sample products for testing."""
-    return [
-        Product(
-            product_number="CABLE001",
-            content="6ft HDMI Cable with 4K support",
-            metadata={
-                'name': '6ft HDMI Cable',
-                'length': 6.0,
-                'length_unit': 'ft',
-                'features': ['4K', 'HDCP'],
-                'connectors': ['HDMI', 'HDMI']
-            }
-        ),
-        Product(
-            product_number="CABLE002",
-            content="USB-C to HDMI Cable",
-            metadata={
-                'name': 'USB-C to HDMI Cable',
-                'length': 3.0,
-                'length_unit': 'ft',
-                'features': ['4K'],
-                'connectors': ['USB-C', 'HDMI']
-            }
-        ),
-    ]
+@pytest.fixture(scope="session")
+def builder():
+    """Shared ResponseBuilder instance."""
+    return ResponseBuilder()
+
+
+@pytest.fixture(scope="session")
+def make_product():
+    """Factory for one-off products that only need a SKU and metadata."""
+    def _make(sku="SKU", metadata=None, content=""):
+        return Product(sku, content, metadata or {})
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_cable_products():
+    """HDMI and USB-C to HDMI cables with name, length, features and connectors."""
+    return _SAMPLE_PRODUCTS
 
 
 class TestResponseFormatter:
@@ -54,29 +133,20 @@ class TestResponseFormatter:
         """Test creating ResponseFormatter."""
         assert isinstance(formatter, ResponseFormatter)
         assert formatter.prompts is not None
-    
-    def test_format_greeting(self, formatter):
-        """Test formatting greeting."""
-        greeting = formatter.format_greeting()
-        
-        assert isinstance(greeting, str)
-        assert len(greeting) > 10
 
 
 class TestProductFormatting:
     """Test product response formatting."""
     
-    def test_format_product_response_with_products(self, formatter, sample_products):
+    def test_format_product_response_with_products(self, formatter, sample_cable_products):
         """Test formatting response with products."""
         response = formatter.format_product_response(
-            products=sample_products,
+            products=sample_cable_products,
             query="HDMI cable"
         )
         
         assert isinstance(response, str)
-        assert "HDMI cable" in response
-        assert "CABLE001" in response
-        assert "CABLE002" in response
+        assert set(PRODUCT_RESPONSE_RE.findall(response)) == set(PRODUCT_RESPONSE_TOKENS)
     
     def test_format_product_response_no_products(self, formatter):
         """Test formatting response with no products."""
@@ -88,143 +158,80 @@ class TestProductFormatting:
         assert isinstance(response, str)
         assert "test query" in response
     
-    def test_format_product_response_with_context_note(self, formatter, sample_products):
+    def test_format_product_response_with_context_note(self, formatter, sample_cable_products):
         """Test formatting response with context note."""
         response = formatter.format_product_response(
-            products=sample_products,
+            products=sample_cable_products,
             query="test",
             context_note="💡 Tip: This is a tip"
         )
         
         assert "💡 Tip: This is a tip" in response
     
-    def test_format_product_response_with_tier(self, formatter, sample_products):
+    def test_format_product_response_with_tier(self, formatter, sample_cable_products):
         """Test formatting response with search tier."""
         response = formatter.format_product_response(
-            products=sample_products,
+            products=sample_cable_products,
             query="test",
             tier="tier2"
         )
         
         assert "tier2" in response.lower()
     
-    def test_format_single_product(self, formatter, sample_products):
+    def test_format_single_product(self, formatter, sample_cable_products):
         """Test formatting single product."""
-        result = formatter._format_single_product(sample_products[0], 1)
+        result = formatter._format_single_product(sample_cable_products[0], 1)
 
         assert "6ft HDMI Cable" in result
         assert "CABLE001" in result
         assert "6.0ft" in result
         assert "4K" in result
 
-    def test_format_pcie_network_card(self):
+    def test_format_pcie_network_card(self, builder):
         """Test formatting PCIe network card shows card specs, not cable format."""
-        from llm.response_builder import ResponseBuilder
-        builder = ResponseBuilder()
-
-        # Create a PCIe network card product
-        pcie_card = Product(
-            product_number="ST1000SPEX2",
-            content="4-Port Gigabit Ethernet Network Card",
-            metadata={
-                'category': 'computer_card',
-                'sub_category': 'Desktop and Server Network Cards',
-                'BUSTYPE': 'PCI Express x1',
-                'CARDPROFILE': 'Low Profile',
-                'NUMBERPORTS': 4,
-                'INTERFACEA': '1 x PCI Express x1',
-                'INTERFACEB': '4 x RJ-45 (Gigabit Ethernet)',
-                'features': ['Gigabit Ethernet']
-            }
-        )
-
-        result = builder._format_pcie_card_line(pcie_card, 1)
+        result = builder._format_pcie_card_line(_PCIE_CARD, 1)
 
-        # Should show card-specific format
-        assert "ST1000SPEX2" in result
+        # Should show card-specific format, including network speed
+        required = ("ST1000SPEX2", "Network Card", "Low Profile", "Gigabit")
+        missing = [token for token in required if token not in result]
+        assert not missing, f"missing tokens: {missing}"
         assert "PCIe x1" in result or "PCI Express x1" in result  # Accepts both formats
-        assert "Network Card" in result
-        assert "Low Profile" in result
-        assert "Gigabit" in result  # Should show network speed
         # Should NOT show cable-style formatting
         assert "ft" not in result.lower()  # No length
 
-    def test_is_pcie_card_detection(self):
-        """Test PCIe card detection works correctly."""
-        from llm.response_builder import ResponseBuilder
-        builder = ResponseBuilder()
-
-        # Computer card category
-        card1 = Product("CARD1", "", metadata={'category': 'computer_card'})
-        assert builder._is_pcie_card(card1) is True
-
-        # Has PCI in BUSTYPE
-        card2 = Product("CARD2", "", metadata={'BUSTYPE': 'PCI Express x4'})
-        assert builder._is_pcie_card(card2) is True
-
-        # Network card sub_category
-        card3 = Product("CARD3", "", metadata={'sub_category': 'Desktop and Server Network Cards'})
-        assert builder._is_pcie_card(card3) is True
-
+    @pytest.mark.parametrize("sku,metadata,expected", [
+        ("CARD1", {'category': 'computer_card'}, True),
+        ("CARD2", {'BUSTYPE': 'PCI Express x4'}, True),
+        ("CARD3", {'sub_category': 'Desktop and Server Network Cards'}, True),
         # Regular cable - should NOT be detected as card
-        cable = Product("CABLE1", "", metadata={'category': 'cable', 'length_ft': 6})
-        assert builder._is_pcie_card(cable) is False
+        ("CABLE1", {'category': 'cable', 'length_ft': 6}, False),
+    ], ids=["category", "bustype", "network_sub_category", "cable"])
+    def test_is_pcie_card_detection(self, builder, make_product, sku, metadata, expected):
+        """Test PCIe card detection works correctly."""
+        assert builder._is_pcie_card(make_product(sku, metadata)) is expected
 
-    def test_format_multiport_adapter(self):
+    def test_format_multiport_adapter(self, builder):
         """Test formatting multiport adapter shows port config, not cable format."""
-        from llm.response_builder import ResponseBuilder
-        builder = ResponseBuilder()
-
-        # Create a USB-C multiport adapter product with EXTERNALPORTS field
-        adapter = Product(
-            product_number="DKT30CHPD3",
-            content="USB-C Multiport Adapter with HDMI, USB 3.0, and Gigabit Ethernet with 100W Power Delivery",
-            metadata={
-                'category': 'multiport_adapter',
-                'sub_category': 'USB-C Multiport Adapters',
-                'EXTERNALPORTS': '1 x HDMI, 1 x RJ-45, 2 x USB 3.2 Type-A, 1 x MicroSD, 1 x SD / MMC Slot',
-                'POWERDELIVERY': 'Yes',
-                'DOCK4KSUPPORT': 'Yes',
-                'features': ['4K', 'Power Delivery']
-            }
-        )
+        result = builder._format_multiport_adapter_line(_MULTIPORT_ADAPTER, 1)
 
-        result = builder._format_multiport_adapter_line(adapter, 1)
-
-        # Should show adapter-specific format
-        assert "DKT30CHPD3" in result
-        assert "USB-C" in result  # Input type
-        assert "Multiport Adapter" in result
-        assert "HDMI" in result  # Video output from EXTERNALPORTS
-        assert "USB-A" in result  # USB ports from EXTERNALPORTS
-        assert "GbE" in result  # Ethernet from EXTERNALPORTS
-        # Should show Power Delivery
-        assert "PD" in result
-        # Should show 4K
-        assert "4K" in result
+        # Should show adapter-specific format: input type, the HDMI, USB-A
+        # and Ethernet ports from EXTERNALPORTS, Power Delivery and 4K
+        required = ("DKT30CHPD3", "USB-C", "Multiport Adapter", "HDMI", "USB-A", "GbE", "PD", "4K")
+        missing = [token for token in required if token not in result]
+        assert not missing, f"missing tokens: {missing}"
         # Should NOT show cable-style formatting
         assert "ft" not in result.lower()  # No length
 
-    def test_is_multiport_adapter_detection(self):
-        """Test multiport adapter detection works correctly."""
-        from llm.response_builder import ResponseBuilder
-        builder = ResponseBuilder()
-
-        # Multiport adapter category
-        adapter1 = Product("ADAPT1", "", metadata={'category': 'multiport_adapter'})
-        assert builder._is_multiport_adapter(adapter1) is True
-
-        # Has multiport in sub_category
-        adapter2 = Product("ADAPT2", "", metadata={'sub_category': 'USB-C Multiport Adapters'})
-        assert builder._is_multiport_adapter(adapter2) is True
-
-        # Has MULTIPORT in SKU
-        adapter3 = Product("102B-USBC-MULTIPORT", "", metadata={})
-        assert builder._is_multiport_adapter(adapter3) is True
-
+    @pytest.mark.parametrize("sku,metadata,expected", [
+        ("ADAPT1", {'category': 'multiport_adapter'}, True),
+        ("ADAPT2", {'sub_category': 'USB-C Multiport Adapters'}, True),
+        ("102B-USBC-MULTIPORT", {}, True),
         # Regular cable - should NOT be detected as adapter
-        cable = Product("CABLE1", "", metadata={'category': 'cable', 'length_ft': 6})
-        assert builder._is_multiport_adapter(cable) is False
+        ("CABLE1", {'category': 'cable', 'length_ft': 6}, False),
+    ], ids=["category", "sub_category", "sku", "cable"])
+    def test_is_multiport_adapter_detection(self, builder, make_product, sku, metadata, expected):
+        """Test multiport adapter detection works correctly."""
+        assert builder._is_multiport_adapter(make_product(sku, metadata)) is expected
 
 
 class TestConversationFormatting:
@@ -234,67 +241,49 @@ class TestConversationFormatting:
         """Test formatting greeting."""
         greeting = formatter.format_greeting()
         
-        assert isinstance(greeting, str)
-        assert len(greeting) > 0
+        _assert_str_longer_than(greeting, 10)
     
     def test_format_farewell(self, formatter):
         """Test formatting farewell."""
         farewell = formatter.format_farewell()
         
-        assert isinstance(farewell, str)
-        assert len(farewell) > 0
+        _assert_str_longer_than(farewell, 0)
     
     def test_format_ambiguous_query(self, formatter):
         """Test formatting ambiguous query response."""
         response = formatter.format_ambiguous_query()
         
-        assert isinstance(response, str)
-        assert len(response) > 20
+        _assert_str_longer_than(response, 20)
 
 
 class TestBlockedAndErrors:
     """Test blocked request and error formatting."""
     
-    def test_format_blocked_request_basic(self, formatter):
-        """Test formatting blocked request without alternatives."""
-        response = formatter.format_blocked_request("Not supported")
+    @pytest.mark.parametrize("alternatives,expected", [
+        (None, {"Not supported"}),
+        (["Option 1", "Option 2"], set(BLOCKED_REQUEST_TOKENS)),
+    ], ids=["basic", "with_alternatives"])
+    def test_format_blocked_request(self, formatter, alternatives, expected):
+        """Test formatting blocked request with and without alternatives."""
+        response = formatter.format_blocked_request("Not supported", alternatives)
         
-        assert "Not supported" in response
+        assert set(BLOCKED_REQUEST_RE.findall(response)) == expected
     
-    def test_format_blocked_request_with_alternatives(self, formatter):
-        """Test formatting blocked request with alternatives."""
-        response = formatter.format_blocked_request(
-            reason="Not supported",
-            alternatives=["Option 1", "Option 2"]
-        )
-        
-        assert "Not supported" in response
-        assert "Option 1" in response
-        assert "Option 2" in response
-    
-    def test_format_no_results(self, formatter):
-        """Test formatting no results response."""
-        response = formatter.format_no_results("test query")
+    @pytest.mark.parametrize("suggestions,expected", [
+        (None, {"test query"}),
+        (["Suggestion 1", "Suggestion 2"], set(NO_RESULTS_TOKENS)),
+    ], ids=["basic", "with_suggestions"])
+    def test_format_no_results(self, formatter, suggestions, expected):
+        """Test formatting no results response with and without suggestions."""
+        response = formatter.format_no_results("test query", suggestions)
         
-        assert "test query" in response
-    
-    def test_format_no_results_with_suggestions(self, formatter):
-        """Test formatting no results with suggestions."""
-        response = formatter.format_no_results(
-            query="test query",
-            suggestions=["Suggestion 1", "Suggestion 2"]
-        )
-        
-        assert "test query" in response
-        assert "Suggestion 1" in response
-        assert "Suggestion 2" in response
+        assert set(NO_RESULTS_RE.findall(response)) == expected
     
     def test_format_error(self, formatter):
         """Test formatting error response."""
         error = formatter.format_error("search_failed")
         
-        assert isinstance(error, str)
-        assert len(error) > 0
+        _assert_str_longer_than(error, 0)
 
 
 class TestContextNotes:
@@ -365,13 +354,14 @@ class TestTextUtilities:
         
         assert result == text
     
-    def test_truncate_text_long(self, formatter):
-        """Test truncating long text."""
-        text = "This is a very long text that needs to be truncated"
-        result = formatter.truncate_text(text, max_length=20)
+    @pytest.mark.parametrize("max_length", [10, 20, 50, 500, 5000])
+    def test_truncate_text_long(self, formatter, max_length):
+        """Test truncating long (100KB) text to a range of lengths."""
+        text = "This is a very long text that needs to be truncated " * 2000
+        result = formatter.truncate_text(text, max_length=max_length)
         
-        assert len(result) == 20
-        assert result.endswith("...")
+        assert len(result) == max_length
+        assert result == text[:max_length - 3] + "..."
 
 
 class TestSingletonAccess:
@@ -390,5 +380,14 @@ class TestSingletonAccess:
         
         assert formatter1 is formatter2
 
+    def test_singleton_concurrent_callers(self):
+        """Test that concurrent callers all get the same instance."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = list(executor.map(lambda _: get_response_formatter(), range(64)))
+
+        assert all(instance is instances[0] for instance in instances)
+
 
 # Run tests with: pytest tests/test_responses.py -v
\ No newline at end of file
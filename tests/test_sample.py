@@ -5,6 +5,7 @@ Demonstrates how to write tests for the clean architecture.
 Run with: pytest tests/test_sample.py -v
 """
 
+import re
 import pytest
 from core.context import (
     IntentType,
@@ -14,7 +15,18 @@ from core.context import (
     FilterConfig,
 )
 from config.synonyms import expand_synonyms
-from config.patterns import extract_lengths, has_pattern, GREETING_PATTERNS
+from config.patterns import (
+    extract_lengths,
+    has_pattern,
+    GREETING_PATTERNS,
+    GREETING_DETECT,
+    FAREWELL_PATTERNS,
+    FAREWELL_DETECT,
+    LENGTH_PATTERN,
+    LENGTH_NUMBER,
+    LENGTH_UNIT_DETECT,
+    CONNECTOR_DETECT,
+)
 
 
 class TestSynonyms:
@@ -26,23 +38,23 @@ class TestSynonyms:
         assert "displayport" in result
         assert "dp" not in result
     
-    def test_expand_usb_c_variations(self):
+    @pytest.mark.parametrize("text", [
+        "usb c cable", "usbc cable", "type c cable",
+    ], ids=["usb_c", "usbc", "type_c"])
+    def test_expand_usb_c_variations(self, text):
         """Test USB-C variations normalize correctly."""
-        inputs = [
-            "usb c cable",
-            "usbc cable",
-            "type c cable",
-        ]
-        
-        for text in inputs:
-            result = expand_synonyms(text)
-            assert "usb-c" in result
+        assert "usb-c" in expand_synonyms(text)
     
     def test_preserves_4k(self):
         """Test that '4k' is expanded to resolution."""
         result = expand_synonyms("4k monitor cable")
         assert "3840x2160" in result or "4k" in result
 
+    def test_case_variants_expand_alike(self):
+        """Test that expansion (and its cache) ignores input case."""
+        assert expand_synonyms("6ft DP Cable") == expand_synonyms("6ft dp cable")
+        assert expand_synonyms("6ft DP Cable") == "6ft displayport cable"
+
 
 class TestPatterns:
     """Test regex patterns."""
@@ -55,6 +67,18 @@ class TestPatterns:
         assert len(lengths) == 2
         assert (3.0, 'ft') in lengths
         assert (6.0, 'ft') in lengths
+
+    def test_extract_lengths_metric(self):
+        """Test metric units keep the first matching unit spelling."""
+        assert extract_lengths("2m or 3.5 meters") == [(2.0, 'm'), (3.5, 'm')]
+
+    @pytest.mark.parametrize("pattern", [
+        LENGTH_PATTERN, LENGTH_NUMBER, LENGTH_UNIT_DETECT,
+        CONNECTOR_DETECT, GREETING_DETECT, FAREWELL_DETECT,
+    ], ids=["length", "length_number", "length_unit", "connector", "greeting", "farewell"])
+    def test_hot_patterns_are_precompiled(self, pattern):
+        """Test that patterns used per query are compiled once at import."""
+        assert isinstance(pattern, re.Pattern)
     
     def test_greeting_detection(self):
         """Test greeting pattern detection."""
@@ -62,6 +86,15 @@ class TestPatterns:
         assert has_pattern("Hi", GREETING_PATTERNS)
         assert not has_pattern("HDMI cable", GREETING_PATTERNS)
 
+    @pytest.mark.parametrize("text", [
+        "hello there!", "hi", "good morning", "hdmi cable",
+        "thank you", "bye now", "see you", "cheers", "usb-c hub",
+    ])
+    def test_compiled_detectors_match_pattern_lists(self, text):
+        """Test the compiled detectors agree with has_pattern."""
+        assert bool(GREETING_DETECT.search(text)) == has_pattern(text, GREETING_PATTERNS)
+        assert bool(FAREWELL_DETECT.search(text)) == has_pattern(text, FAREWELL_PATTERNS)
+
 
 class TestDataModels:
     """Test data models."""
@@ -153,8 +186,18 @@ class TestProduct:
         assert product.get("missing_key", "default") == "default"
         assert product.get("color") == "black"
 
+    def test_product_is_frozen_and_slotted(self):
+        """Test that products can't be reassigned and carry no __dict__."""
+        import dataclasses
 
-# Fixtures for reusable test data
+        product = Product("SKU1", "content", {"category": "cables"})
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            product.score = 0.5
+        assert not hasattr(product, "__dict__")
+
+
+# Fixtures for reusable test data (sample_products is shared from conftest.py)
 @pytest.fixture
 def sample_context():
     """Create a sample conversation context."""
@@ -164,25 +207,6 @@ def sample_context():
     )
 
 
-@pytest.fixture
-def sample_products():
-    """Create sample products."""
-    return [
-        Product(
-            "CDP2DPMM6B",
-            "USB-C to DisplayPort Cable - 6ft",
-            {"category": "cables", "subcategory": "display cables"},
-            0.95
-        ),
-        Product(
-            "CDP2DPMM1MB",
-            "USB-C to DisplayPort Cable - 3ft",
-            {"category": "cables", "subcategory": "display cables"},
-            0.90
-        ),
-    ]
-
-
 class TestWithFixtures:
     """Test using pytest fixtures."""
     
@@ -2,20 +2,58 @@
 Tests for search strategy module.
 
 Run with: pytest tests/test_search.py -v
+
+Module fixtures are never mutated, so tests need no grouping and the file
+can be spread across cores: pytest tests/test_search.py -n auto --dist=worksteal
 """
 
 import pytest
+from unittest.mock import Mock
 from core.search import SearchStrategy, SearchConfig, SearchError
 from core.context import SearchFilters, SearchResult, Product
 
 
-@pytest.fixture
+def _cable(sku, content, length_ft, score, **metadata):
+    """Product with a length in feet, plus any extra metadata."""
+    return Product(sku, content, {"length": length_ft, "length_unit": "ft", **metadata}, score)
+
+
+# SearchFilters is frozen, so the filters most tests share can be one object
+CABLES_ONLY = SearchFilters(product_category="Cables")
+
+# Sample products for search tests (a tuple, so tests can't mutate it)
+SAMPLE_PRODUCTS = (
+    _cable("SKU1", "6ft USB-C to HDMI Cable", 6.0, 0.95, features=["4K"]),
+    _cable("SKU2", "10ft USB-C to HDMI Cable", 10.0, 0.90, features=["4K"]),
+    _cable("SKU3", "3ft USB-C to HDMI Cable", 3.0, 0.85),
+    Product("SKU4", "USB-C to HDMI Adapter", {"features": ["4K", "HDCP"]}, 0.80),
+    _cable("SKU5", "6ft HDMI Cable", 6.0, 0.75),
+)
+
+
+# The strategies and config are only read by the tests, so each is built
+# once for the module. Tests needing a different config build their
+# own SearchStrategy.
+
+@pytest.fixture(scope="module")
 def strategy():
     """Create a search strategy instance."""
     return SearchStrategy()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def strategy_max3():
+    """Search strategy returning at most 3 results."""
+    return SearchStrategy(SearchConfig(max_results=3))
+
+
+@pytest.fixture(scope="module")
+def strategy_no_dedup():
+    """Search strategy with deduplication disabled."""
+    return SearchStrategy(SearchConfig(enable_deduplication=False))
+
+
+@pytest.fixture(scope="module")
 def custom_config():
     """Create a custom search config."""
     return SearchConfig(
@@ -26,22 +64,10 @@ def custom_config():
     )
 
 
-@pytest.fixture
-def sample_products():
-    """Create sample products for testing."""
-    return [
-        Product("SKU1", "6ft USB-C to HDMI Cable", {"length": 6.0, "length_unit": "ft", "features": ["4K"]}, 0.95),
-        Product("SKU2", "10ft USB-C to HDMI Cable", {"length": 10.0, "length_unit": "ft", "features": ["4K"]}, 0.90),
-        Product("SKU3", "3ft USB-C to HDMI Cable", {"length": 3.0, "length_unit": "ft"}, 0.85),
-        Product("SKU4", "USB-C to HDMI Adapter", {"features": ["4K", "HDCP"]}, 0.80),
-        Product("SKU5", "6ft HDMI Cable", {"length": 6.0, "length_unit": "ft"}, 0.75),
-    ]
-
-
 class TestTier1Search:
     """Test Tier 1 (strict) search behavior."""
     
-    def test_tier1_with_all_filters(self, strategy, sample_products):
+    def test_tier1_with_all_filters(self, strategy):
         """Test that Tier 1 applies all filters."""
         filters = SearchFilters(
             length=6.0,
@@ -55,7 +81,7 @@ class TestTier1Search:
         # Mock search function that returns products for Tier 1
         def mock_search(filter_dict):
             if filter_dict.get('length') == 6.0:
-                return [sample_products[0]]  # 6ft cable
+                return [SAMPLE_PRODUCTS[0]]  # 6ft cable
             return []
         
         result = strategy.search(filters, mock_search)
@@ -70,8 +96,7 @@ class TestTier1Search:
         """Test that Tier 1 includes length filter."""
         filters = SearchFilters(length=6.0, length_unit="ft", product_category="Cables")
         
-        def mock_search(filter_dict):
-            return []
+        mock_search = Mock(return_value=[])
         
         result = strategy.search(filters, mock_search)
         
@@ -79,6 +104,19 @@ class TestTier1Search:
         tier1_filters = strategy._build_tier1_filters(filters)
         assert 'length' in tier1_filters
         assert tier1_filters['length'] == 6.0
+        # ...and that it is the first query actually sent
+        assert mock_search.call_args_list[0].args[0]['length'] == 6.0
+    
+    def test_backend_gets_read_only_filters(self, strategy):
+        """Test that the backend can't edit the filters it is queried with."""
+        filters = SearchFilters(length=6.0, length_unit="ft", product_category="Cables")
+
+        def mutating_search(filter_dict):
+            filter_dict['length'] = 1.0
+            return []
+
+        with pytest.raises(TypeError):
+            strategy.search(filters, mutating_search)
     
     def test_tier1_includes_features(self, strategy):
         """Test that Tier 1 includes feature filters."""
@@ -95,7 +133,7 @@ class TestTier1Search:
 class TestTier2Search:
     """Test Tier 2 (relaxed) search behavior."""
     
-    def test_tier2_when_tier1_fails(self, strategy, sample_products):
+    def test_tier2_when_tier1_fails(self, strategy):
         """Test that Tier 2 is used when Tier 1 returns no results."""
         filters = SearchFilters(
             length=15.0,  # No 15ft cables
@@ -109,7 +147,7 @@ class TestTier2Search:
             if 'length' in filter_dict:
                 return []  # Tier 1 fails
             else:
-                return sample_products[:3]  # Tier 2 succeeds (no length filter)
+                return SAMPLE_PRODUCTS[:3]  # Tier 2 succeeds (no length filter)
         
         result = strategy.search(filters, mock_search)
         
@@ -148,30 +186,22 @@ class TestTier2Search:
 class TestTier2_5Search:
     """Test Tier 2.5 (category relaxation) search behavior."""
 
-    def test_tier2_5_swaps_cable_to_adapter(self, strategy):
-        """Test that Tier 2.5 swaps cables→adapters."""
-        filters = SearchFilters(
-            connector_from="HDMI",
-            connector_to="DisplayPort",
-            product_category="Cables"  # User said "cable"
-        )
-
-        tier2_5_filters = strategy._build_tier2_5_filters(filters)
-        assert tier2_5_filters['category'] == 'Adapters'  # Swapped to adapter
-        assert tier2_5_filters['connector_from'] == 'HDMI'  # Connectors kept
-        assert tier2_5_filters['connector_to'] == 'DisplayPort'
-
-    def test_tier2_5_swaps_adapter_to_cable(self, strategy):
-        """Test that Tier 2.5 swaps adapters→cables."""
+    @pytest.mark.parametrize("connector_from,connector_to,category,expected", [
+        ("HDMI", "DisplayPort", "Cables", "Adapters"),  # User said "cable"
+        ("USB-C", "HDMI", "Adapters", "Cables"),  # User said "adapter"
+    ], ids=["cable_to_adapter", "adapter_to_cable"])
+    def test_tier2_5_swaps_category(self, strategy, connector_from, connector_to, category, expected):
+        """Test that Tier 2.5 swaps cables↔adapters and keeps connectors."""
         filters = SearchFilters(
-            connector_from="USB-C",
-            connector_to="HDMI",
-            product_category="Adapters"  # User said "adapter"
+            connector_from=connector_from,
+            connector_to=connector_to,
+            product_category=category
         )
 
         tier2_5_filters = strategy._build_tier2_5_filters(filters)
-        assert tier2_5_filters['category'] == 'Cables'  # Swapped to cable
-        assert tier2_5_filters['connector_from'] == 'USB-C'  # Connectors kept
+        assert tier2_5_filters['category'] == expected
+        assert tier2_5_filters['connector_from'] == connector_from
+        assert tier2_5_filters['connector_to'] == connector_to
 
 
 class TestTier3Search:
@@ -229,19 +259,38 @@ class TestTier4Search:
         assert tier4_filters['category'] == 'Cables'
 
 
+# Products for deduplication and ranking tests, built once at import
+DUPLICATE_PRODUCTS = (
+    Product("SKU1", "Cable 1", {}, 0.9),
+    Product("SKU2", "Cable 2", {}, 0.8),
+    Product("SKU1", "Cable 1 Duplicate", {}, 0.85),  # Duplicate
+    Product("SKU3", "Cable 3", {}, 0.7),
+)
+
+FIRST_OCCURRENCE_PRODUCTS = (
+    Product("SKU1", "First", {}, 0.9),
+    Product("SKU1", "Second", {}, 0.95),  # Higher score but duplicate
+)
+
+LENGTH_RANKING_PRODUCTS = (
+    _cable("SKU1", "10ft Cable", 10.0, 0.8),
+    _cable("SKU2", "6ft Cable", 6.0, 0.7),
+    _cable("SKU3", "3ft Cable", 3.0, 0.9),
+)
+
+FEATURE_RANKING_PRODUCTS = (
+    Product("SKU1", "Cable 1", {"features": ["4K", "HDCP"]}, 0.8),
+    Product("SKU2", "Cable 2", {"features": ["1080p"]}, 0.9),
+    Product("SKU3", "Cable 3", {"features": []}, 0.95),
+)
+
+
 class TestDeduplication:
     """Test product deduplication."""
     
     def test_removes_duplicates(self, strategy):
         """Test that duplicate products are removed."""
-        products = [
-            Product("SKU1", "Cable 1", {}, 0.9),
-            Product("SKU2", "Cable 2", {}, 0.8),
-            Product("SKU1", "Cable 1 Duplicate", {}, 0.85),  # Duplicate
-            Product("SKU3", "Cable 3", {}, 0.7),
-        ]
-        
-        unique = strategy._deduplicate(products)
+        unique = strategy._deduplicate(list(DUPLICATE_PRODUCTS))
         
         assert len(unique) == 3
         assert unique[0].product_number == "SKU1"
@@ -250,62 +299,51 @@ class TestDeduplication:
     
     def test_keeps_first_occurrence(self, strategy):
         """Test that first occurrence is kept when deduplicating."""
-        products = [
-            Product("SKU1", "First", {}, 0.9),
-            Product("SKU1", "Second", {}, 0.95),  # Higher score but duplicate
-        ]
-        
-        unique = strategy._deduplicate(products)
+        unique = strategy._deduplicate(list(FIRST_OCCURRENCE_PRODUCTS))
         
         assert len(unique) == 1
         assert unique[0].content == "First"
     
-    def test_deduplication_disabled(self, sample_products):
-        """Test search with deduplication disabled."""
-        config = SearchConfig(enable_deduplication=False)
-        strategy = SearchStrategy(config)
+    @pytest.mark.parametrize("sku, base", [
+        ("CDP2HD2MBNL-VAMZ", "CDP2HD2MxNL"),
+        ("CDP2HD2MBNL", "CDP2HD2MxNL"),
+        ("CDP2HD2MWNL", "CDP2HD2MxNL"),
+        ("HDMM2M-VAMZ", "HDMM2M"),
+        ("HDMM2M", "HDMM2M"),
+    ])
+    def test_base_sku_merges_variants(self, strategy, sku, base):
+        """Test that marketplace and color variants share a base SKU."""
+        assert strategy._get_base_sku(sku) == base
 
-        filters = SearchFilters(product_category="Cables")
+    def test_deduplication_disabled(self, strategy_no_dedup):
+        """Test that duplicates are kept with deduplication disabled."""
+        products = list(DUPLICATE_PRODUCTS)
 
-        # Add duplicates - use only products with length (cables, not adapters)
-        # sample_products[3] is an adapter without length, which gets filtered out
-        cables_only = [p for p in sample_products if p.metadata.get('length')]
-        products_with_dupes = cables_only + [cables_only[0]]
+        assert strategy_no_dedup._maybe_deduplicate(products) is products
 
-        def mock_search(filter_dict):
-            return products_with_dupes
+    def test_deduplication_enabled(self, strategy):
+        """Test that the config flag routes to _deduplicate when enabled."""
+        unique = strategy._maybe_deduplicate(list(DUPLICATE_PRODUCTS))
 
-        result = strategy.search(filters, mock_search)
-
-        # Should have duplicates (5 cables + 1 duplicate = 5 after filtering, but no dedup)
-        # With deduplication disabled, duplicates are kept
-        assert len(result.products) == len(products_with_dupes)
+        assert [p.product_number for p in unique] == ["SKU1", "SKU2", "SKU3"]
 
 
 class TestRanking:
     """Test product ranking and limiting."""
     
-    def test_limits_results(self, sample_products):
+    def test_limits_results(self, strategy_max3):
         """Test that results are limited to max_results."""
-        config = SearchConfig(max_results=3)
-        strategy = SearchStrategy(config)
-        
-        filters = SearchFilters(product_category="Cables")
+        filters = CABLES_ONLY
         
-        def mock_search(filter_dict):
-            return sample_products  # 5 products
+        mock_search = Mock(return_value=SAMPLE_PRODUCTS)  # 5 products
         
-        result = strategy.search(filters, mock_search)
+        result = strategy_max3.search(filters, mock_search)
         
         assert len(result.products) == 3
     
     def test_ranks_by_length_match(self, strategy):
         """Test that exact length matches rank higher."""
-        products = [
-            Product("SKU1", "10ft Cable", {"length": 10.0, "length_unit": "ft"}, 0.8),
-            Product("SKU2", "6ft Cable", {"length": 6.0, "length_unit": "ft"}, 0.7),
-            Product("SKU3", "3ft Cable", {"length": 3.0, "length_unit": "ft"}, 0.9),
-        ]
+        products = LENGTH_RANKING_PRODUCTS
         
         filters = SearchFilters(length=6.0, length_unit="ft")
         
@@ -320,11 +358,7 @@ class TestRanking:
     
     def test_ranks_by_feature_match(self, strategy):
         """Test that feature matches rank higher."""
-        products = [
-            Product("SKU1", "Cable 1", {"features": ["4K", "HDCP"]}, 0.8),
-            Product("SKU2", "Cable 2", {"features": ["1080p"]}, 0.9),
-            Product("SKU3", "Cable 3", {"features": []}, 0.95),
-        ]
+        products = FEATURE_RANKING_PRODUCTS
         
         filters = SearchFilters(features=["4K", "HDCP"])
         
@@ -340,23 +374,15 @@ class TestRanking:
 class TestLengthNormalization:
     """Test length unit normalization."""
     
-    def test_normalize_meters(self, strategy):
-        """Test meter normalization."""
-        assert strategy._normalize_length(2.0, 'm') == 2.0
-    
-    def test_normalize_feet(self, strategy):
-        """Test feet to meter conversion."""
-        result = strategy._normalize_length(6.0, 'ft')
-        assert abs(result - 1.8288) < 0.001  # 6 ft ≈ 1.83 m
-    
-    def test_normalize_inches(self, strategy):
-        """Test inches to meter conversion."""
-        result = strategy._normalize_length(12.0, 'in')
-        assert abs(result - 0.3048) < 0.001  # 12 in ≈ 0.30 m
-    
-    def test_normalize_centimeters(self, strategy):
-        """Test centimeter to meter conversion."""
-        assert strategy._normalize_length(100.0, 'cm') == 1.0
+    @pytest.mark.parametrize("value,unit,expected", [
+        (2.0, 'm', 2.0),
+        (6.0, 'ft', 1.8288),  # 6 ft ≈ 1.83 m
+        (12.0, 'in', 0.3048),  # 12 in ≈ 0.30 m
+        (100.0, 'cm', 1.0),
+    ], ids=["meters", "feet", "inches", "centimeters"])
+    def test_normalize_length(self, strategy, value, unit, expected):
+        """Test unit to meter conversion."""
+        assert strategy._normalize_length(value, unit) == pytest.approx(expected, abs=1e-3)
 
 
 class TestSearchConfig:
@@ -385,6 +411,13 @@ class TestSearchConfig:
         assert config.max_results == 10
         assert config.enable_deduplication is True
 
+    def test_config_is_frozen(self):
+        """Test that a config can't change under a strategy sharing it."""
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            SearchConfig().max_results = 3
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -393,8 +426,7 @@ class TestEdgeCases:
         """Test search with empty filters."""
         filters = SearchFilters()
 
-        def mock_search(filter_dict):
-            return []
+        mock_search = Mock(return_value=[])
 
         result = strategy.search(filters, mock_search)
 
@@ -404,10 +436,9 @@ class TestEdgeCases:
 
     def test_no_results_any_tier(self, strategy):
         """Test search when all tiers return no results."""
-        filters = SearchFilters(product_category="Cables")
+        filters = CABLES_ONLY
 
-        def mock_search(filter_dict):
-            return []  # Always empty
+        mock_search = Mock(return_value=[])  # Always empty
 
         result = strategy.search(filters, mock_search)
 
@@ -415,15 +446,14 @@ class TestEdgeCases:
         assert result.tier == "tier4"
         assert len(result.products) == 0
     
-    def test_only_connectors(self, strategy, sample_products):
+    def test_only_connectors(self, strategy):
         """Test search with only connector filters."""
         filters = SearchFilters(
             connector_from="USB-C",
             connector_to="HDMI"
         )
         
-        def mock_search(filter_dict):
-            return sample_products[:2]
+        mock_search = Mock(return_value=SAMPLE_PRODUCTS[:2])
         
         result = strategy.search(filters, mock_search)
         
@@ -434,21 +464,10 @@ class TestEdgeCases:
 class TestIntegration:
     """Test integration scenarios."""
     
-    def test_full_search_flow(self, sample_products):
+    def test_full_search_flow(self, strategy):
         """Test complete search flow with all tiers."""
-        strategy = SearchStrategy()
-        
         # Simulate Tier 1 failing, Tier 2 succeeding
-        call_count = [0]
-        
-        def mock_search(filter_dict):
-            call_count[0] += 1
-            if 'length' in filter_dict:
-                return []  # Tier 1 fails
-            elif 'connector_from' in filter_dict:
-                return sample_products[:3]  # Tier 2 succeeds
-            else:
-                return sample_products  # Tier 3
+        mock_search = Mock(side_effect=[[], SAMPLE_PRODUCTS[:3]])
         
         filters = SearchFilters(
             length=20.0,  # No 20ft cables
@@ -464,12 +483,14 @@ class TestIntegration:
         # Note: SKU3 (3ft) is filtered out by _filter_unreasonable_lengths
         # because 3ft is below 25% of requested 20ft (min threshold = 5ft)
         assert len(result.products) == 2  # SKU1 (6ft) and SKU2 (10ft)
-        assert call_count[0] == 2  # Called Tier 1, then Tier 2
+        assert mock_search.call_count == 2  # Called Tier 1, then Tier 2
+        tier1_query, tier2_query = (c.args[0] for c in mock_search.call_args_list)
+        assert 'length' in tier1_query
+        assert 'length' not in tier2_query
+        assert tier2_query['connector_from'] == "USB-C"
     
-    def test_exact_match_tier1(self, sample_products):
+    def test_exact_match_tier1(self, strategy):
         """Test when Tier 1 finds exact match."""
-        strategy = SearchStrategy()
-        
         filters = SearchFilters(
             length=6.0,
             length_unit="ft",
@@ -478,8 +499,7 @@ class TestIntegration:
             product_category="Cables"
         )
         
-        def mock_search(filter_dict):
-            return [sample_products[0]]  # Perfect match
+        mock_search = Mock(return_value=[SAMPLE_PRODUCTS[0]])  # Perfect match
         
         result = strategy.search(filters, mock_search)
         
@@ -488,93 +508,48 @@ class TestIntegration:
         assert result.products[0].product_number == "SKU1"
 
 
-class TestProductValidation:
-    """Test that invalid products (couplers, gender changers) are filtered out."""
-
-    def test_filters_couplers_from_cable_search(self):
-        """Test that couplers (no length) are filtered out from cable searches."""
-        strategy = SearchStrategy()
-
-        # Mix of real cables and a coupler
-        products = [
-            Product("SKU1", "6ft HDMI Cable", {"length": 6.0, "length_unit": "ft"}, 0.95),
-            Product("GCHDMIFF", "HDMI Coupler", {}, 0.90),  # Coupler - no length
-            Product("SKU3", "3ft HDMI Cable", {"length": 3.0, "length_unit": "ft"}, 0.85),
-        ]
-
-        filters = SearchFilters(product_category="Cables")
-
-        def mock_search(filter_dict):
-            return products
-
-        result = strategy.search(filters, mock_search)
-
-        # Should only have the 2 real cables, not the coupler
-        assert len(result.products) == 2
-        skus = [p.product_number for p in result.products]
-        assert "SKU1" in skus
-        assert "SKU3" in skus
-        assert "GCHDMIFF" not in skus
-
-    def test_filters_gender_changers_by_sku_prefix(self):
-        """Test that products with GC prefix are filtered out."""
-        strategy = SearchStrategy()
-
-        products = [
-            Product("SKU1", "6ft Cable", {"length": 6.0, "length_unit": "ft"}, 0.95),
-            Product("GCHDMI", "HDMI Gender Changer", {"length": 0.5}, 0.90),  # GC prefix
-        ]
+# (products, category, SKUs kept) for product validation, built once at import
+VALIDATION_CASES = [
+    # Coupler - no length
+    ((
+        _cable("SKU1", "6ft HDMI Cable", 6.0, 0.95),
+        Product("GCHDMIFF", "HDMI Coupler", {}, 0.90),
+        _cable("SKU3", "3ft HDMI Cable", 3.0, 0.85),
+    ), "Cables", {"SKU1", "SKU3"}),
+    # GC (gender changer) SKU prefix
+    ((
+        _cable("SKU1", "6ft Cable", 6.0, 0.95),
+        Product("GCHDMI", "HDMI Gender Changer", {"length": 0.5}, 0.90),
+    ), "Cables", {"SKU1"}),
+    # 'coupler' in the product name
+    ((
+        _cable("SKU1", "6ft Cable", 6.0, 0.95, name="6ft HDMI Cable"),
+        _cable("SKU2", "HDMI F/F", 0.1, 0.90, name="HDMI Coupler F/F"),
+    ), "Cables", {"SKU1"}),
+    # Adapter without length - filtering only applies to cable categories
+    ((
+        Product("ADAPT1", "USB-C to HDMI Adapter", {"features": ["4K"]}, 0.95),
+    ), "Adapters", {"ADAPT1"}),
+]
 
-        filters = SearchFilters(product_category="Cables")
 
-        def mock_search(filter_dict):
-            return products
-
-        result = strategy.search(filters, mock_search)
-
-        # GC prefix product should be filtered out
-        assert len(result.products) == 1
-        assert result.products[0].product_number == "SKU1"
-
-    def test_filters_couplers_by_name_keyword(self):
-        """Test that products with 'coupler' in name are filtered out."""
-        strategy = SearchStrategy()
-
-        products = [
-            Product("SKU1", "6ft Cable", {"length": 6.0, "length_unit": "ft", "name": "6ft HDMI Cable"}, 0.95),
-            Product("SKU2", "HDMI F/F", {"length": 0.1, "length_unit": "ft", "name": "HDMI Coupler F/F"}, 0.90),
-        ]
-
-        filters = SearchFilters(product_category="Cables")
-
-        def mock_search(filter_dict):
-            return products
-
-        result = strategy.search(filters, mock_search)
-
-        # Coupler keyword product should be filtered out
-        assert len(result.products) == 1
-        assert result.products[0].product_number == "SKU1"
-
-    def test_no_filtering_for_non_cable_categories(self):
-        """Test that filtering only applies to cable categories."""
-        strategy = SearchStrategy()
+class TestProductValidation:
+    """Test that invalid products (couplers, gender changers) are filtered out."""
 
-        # Adapter without length - should NOT be filtered for "Adapters" category
-        products = [
-            Product("ADAPT1", "USB-C to HDMI Adapter", {"features": ["4K"]}, 0.95),
-        ]
+    @pytest.mark.parametrize("products,category,kept", VALIDATION_CASES, ids=[
+        "coupler_without_length", "gender_changer_sku_prefix",
+        "coupler_name_keyword", "adapter_kept",
+    ])
+    def test_product_validation(self, strategy, products, category, kept):
+        """Test which products survive validation for the searched category."""
+        filters = SearchFilters(product_category=category)
 
-        filters = SearchFilters(product_category="Adapters")
-
-        def mock_search(filter_dict):
-            return products
+        mock_search = Mock(return_value=list(products))
 
         result = strategy.search(filters, mock_search)
 
-        # Adapter should be kept (not filtered)
-        assert len(result.products) == 1
-        assert result.products[0].product_number == "ADAPT1"
+        # Which products survive, not their ranking (covered by TestRanking)
+        assert {p.product_number for p in result.products} == kept
 
 
 # Run tests with: pytest tests/test_search.py -v
\ No newline at end of file
@@ -16,10 +16,10 @@ def state():
     return SessionState()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_products():
-    """Create sample products for testing."""
-    return [
+    """Create sample products for testing (a tuple, so tests can't mutate it)."""
+    return (
         Product(
             product_number="CABLE001",
             content="6ft HDMI Cable",
@@ -30,7 +30,7 @@ def sample_products():
             content="USB-C Cable",
             metadata={'name': 'USB-C Cable'}
         ),
-    ]
+    )
 
 
 class TestSessionState:
@@ -4,28 +4,33 @@ UI layer for ST-Bot.
 Provides response formatting, state management, and logging.
 """
 
-from ui.responses import (
-    ResponseFormatter,
-    get_response_formatter
-)
-from ui.state import (
-    SessionState,
-    Message,
-    get_session_state,
-    save_guidance_to_session,
-    load_guidance_from_session,
-    save_pending_question_to_session,
-    load_pending_question_from_session,
-)
-
-__all__ = [
-    'ResponseFormatter',
-    'get_response_formatter',
-    'SessionState',
-    'Message',
-    'get_session_state',
-    'save_guidance_to_session',
-    'load_guidance_from_session',
-    'save_pending_question_to_session',
-    'load_pending_question_from_session',
-]
\ No newline at end of file
+from importlib import import_module
+
+# Exports are resolved on first access (PEP 562), so importing a single
+# submodule such as ui.logging does not also load ui.responses and, through
+# it, the whole core package.
+_EXPORTS = {
+    'ResponseFormatter': 'ui.responses',
+    'get_response_formatter': 'ui.responses',
+    'SessionState': 'ui.state',
+    'Message': 'ui.state',
+    'get_session_state': 'ui.state',
+    'save_guidance_to_session': 'ui.state',
+    'load_guidance_from_session': 'ui.state',
+    'save_pending_question_to_session': 'ui.state',
+    'load_pending_question_from_session': 'ui.state',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
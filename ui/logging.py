@@ -5,16 +5,21 @@ Logs conversations to CSV for analysis and improvement.
 """
 
 import csv
-from typing import List, Dict, Optional, Any
+import io
+import threading
+from collections import Counter
+from typing import List, Dict, Optional, Any, Iterable, Sequence
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationLog:
     """
     Represents a single conversation log entry.
+
+    Slotted: one is built per logged turn, so no per-instance __dict__.
     
     Attributes:
         session_id: Unique session identifier
@@ -45,6 +50,8 @@ class ConversationLog:
             'intent_type': self.intent_type or '',
             'products_shown': self.products_shown,
             'feedback': self.feedback or '',
+            # Stored as the dict's repr: a C-level call, with no JSON encoder
+            # on the write path and no change to existing log rows
             'metadata': str(self.metadata) if self.metadata else ''
         }
 
@@ -88,6 +95,21 @@ class ConversationLogger:
             log_file: Path to CSV log file
         """
         self.log_file = Path(log_file)
+        # Append handle, opened on first write and kept open so each logged
+        # turn costs a write + flush, not an open/close
+        self._append_file = None
+        # Guards the append handle, the index and the tallies: the singleton
+        # is shared by every session's thread
+        self._lock = threading.RLock()
+        # session_id -> byte offsets of that session's rows, plus the row
+        # count and feedback tallies, built on the first lookup and kept up
+        # to date by every write. _indexed_size is the log size they cover;
+        # any other size means the file changed underneath us and they are
+        # rebuilt.
+        self._session_index: Optional[Dict[str, List[int]]] = None
+        self._count = 0
+        self._feedback_counts: Counter = Counter()
+        self._indexed_size = 0
         self._ensure_log_file()
     
     def _ensure_log_file(self):
@@ -136,9 +158,145 @@ class ConversationLogger:
             ...     feedback="positive"
             ... )
         """
-        log_entry = ConversationLog(
+        return self.log_conversations_bulk([(
+            session_id, user_message, bot_response,
+            intent_type, products_shown, feedback, metadata
+        )])[0]
+
+    def log_conversations_bulk(self, records: Iterable[Sequence[Any]]) -> List[ConversationLog]:
+        """
+        Log several conversations with a single open of the CSV file.
+
+        Args:
+            records: Tuples of log_conversation() arguments in order:
+                (session_id, user_message, bot_response[, intent_type,
+                products_shown, feedback, metadata])
+
+        Returns:
+            ConversationLog objects, in input order
+
+        Example:
+            >>> logger.log_conversations_bulk([
+            ...     ("session_123", "Hi", "Hello!", "GREETING"),
+            ...     ("session_123", "Show me HDMI cables", "Here are 5...", "NEW_SEARCH", 5),
+            ... ])
+        """
+        # One clock read per call: the rows are logged together
+        now = datetime.now()
+        log_entries = [self._new_entry(now, *record) for record in records]
+
+        # Rows are rendered one at a time, outside the lock, so their byte
+        # lengths are known
+        row_buffer = io.StringIO()
+        row_writer = csv.DictWriter(row_buffer, fieldnames=self.CSV_HEADERS)
+        rows = []
+        for entry in log_entries:
+            row_buffer.seek(0)
+            row_buffer.truncate()
+            row_writer.writerow(entry.to_dict())
+            rows.append(row_buffer.getvalue())
+
+        with self._lock:
+            # Write to CSV
+            if self._append_file is None:
+                self._append_file = open(self.log_file, 'a', newline='', encoding='utf-8')
+            self._append_file.write(''.join(rows))
+            # Flush so readers (get_conversations, spreadsheet tools) see every row
+            self._append_file.flush()
+
+            if self._session_index is not None:
+                offset = self._indexed_size
+                for entry, row in zip(log_entries, rows):
+                    self._session_index.setdefault(str(entry.session_id), []).append(offset)
+                    if entry.feedback:
+                        self._feedback_counts[entry.feedback] += 1
+                    offset += len(row.encode('utf-8'))
+                self._count += len(log_entries)
+                self._indexed_size = offset
+
+        return log_entries
+
+    def close(self):
+        """
+        Close the append handle.
+
+        Safe to call more than once; the next write reopens the file.
+        """
+        with self._lock:
+            if self._append_file is not None:
+                self._append_file.close()
+                self._append_file = None
+
+    def _ensure_index(self):
+        """Build the session index and tallies, or rebuild them if the log size changed.
+
+        Callers hold self._lock.
+        """
+        size = self.log_file.stat().st_size
+        if self._session_index is not None and size == self._indexed_size:
+            return
+
+        index: Dict[str, List[int]] = {}
+        feedback_counts: Counter = Counter()
+        count = 0
+        consumed = 0
+
+        with open(self.log_file, 'r', newline='', encoding='utf-8') as f:
+            def tracked_lines():
+                # csv.reader pulls exactly the lines of one record (several
+                # for quoted multi-line fields), so the bytes consumed before
+                # each next() are that record's offset
+                nonlocal consumed
+                for line in f:
+                    consumed += len(line.encode('utf-8'))
+                    yield line
+
+            reader = csv.reader(tracked_lines())
+            header = next(reader, None)
+            if header and 'session_id' in header:
+                column = header.index('session_id')
+                feedback_column = header.index('feedback') if 'feedback' in header else len(header)
+                offset = consumed
+                for row in reader:
+                    # Skip blank rows, as csv.DictReader does
+                    if row:
+                        session = row[column] if column < len(row) else None
+                        index.setdefault(session, []).append(offset)
+                        if feedback_column < len(row) and row[feedback_column]:
+                            feedback_counts[row[feedback_column]] += 1
+                        count += 1
+                    offset = consumed
+
+        self._session_index = index
+        self._feedback_counts = feedback_counts
+        self._count = count
+        self._indexed_size = consumed
+
+    def _read_rows_at(self, offsets: List[int]) -> List[Dict[str, Any]]:
+        """Read the CSV rows starting at the given byte offsets."""
+        rows = []
+        with open(self.log_file, 'r', newline='', encoding='utf-8') as f:
+            fieldnames = next(csv.reader(f))
+            for offset in offsets:
+                f.seek(offset)
+                rows.append(next(csv.DictReader(f, fieldnames=fieldnames)))
+        return rows
+
+    @staticmethod
+    def _new_entry(
+        timestamp: datetime,
+        session_id: str,
+        user_message: str,
+        bot_response: str,
+        intent_type: Optional[str] = None,
+        products_shown: int = 0,
+        feedback: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> ConversationLog:
+        """Build a ConversationLog from a timestamp and log_conversation() arguments."""
+        return ConversationLog(
             session_id=session_id,
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             user_message=user_message,
             bot_response=bot_response,
             intent_type=intent_type,
@@ -146,13 +304,6 @@ class ConversationLogger:
             feedback=feedback,
             metadata=metadata or {}
         )
-        
-        # Write to CSV
-        with open(self.log_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
-            writer.writerow(log_entry.to_dict())
-        
-        return log_entry
     
     def log_feedback(
         self,
@@ -210,16 +361,22 @@ class ConversationLogger:
         """
         if not self.log_file.exists():
             return []
-        
+
+        # Session lookups go through the index: only that session's rows
+        # are read, not the whole log
+        if session_id:
+            with self._lock:
+                self._ensure_index()
+                offsets = self._session_index.get(session_id, [])
+                if limit:
+                    offsets = offsets[-limit:]
+                return self._read_rows_at(offsets)
+
         conversations = []
         
         with open(self.log_file, 'r', newline='', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
-                # Filter by session if specified
-                if session_id and row['session_id'] != session_id:
-                    continue
-                
                 conversations.append(row)
         
         # Apply limit
@@ -255,17 +412,18 @@ class ConversationLogger:
             >>> print(stats)
             {'positive': 45, 'negative': 5, 'total': 50}
         """
-        conversations = self.get_conversations()
-        
-        positive = sum(1 for c in conversations if c.get('feedback') == 'positive')
-        negative = sum(1 for c in conversations if c.get('feedback') == 'negative')
-        total = len([c for c in conversations if c.get('feedback')])
-        
-        return {
-            'positive': positive,
-            'negative': negative,
-            'total': total
-        }
+        if not self.log_file.exists():
+            return {'positive': 0, 'negative': 0, 'total': 0}
+
+        # Tallies are maintained on write, not recounted from the log
+        with self._lock:
+            self._ensure_index()
+
+            return {
+                'positive': self._feedback_counts['positive'],
+                'negative': self._feedback_counts['negative'],
+                'total': sum(self._feedback_counts.values())
+            }
     
     def get_conversation_count(self) -> int:
         """
@@ -277,7 +435,12 @@ class ConversationLogger:
         Example:
             >>> count = logger.get_conversation_count()
         """
-        return len(self.get_conversations())
+        if not self.log_file.exists():
+            return 0
+
+        with self._lock:
+            self._ensure_index()
+            return self._count
     
     def clear_logs(self):
         """
@@ -288,9 +451,12 @@ class ConversationLogger:
         Example:
             >>> logger.clear_logs()
         """
-        if self.log_file.exists():
-            self.log_file.unlink()
-        self._ensure_log_file()
+        with self._lock:
+            self.close()
+            if self.log_file.exists():
+                self.log_file.unlink()
+            self._session_index = None
+            self._ensure_log_file()
     
     def export_to_dict(self) -> List[Dict[str, Any]]:
         """
@@ -365,6 +531,8 @@ class ConversationLogger:
 
 # Singleton for easy access
 _conversation_logger: Optional[ConversationLogger] = None
+# Guards creation and reset only; returning the existing logger takes no lock
+_conversation_logger_lock = threading.Lock()
 
 
 def get_conversation_logger(
@@ -390,8 +558,16 @@ def get_conversation_logger(
         ... )
     """
     global _conversation_logger
-    
-    if reset or _conversation_logger is None:
-        _conversation_logger = ConversationLogger(log_file)
-    
-    return _conversation_logger
\ No newline at end of file
+
+    logger = _conversation_logger
+    if logger is not None and not reset:
+        return logger
+
+    with _conversation_logger_lock:
+        # Another thread may have created the logger while we waited
+        if reset or _conversation_logger is None:
+            if _conversation_logger is not None:
+                _conversation_logger.close()
+            _conversation_logger = ConversationLogger(log_file)
+
+        return _conversation_logger
\ No newline at end of file